@@ -0,0 +1,162 @@
+#!/opt/conda/bin/python3
+
+# Read throughput of the Distributed RDataFrame Snapshot over a grid of
+# storage tier, data format, number of columns read, Dask workers and
+# partitions (the scan tmp-test.py did by hand on one file and one tier).
+#
+# For every point of the grid a LocalCluster with the given number of
+# single threaded workers is started, the first files of the chain are read
+# from the tier (<tier>/store/mc/... for TTree, /store/mcrnt/... for RNTuple,
+# as laid out by stage_chain.py and convert_chain_rnt.py) and the first N
+# columns are written out with a Snapshot. Measured:
+#   events/s        processed entries / event loop wall time
+#   MB/s            bytes read by the worker processes (rchar of /proc/self/io,
+#                   local and network reads alike) / event loop wall time
+#   cpu_efficiency  CPU time of the workers / (wall time * workers)
+#
+# The workers of each point are started and ROOT is loaded in them before the
+# measurement, so that the window covers the event loop and not the start-up.
+#
+# One row per point in the CSV, with the columns of distrdf_runtime_*.csv
+# first (task_id is the index of the point, the runtimes are those of the
+# whole run) followed by the parameters and the measurements.
+#
+# usage: python3 benchmark_storage.py [--tiers scratch shared-scratch xrootd] [--formats TTree RNTuple]
+#                                     [--branches 1 10 100] [--workers 1 4] [--partitions 3 12] [--max-files 1] [--output benchmark_storage.csv]
+
+import argparse
+import csv
+import os
+import shutil
+import socket
+import tempfile
+import time
+
+import chain_index
+from stage_chain import tiers
+
+xrootd_redirector = "root://t2-xrdcms.lnl.infn.it:7070/"
+runtime_columns = ["task_id", "hostname", "processed_entries", "runtime_mapper", "runtime_setup", "runtime_rdf_creation", "runtime_event_loop"]
+columns = runtime_columns + ["tier", "format", "branches", "workers", "partitions", "files", "read_bytes", "events_per_second", "mb_per_second", "cpu_efficiency"]
+
+def tier_files(files, tier, fmt):
+    names = [chain_index.lfn(path) for path in files]
+    if fmt == "RNTuple":
+        names = [name.replace("/store/mc/", "/store/mcrnt/", 1) for name in names]
+    if tier == "xrootd":
+        return [xrootd_redirector + name for name in names]
+    return ["file://" + tiers[tier] + name for name in names]
+
+def first_columns(path, n, treename="Events"):
+    # column names as RDataFrame sees them, the same call for TTree and RNTuple
+    import ROOT
+    names = [str(name) for name in ROOT.RDataFrame(treename, path).GetColumnNames()]
+    return [name for name in names if "." not in name][:n]
+
+def _worker_usage():
+    # CPU seconds and bytes read so far by the worker process
+    usage = os.times()
+    read = 0
+    with open("/proc/self/io") as f:
+        for line in f:
+            if line.startswith("rchar:"):
+                read = int(line.split()[1])
+    return usage.user + usage.system, read
+
+def _warm_up():
+    # ROOT import, start of cling and the DistRDF modules, paid once per worker process
+    import ROOT
+    ROOT.RDF.Experimental.Distributed
+    ROOT.gInterpreter.ProcessLine("1;")
+
+def _usage(client):
+    values = client.run(_worker_usage).values()
+    return sum(v[0] for v in values), sum(v[1] for v in values)
+
+def run_point(files, branches, workers, partitions, outdir, treename="Events"):
+    import ROOT
+    from dask.distributed import LocalCluster
+
+    start = time.time()
+    cluster = LocalCluster(n_workers=workers, threads_per_worker=1, processes=True)
+    client = cluster.get_client()
+    setup = time.time() - start
+
+    start = time.time()
+    df = ROOT.RDF.Experimental.Distributed.Dask.RDataFrame(treename, files, npartitions=partitions, executor=client)
+    opts = ROOT.RDF.RSnapshotOptions()
+    opts.fLazy = True
+    df.Snapshot(treename, os.path.join(outdir, "benchmark.root"), branches, opts)
+    count = df.Count()
+    creation = time.time() - start
+
+    # the workers are new processes: start ROOT in them before the baseline, out of the measured window
+    client.run(_warm_up)
+    cpu_before, read_before = _usage(client)
+    start = time.time()
+    # Snapshot and Count are in the same graph, GetValue runs both (RunGraphs runs the graphs in other
+    # threads and does not report their errors, the graph would then run out of the window at GetValue)
+    entries = count.GetValue()
+    loop = time.time() - start
+    cpu_after, read_after = _usage(client)
+
+    client.close()
+    cluster.close()
+    return {"processed_entries": entries, "runtime_setup": setup, "runtime_rdf_creation": creation, "runtime_event_loop": loop,
+            "runtime_mapper": setup + creation + loop, "read_bytes": read_after - read_before, "cpu_seconds": cpu_after - cpu_before}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distributed Snapshot throughput per storage tier and format")
+    parser.add_argument("--chain", default="chain.txt")
+    parser.add_argument("--max-files", type=int, default=1)
+    parser.add_argument("--tiers", nargs="+", default=sorted(tiers) + ["xrootd"], choices=sorted(tiers) + ["xrootd"])
+    parser.add_argument("--formats", nargs="+", default=["TTree", "RNTuple"], choices=["TTree", "RNTuple"])
+    parser.add_argument("--branches", nargs="+", type=int, default=[1, 10, 100])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4])
+    parser.add_argument("--partitions", nargs="+", type=int, default=[3, 12])
+    parser.add_argument("--output", default="benchmark_storage.csv")
+    args = parser.parse_args()
+
+    with open(args.chain) as f:
+        chain = [line.strip() for line in f if line.strip()][:args.max_files]
+
+    new_file = not os.path.exists(args.output)
+    out = open(args.output, "a", newline="")
+    writer = csv.DictWriter(out, fieldnames=columns)
+    if new_file:
+        writer.writeheader()
+
+    task_id = 0
+    for tier in args.tiers:
+        for fmt in args.formats:
+            files = tier_files(chain, tier, fmt)
+            try:
+                names = first_columns(files[0], max(args.branches))
+            except Exception as e:
+                print("{} {}: cannot read {}: {}".format(tier, fmt, files[0], e))
+                continue
+            for nbranches in args.branches:
+                for workers in args.workers:
+                    for partitions in args.partitions:
+                        outdir = tempfile.mkdtemp(prefix="benchmark_storage_")
+                        try:
+                            result = run_point(files, names[:nbranches], workers, partitions, outdir)
+                        except Exception as e:
+                            print("{} {} {} branches, {} workers, {} partitions: failed: {}".format(tier, fmt, nbranches, workers, partitions, e))
+                            continue
+                        finally:
+                            shutil.rmtree(outdir, ignore_errors=True)
+                        loop = result["runtime_event_loop"]
+                        row = {"task_id": task_id, "hostname": socket.gethostname(), "tier": tier, "format": fmt, "branches": len(names[:nbranches]),
+                               "workers": workers, "partitions": partitions, "files": len(files),
+                               "events_per_second": result["processed_entries"] / loop,
+                               "mb_per_second": result["read_bytes"] / 1024. / 1024. / loop,
+                               "cpu_efficiency": result["cpu_seconds"] / (loop * workers)}
+                        row.update({key: result[key] for key in columns if key in result})
+                        writer.writerow(row)
+                        out.flush()
+                        task_id += 1
+                        print("{} {} {} branches, {} workers, {} partitions: {:.0f} events/s, {:.1f} MB/s, cpu efficiency {:.2f}".format(
+                            tier, fmt, row["branches"], workers, partitions, row["events_per_second"], row["mb_per_second"], row["cpu_efficiency"]))
+    out.close()
+    print("results: {}".format(args.output))
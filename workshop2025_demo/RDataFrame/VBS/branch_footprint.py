@@ -0,0 +1,151 @@
+#!/opt/conda/bin/python3
+
+# Minimal read set of the preselection: every input branch read by the
+# Filter/Define/Vary expressions and by the Snapshot of the preselection, with its
+# compressed and uncompressed size in the NanoAOD files of a chain. The chain
+# and the sizes come from the chain index (chain_index.py): only the files not
+# indexed yet are opened.
+#
+# The read set is taken from the graph itself: preselection_graph and the
+# Snapshot of branchlist are booked on a local RDataFrame over the first file of
+# the chain, limited to a few entries with Range, and run. At the start of the
+# event loop RDataFrame adds every input column of the graph to the TTreeCache
+# of the tree, whether or not an event reaches the node reading it, so the
+# branches of the cache are the read set.
+#
+# Importing preselection_UL-AF30.py would start the Dask cluster and run the
+# whole graph: only its imports and the assignments and functions the graph
+# depends on are executed (load_script), with distributed = False. This needs
+# the same environment as the preselection (headers, calibration files, network).
+#
+# usage: python3 branch_footprint.py [--chain chain.txt] [--redirector R] [--no-lhe] [--no-dz-filter] [--keep-drop keep_and_drop.txt] [--json footprint.json]
+
+import argparse
+import ast
+import json
+import os
+import shutil
+import tempfile
+
+import chain_index
+
+script_names = ("my_initialization_function", "preselection_graph", "snapshot_options", "branchlist")
+
+def _defines(node):
+    # global names set by a top level assignment or function definition
+    if isinstance(node, ast.FunctionDef):
+        return {node.name}
+    return {n.id for target in node.targets for n in ast.walk(target) if isinstance(n, ast.Name)}
+
+def load_script(script="preselection_UL-AF30.py", names=script_names):
+    """namespace with names defined as in script, without running its actions (cluster, chains, graphs)
+
+    Only the imports and the assignments and functions names depends on are executed, in the order of the script.
+    """
+    with open(script) as f:
+        tree = ast.parse(f.read(), script)
+    definitions = [node for node in tree.body if isinstance(node, (ast.Assign, ast.FunctionDef))]
+    needed = set(names)
+    size = 0
+    while size != len(needed):
+        size = len(needed)
+        for node in definitions:
+            if _defines(node) & needed:
+                needed |= {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+    tree.body = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)) or (node in definitions and _defines(node) & needed)]
+    namespace = {"__name__": "preselection", "__file__": script}
+    exec(compile(tree, script, "exec"), namespace)
+    namespace["distributed"] = False
+    missing = [name for name in names if name not in namespace]
+    if missing:
+        raise RuntimeError("{} not defined in {}".format(", ".join(missing), script))
+    return namespace
+
+def read_set(namespace, tree, branches, useFlag_BadPFMuonDzFilter=True, entries=1, treename="Events"):
+    """input branches of tree read by preselection_graph and by the Snapshot of branches (TTreeCache of a run on entries)"""
+    import ROOT
+    df = namespace["preselection_graph"](ROOT.RDataFrame(tree).Range(entries), useFlag_BadPFMuonDzFilter)
+    output = tempfile.mkdtemp()
+    try:
+        df.Snapshot(treename, os.path.join(output, "footprint.root"), branches, namespace["snapshot_options"]())
+    finally:
+        shutil.rmtree(output)
+    cache = tree.GetReadCache(tree.GetCurrentFile())
+    if not cache or cache.GetCachedBranches().GetEntries() == 0:
+        raise RuntimeError("no TTreeCache filled on {}: the read set cannot be taken from it (TTreeCache.Size = 0?)".format(tree.GetCurrentFile().GetName()))
+    return set(b.GetName() for b in cache.GetCachedBranches())
+
+def add_count_branches(tree, branches):
+    # collections are read together with their size branch (Jet_pt -> nJet)
+    result = set(branches)
+    for name in branches:
+        leaf = tree.GetBranch(name).GetLeaf(name)
+        if leaf and leaf.GetLeafCount():
+            result.add(leaf.GetLeafCount().GetName())
+    return result
+
+def write_keep_drop(branches, filename):
+    # branch selection file of nanoAOD-tools (nano_postproc.py --bi): slimmed copy of the inputs
+    with open(filename, "w") as f:
+        f.write("# input branches read by the preselection (branch_footprint.py)\n")
+        f.write("drop *\n")
+        for b in sorted(branches):
+            f.write("keep {}\n".format(b))
+
+def MB(nbytes):
+    return nbytes / 1024. / 1024.
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Input branches read by the preselection and their size")
+    parser.add_argument("--script", default="preselection_UL-AF30.py")
+    parser.add_argument("--chain", default="chain.txt")
+    parser.add_argument("--redirector", default="", help="replaces file:///scratch/cms/ in the chain, as in the preselection")
+    parser.add_argument("--entries", type=int, default=1, help="entries of the first file run through the graph")
+    parser.add_argument("--no-lhe", action="store_true", help="chain without the LHE branches (chain_WZ.txt): their columns are not written, as in execute_MC")
+    parser.add_argument("--no-dz-filter", action="store_true", help="chain without Flag_BadPFMuonDzFilter (chain_gluglu.txt)")
+    parser.add_argument("--keep-drop", help="write the nanoAOD-tools keep/drop file of the read set")
+    parser.add_argument("--json", help="write the per branch sizes")
+    args = parser.parse_args()
+
+    import ROOT
+
+    chain = chain_index.read_chain(args.chain, args.redirector)
+
+    preselection = load_script(args.script)
+    preselection["my_initialization_function"]()
+    branches = preselection["branchlist"][4:] if args.no_lhe else preselection["branchlist"]
+
+    f = ROOT.TFile.Open(chain[0])
+    tree = f.Get("Events")
+    tree_branches = set(b.GetName() for b in tree.GetListOfBranches())
+    reads = read_set(preselection, tree, branches, not args.no_dz_filter, args.entries)
+    reads = add_count_branches(tree, reads)
+    f.Close()
+
+    conn = chain_index.open_index()
+    # the files that could not be opened are not in the index
+    meta = chain_index.metadata(conn, chain)
+    sizes = chain_index.branch_sizes(conn, meta, reads)
+    conn.close()
+    total = [sum(m["zip_bytes"] for m in meta.values()), sum(m["tot_bytes"] for m in meta.values())]
+    entries = sum(m["entries"] for m in meta.values())
+    read_zip = sum(s[0] for s in sizes.values())
+    read_tot = sum(s[1] for s in sizes.values())
+
+    print("{:<45} {:>12} {:>12} {:>8}".format("branch", "zip [MB]", "unzip [MB]", "zip [%]"))
+    for b in sorted(sizes, key=lambda b: -sizes[b][0]):
+        print("{:<45} {:>12.2f} {:>12.2f} {:>8.2f}".format(b, MB(sizes[b][0]), MB(sizes[b][1]), 100. * sizes[b][0] / total[0]))
+    print("")
+    print("{} of {} input branches read ({} files indexed out of {}, {} entries)".format(len(reads), len(tree_branches), len(meta), len(chain), entries))
+    print("read set:   {:.1f} MB compressed, {:.1f} MB uncompressed".format(MB(read_zip), MB(read_tot)))
+    print("full files: {:.1f} MB compressed, {:.1f} MB uncompressed ({:.1f}% read)".format(MB(total[0]), MB(total[1]), 100. * read_zip / total[0]))
+    print("per file:   {:.1f} MB read out of {:.1f} MB".format(MB(read_zip) / len(meta), MB(total[0]) / len(meta)))
+
+    if args.keep_drop:
+        write_keep_drop(reads, args.keep_drop)
+        print("keep/drop file: {}".format(args.keep_drop))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"chain": args.chain, "files": len(chain), "indexed_files": len(meta), "entries": entries,
+                       "branches": {b: {"zip_bytes": s[0], "tot_bytes": s[1]} for b, s in sizes.items()},
+                       "total": {"zip_bytes": total[0], "tot_bytes": total[1]}}, f, indent=2)
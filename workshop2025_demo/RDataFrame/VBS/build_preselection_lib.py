@@ -0,0 +1,115 @@
+#!/opt/conda/bin/python3
+
+# Compile preselection_UL.h + preselection_part2_UL.h (with sample_table_UL.h, replica_cache.h and RoccoR.cc) once into a
+# shared library with its ROOT dictionary, so that the workers can just
+# gSystem.Load it instead of JIT-compiling ~2300 lines of C++ with cling at
+# every start.
+#
+# The library name carries a hash of the sources and of the ROOT version: any
+# change in the headers gives a new library, and a stale one is never loaded.
+#
+# The headers use string, vector, cout, ... without std::, as cling allows: the
+# translation unit given to ACLiC opens namespace std before including them.
+#
+# The driver uploads the library and its dictionary (library_files) to the Dask
+# workers, which load the copy in their local directory (locate). The HTCondor
+# job running the driver (analysis_384CPU.submit) gets lib/, RoccoR.cc and
+# RoccoR.h with its transfer_input_files: build the library before submitting,
+# in the image of the job (its ROOT version is part of the key), otherwise the
+# key does not match and the workers JIT the headers as before.
+#
+# usage: python3 build_preselection_lib.py [lib_dir]
+
+import os
+import sys
+import hashlib
+
+sources = ["replica_cache.h", "sample_table_UL.h", "preselection_UL.h", "preselection_part2_UL.h", "RoccoR.cc", "RoccoR.h"]
+roccor_url = "https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/python/postprocessing/data/roccor.Run2.v5/"
+
+lib_dir = os.environ.get("VBS_PRESELECTION_LIB_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+
+def root_version():
+    # read from root-config to avoid importing ROOT just to compute the key
+    import subprocess
+    try:
+        return subprocess.run(["root-config", "--version"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        import ROOT
+        return ROOT.gROOT.GetVersion()
+
+def fetch_roccor():
+    from calibration_cache import cached_get_file
+    for name in ("RoccoR.cc", "RoccoR.h"):
+        cached_get_file(roccor_url + name, name)
+
+def library_key(src_dir="."):
+    h = hashlib.sha256(root_version().encode())
+    for name in sources:
+        with open(os.path.join(src_dir, name), "rb") as f:
+            h.update(name.encode())
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+def library_path(lib_dir=lib_dir, src_dir="."):
+    """Path of the library matching the current sources, None if it has not been built."""
+    try:
+        key = library_key(src_dir)
+    except (IOError, OSError):
+        return None
+    path = os.path.join(lib_dir, "libpreselection_{}.so".format(key))
+    return path if os.path.exists(path) else None
+
+def library_files(path):
+    """the library and the ROOT dictionary (.pcm) that must be next to it to load it"""
+    name = os.path.basename(path)[:-len(".so")]
+    pcm = os.path.join(os.path.dirname(path), name + "_ACLiC_dict_rdict.pcm")
+    return [path] + ([pcm] if os.path.exists(pcm) else [])
+
+def locate(path):
+    """path of the library on this node: path itself, or the copy uploaded to this Dask worker (UploadFile), None if there is none"""
+    if path is None or os.path.exists(path):
+        return path
+    try:
+        from distributed import get_worker
+        local = os.path.join(get_worker().local_directory, os.path.basename(path))
+    except (ImportError, ValueError):
+        # not in a Dask task
+        return None
+    return local if os.path.exists(local) else None
+
+def build(lib_dir=lib_dir):
+    import ROOT
+    src_dir = os.path.abspath(".")
+    key = library_key(src_dir)
+    os.makedirs(lib_dir, exist_ok=True)
+
+    # single translation unit, same declaration order as my_initialization_function
+    unit = os.path.join(lib_dir, "preselection_{}.h".format(key))
+    with open(unit, "w") as f:
+        # the headers are written for cling, which has std in the global namespace
+        f.write('#include <string>\n#include <vector>\n#include <iostream>\nusing namespace std;\n')
+        f.write('#ifndef ROCCOR\n#define ROCCOR\n#include "{}/RoccoR.cc"\n#endif\n'.format(src_dir))
+        f.write('#include "{}/replica_cache.h"\n'.format(src_dir))
+        f.write('#include "{}/sample_table_UL.h"\n'.format(src_dir))
+        f.write('#include "{}/preselection_UL.h"\n'.format(src_dir))
+        f.write('#include "{}/preselection_part2_UL.h"\n'.format(src_dir))
+
+    ROOT.gSystem.AddIncludePath("-I{} -I/usr/lib/boost_1_77_0 -I/opt/conda/include".format(src_dir))
+    # k: keep, O: optimized, c: compile only (loading it would open the remote calibration files)
+    # absolute library name and no build dir: ACLiC would put a relative name under build_dir/<cwd>/
+    path = os.path.join(lib_dir, "libpreselection_{}.so".format(key))
+    ok = ROOT.gSystem.CompileMacro(unit, "kOc", path[:-len(".so")])
+    if not ok or not os.path.exists(path):
+        raise RuntimeError("ACLiC failed to compile {}".format(unit))
+    return path
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        lib_dir = sys.argv[1]
+    fetch_roccor()
+    path = library_path(lib_dir)
+    if path is not None:
+        print("Up to date: {}".format(path))
+    else:
+        print("Built: {}".format(build(lib_dir)))
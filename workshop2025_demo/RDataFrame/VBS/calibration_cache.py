@@ -0,0 +1,168 @@
+#!/opt/conda/bin/python3
+
+# Node-local cache for the calibration files downloaded by the workers
+# (RoccoR, DeepJet csv, JEC/JER text files, ...).
+#
+# Files are stored content-addressed (objects/<sha256>) and indexed by the
+# sha256 of their URL (urls/<sha256(url)>), so every worker on the same node
+# shares the same copy. The download of a given URL is serialized with a file
+# lock: the first worker fetches it, all the others wait and then just link the
+# cached object into their working directory.
+#
+# The ROOT files that the C++ headers open while they are declared (scale
+# factors, pileup and prefiring maps, ...) are prefetched the same way and
+# listed in replicas.txt ("url path size" per line), which ReplicaPath of
+# replica_cache.h reads: the headers open the local replica and go to the
+# remote server only for a file that is not there.
+
+import os
+import hashlib
+import fcntl
+import shutil
+import tempfile
+
+# Node-local disk, shared by all the workers running on the same machine
+cache_dir = os.environ.get("VBS_CALIB_CACHE", os.path.join(tempfile.gettempdir(), "vbs_calib_cache"))
+replicas_file = os.path.join(cache_dir, "replicas.txt")
+
+# ROOT files opened by the globals of the C++ headers when they are declared:
+# prefetch(replica_files[header]) before declaring or loading the header.
+# ReplicaPath prints the files it opens remotely, add them here.
+nanoaod_tools = "https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/"
+replica_files = {
+    "preselection_UL.h": [nanoaod_tools + "python/postprocessing/data/leptonSF/{}.root".format(name) for name in
+                          ["MuID_Tight_UL2017", "MuTRIG_UL2017", "MuISO_Tight_UL2017", "MuRECO_UL2017", "EleRECO_UL2017_EGM2D", "EleID_WP90Iso_UL2017_EGM2D"]] +
+                         [nanoaod_tools + "python/postprocessing/data/pileup/PileupHistogram-goldenJSON-13tev-2017-99bins_withVar.root",
+                          nanoaod_tools + "python/postprocessing/data/pileup/mcPileup2017.root",
+                          nanoaod_tools + "data/prefire_maps/L1PrefiringMaps.root"],
+    "postselection_UL.h": [nanoaod_tools + "python/postprocessing/data/tauSF/{}.root".format(name) for name in
+                           ["TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017", "TauID_SF_eta_DeepTau2017v2p1VSe_UL2017", "TauID_SF_eta_DeepTau2017v2p1VSmu_2017ReReco",
+                            "TauES_dm_DeepTau2017v2p1VSjet_UL2017", "TauES_dm_DeepTau2017v2p1VSjet_2017ReReco_ptgt100", "TauFES_eta-dm_DeepTau2017v2p1VSe_2017ReReco"]] +
+                          [nanoaod_tools + "python/postprocessing/Btag_eff_UL2017.root"],
+}
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _url_key(url):
+    return hashlib.sha256(url.encode()).hexdigest()
+
+def _download(url, dest):
+    # Workaround to CA verification, same as https_get_file
+    import requests
+    response = requests.get(url, verify=False)
+    response.raise_for_status()
+    with open(dest, "wb") as f:
+        f.write(response.content)
+
+def _lookup(url, expected_sha256=None):
+    # Return the cached object for url if it is there and its content hash is still valid
+    index = os.path.join(cache_dir, "urls", _url_key(url))
+    if not os.path.exists(index):
+        return None
+    with open(index) as f:
+        digest = f.read().strip()
+    if expected_sha256 is not None and digest != expected_sha256:
+        return None
+    obj = os.path.join(cache_dir, "objects", digest)
+    if not os.path.exists(obj) or sha256_file(obj) != digest:
+        return None
+    return obj
+
+def fetch(url, expected_sha256=None):
+    """Return the path of the node-local cached copy of url, downloading it at most once per node."""
+    for sub in ("urls", "objects", "locks"):
+        os.makedirs(os.path.join(cache_dir, sub), exist_ok=True)
+
+    obj = _lookup(url, expected_sha256)
+    if obj is not None:
+        return obj
+
+    key = _url_key(url)
+    with open(os.path.join(cache_dir, "locks", key), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            # Another worker may have filled the cache while we were waiting for the lock
+            obj = _lookup(url, expected_sha256)
+            if obj is not None:
+                return obj
+
+            fd, tmp = tempfile.mkstemp(dir=os.path.join(cache_dir, "objects"))
+            os.close(fd)
+            try:
+                _download(url, tmp)
+                digest = sha256_file(tmp)
+                if expected_sha256 is not None and digest != expected_sha256:
+                    raise RuntimeError("Checksum mismatch for {}: got {}, expected {}".format(url, digest, expected_sha256))
+                obj = os.path.join(cache_dir, "objects", digest)
+                os.chmod(tmp, 0o444)
+                os.replace(tmp, obj)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+            index_tmp = os.path.join(cache_dir, "urls", key + ".tmp")
+            with open(index_tmp, "w") as f:
+                f.write(digest)
+            os.replace(index_tmp, os.path.join(cache_dir, "urls", key))
+            return obj
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def cached_get_file(url, name, expected_sha256=None):
+    """Drop-in replacement of https_get_file: materialize url as name through the node-local cache."""
+    obj = fetch(url, expected_sha256)
+    if os.path.lexists(name):
+        if os.path.exists(name) and os.path.samefile(name, obj):
+            return name
+        os.remove(name)
+    try:
+        os.link(obj, name)
+    except OSError:
+        # cache on a different filesystem than the working directory
+        shutil.copyfile(obj, name)
+    return name
+
+def _record_replicas(replicas):
+    # merge {url: path} into replicas.txt, rewritten atomically under a lock
+    with open(os.path.join(cache_dir, "locks", "replicas"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            entries = {}
+            if os.path.exists(replicas_file):
+                with open(replicas_file) as f:
+                    for line in f:
+                        fields = line.split()
+                        if len(fields) == 3:
+                            entries[fields[0]] = fields[1:]
+            for url, path in replicas.items():
+                entries[url] = [path, str(os.path.getsize(path))]
+            fd, tmp = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, "w") as f:
+                for url in sorted(entries):
+                    f.write("{} {} {}\n".format(url, *entries[url]))
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, replicas_file)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def prefetch(urls):
+    """Cache the files opened by the C++ headers and list them for ReplicaPath (replica_cache.h), {url: path}.
+
+    A file that cannot be downloaded is left out: the header then opens the url itself.
+    """
+    replicas = {}
+    for url in urls:
+        try:
+            replicas[url] = fetch(url)
+        except Exception as e:
+            print("calibration cache: {} not cached, it will be read remotely: {}".format(url, e))
+    if replicas:
+        _record_replicas(replicas)
+    # ReplicaPath looks for replicas.txt in the same directory
+    os.environ["VBS_CALIB_CACHE"] = cache_dir
+    return replicas
@@ -0,0 +1,296 @@
+#!/opt/conda/bin/python3
+
+# Persistent metadata index of the files in the chain txt files, so that the
+# entries and the cluster layout are not rediscovered by opening every file at
+# each start.
+#
+# One SQLite file (chain_index.sqlite next to the chains, or VBS_CHAIN_INDEX on
+# shared storage) keyed by the LFN (/store/...), so that the same record is
+# valid whatever the redirector:
+#   files:         entries, cluster boundaries, compressed/uncompressed bytes,
+#                  file size, TFile UUID, adler32 (only on request, it reads the
+#                  whole file), format of the dataset (TTree or RNTuple)
+#   branch_sizes:  compressed/uncompressed bytes of every branch
+# The index is filled incrementally: only the files that are not in it yet are
+# opened, nthreads at a time. A file is opened and read by one C++ function
+# (chain_index_record) that runs without the GIL, otherwise the threads would
+# wait for each other during the remote opens.
+#
+# A batch job (analysis_384CPU.submit) starts from the index transferred with
+# it: build it before submitting, with the same chains as the job.
+#
+# usage: python3 chain_index.py [--checksum] [--redirector R] chain.txt [chain_gluglu.txt ...]
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+index_file = os.environ.get("VBS_CHAIN_INDEX", os.path.join(os.path.dirname(os.path.abspath(__file__)), "chain_index.sqlite"))
+nthreads = 8
+
+schema = """
+CREATE TABLE IF NOT EXISTS files (
+    lfn TEXT PRIMARY KEY,
+    entries INTEGER,
+    clusters TEXT,
+    zip_bytes INTEGER,
+    tot_bytes INTEGER,
+    size INTEGER,
+    uuid TEXT,
+    adler32 TEXT,
+    indexed REAL,
+    format TEXT
+);
+CREATE TABLE IF NOT EXISTS branches (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS branch_sizes (
+    lfn TEXT,
+    branch INTEGER,
+    zip_bytes INTEGER,
+    tot_bytes INTEGER,
+    PRIMARY KEY (lfn, branch)
+) WITHOUT ROWID;
+"""
+
+def lfn(path):
+    start = path.find("/store/")
+    return path[start:] if start >= 0 else path
+
+def local_path(path):
+    if path.startswith("file://"):
+        return path[len("file://"):]
+    return path if "://" not in path else None
+
+def adler32(path):
+    value = 1
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 24), b""):
+            value = zlib.adler32(block, value)
+    return "{:08x}".format(value & 0xffffffff)
+
+def open_index(path=index_file):
+    conn = sqlite3.connect(path)
+    conn.executescript(schema)
+    # indexes written before the RNTuple support
+    if "format" not in [row[1] for row in conn.execute("PRAGMA table_info(files)")]:
+        conn.execute("ALTER TABLE files ADD COLUMN format TEXT DEFAULT 'TTree'")
+    return conn
+
+record_code = r"""
+#include "TFile.h"
+#include "TKey.h"
+#include "TTree.h"
+#include "TBranch.h"
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+
+struct ChainIndexRecord {
+    bool opened = false;
+    std::string format = "TTree";
+    long long entries = 0;
+    std::vector<long long> clusters;
+    long long zipBytes = 0;
+    long long totBytes = 0;
+    long long size = 0;
+    std::string uuid;
+    std::vector<std::string> branches;
+    std::vector<long long> branchZipBytes;
+    std::vector<long long> branchTotBytes;
+};
+
+ChainIndexRecord chain_index_record(const std::string &path, const std::string &treename)
+{
+    ChainIndexRecord r;
+    std::unique_ptr<TFile> f(TFile::Open(path.c_str()));
+    if (!f || f->IsZombie())
+        return r;
+    r.opened = true;
+    r.size = f->GetSize();
+    {
+        // TUUID::AsString writes to a static buffer
+        static std::mutex uuidMutex;
+        std::lock_guard<std::mutex> lock(uuidMutex);
+        r.uuid = f->GetUUID().AsString();
+    }
+    TKey *key = f->GetKey(treename.c_str());
+    if (key && (std::string(key->GetClassName()) == "ROOT::RNTuple" || std::string(key->GetClassName()) == "ROOT::Experimental::RNTuple")) {
+        r.format = "RNTuple";
+        return r;
+    }
+    TTree *tree = f->Get<TTree>(treename.c_str());
+    if (!tree)
+        return r;
+    r.entries = tree->GetEntries();
+    auto it = tree->GetClusterIterator(0);
+    for (Long64_t start = it.Next(); start < r.entries; start = it.Next())
+        r.clusters.push_back(start);
+    r.zipBytes = tree->GetZipBytes();
+    r.totBytes = tree->GetTotBytes();
+    for (TObject *obj : *tree->GetListOfBranches()) {
+        TBranch *b = static_cast<TBranch *>(obj);
+        r.branches.push_back(b->GetName());
+        r.branchZipBytes.push_back(b->GetZipBytes("*"));
+        r.branchTotBytes.push_back(b->GetTotBytes("*"));
+    }
+    return r;
+}
+"""
+
+_declared = False
+
+def _declare():
+    # on the main thread, before the pool: Declare is not thread safe
+    global _declared
+    if not _declared:
+        import ROOT
+        ROOT.gInterpreter.Declare(record_code)
+        ROOT.chain_index_record.__release_gil__ = True
+        _declared = True
+
+def _rntuple_record(f, treename):
+    # entries and cluster starts of an RNTuple; its bytes are taken as the size of the file (one dataset per file)
+    import ROOT
+    # ROOT::RNTupleReader from 6.36, ROOT::Experimental before
+    RNTupleReader = ROOT.RNTupleReader if hasattr(ROOT, "RNTupleReader") else ROOT.Experimental.RNTupleReader
+    reader = RNTupleReader.Open(f.Get(treename))
+    clusters = sorted(cluster.GetFirstEntryIndex() for cluster in reader.GetDescriptor().GetClusterIterable())
+    return reader.GetNEntries(), clusters
+
+def file_record(path, treename="Events", checksum=False):
+    """metadata of one file, None if it cannot be opened"""
+    import ROOT
+    _declare()
+    # std::string objects: a str would be converted in a buffer shared by the threads calling chain_index_record
+    r = ROOT.chain_index_record(ROOT.std.string(path), ROOT.std.string(treename))
+    if not r.opened:
+        return None
+    record = {
+        "lfn": lfn(path),
+        "entries": r.entries,
+        "clusters": list(r.clusters),
+        "zip_bytes": r.zipBytes,
+        "tot_bytes": r.totBytes,
+        "size": r.size,
+        "uuid": str(r.uuid),
+        "adler32": None,
+        "branches": {str(name): (zipped, total) for name, zipped, total in zip(r.branches, r.branchZipBytes, r.branchTotBytes)},
+        "format": str(r.format),
+    }
+    if record["format"] == "RNTuple":
+        f = ROOT.TFile.Open(path)
+        record["entries"], record["clusters"] = _rntuple_record(f, treename)
+        f.Close()
+        record["zip_bytes"] = record["size"]
+        record["tot_bytes"] = None
+    if checksum and local_path(path) is not None:
+        record["adler32"] = adler32(local_path(path))
+    return record
+
+def adler32_of(conn, name):
+    """adler32 recorded for the LFN, None if unknown"""
+    row = conn.execute("SELECT adler32 FROM files WHERE lfn = ?", (name,)).fetchone()
+    return row[0] if row is not None else None
+
+def _store(conn, record):
+    conn.execute("INSERT OR REPLACE INTO files (lfn, entries, clusters, zip_bytes, tot_bytes, size, uuid, adler32, indexed, format) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                 (record["lfn"], record["entries"], json.dumps(record["clusters"]), record["zip_bytes"], record["tot_bytes"],
+                  record["size"], record["uuid"], record["adler32"] or adler32_of(conn, record["lfn"]), time.time(), record["format"]))
+    conn.executemany("INSERT OR IGNORE INTO branches (name) VALUES (?)", [(name,) for name in record["branches"]])
+    ids = dict(conn.execute("SELECT name, id FROM branches"))
+    conn.execute("DELETE FROM branch_sizes WHERE lfn = ?", (record["lfn"],))
+    conn.executemany("INSERT INTO branch_sizes VALUES (?, ?, ?, ?)",
+                     [(record["lfn"], ids[name], zipped, total) for name, (zipped, total) in record["branches"].items()])
+
+def update(conn, files, treename="Events", checksum=False):
+    """open and index the files not in the index yet, return the ones that could not be opened"""
+    # rows with only a checksum (stage_chain.py) are not indexed yet
+    known = set(row[0] for row in conn.execute("SELECT lfn FROM files WHERE entries IS NOT NULL"))
+    missing = [path for path in files if lfn(path) not in known]
+    if checksum:
+        # indexed before without the checksum
+        unchecked = set(row[0] for row in conn.execute("SELECT lfn FROM files WHERE adler32 IS NULL"))
+        missing += [path for path in files if lfn(path) in unchecked and local_path(path) is not None]
+    if not missing:
+        return []
+    import ROOT
+    ROOT.EnableThreadSafety()
+    _declare()
+    failed = []
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        for n, (path, record) in enumerate(zip(missing, pool.map(lambda path: file_record(path, treename, checksum), missing))):
+            print("indexed {}/{}: {}".format(n + 1, len(missing), path))
+            if record is None:
+                failed.append(path)
+                continue
+            _store(conn, record)
+            if n % 50 == 0:
+                conn.commit()
+    conn.commit()
+    return failed
+
+def metadata(conn, files):
+    """{file: {"entries", "clusters", "zip_bytes", "tot_bytes", "format"}} for the indexed files (clusters is the list of the cluster starts)"""
+    result = {}
+    for path in files:
+        row = conn.execute("SELECT entries, clusters, zip_bytes, tot_bytes, format FROM files WHERE lfn = ?", (lfn(path),)).fetchone()
+        if row is not None and row[0] is not None:
+            result[path] = {"entries": row[0], "clusters": json.loads(row[1]), "zip_bytes": row[2], "tot_bytes": row[3], "format": row[4]}
+    return result
+
+def branch_sizes(conn, files, branches):
+    """{branch: [compressed, uncompressed]} summed over the indexed files"""
+    sizes = {b: [0, 0] for b in branches}
+    for path in files:
+        rows = conn.execute("SELECT branches.name, zip_bytes, tot_bytes FROM branch_sizes JOIN branches ON branches.id = branch_sizes.branch WHERE lfn = ?", (lfn(path),))
+        for name, zipped, total in rows:
+            if name in sizes:
+                sizes[name][0] += zipped
+                sizes[name][1] += total
+    return sizes
+
+def read_chain(filename, redirector="", index=index_file, treename="Events"):
+    """files of a chain txt file, indexed if needed; the files without entries are dropped"""
+    with open(filename, 'r') as file:
+        files = [line.strip() for line in file.readlines() if line.strip()]
+    if redirector != "":
+        files = [path.replace("file:///scratch/cms/", redirector) for path in files]
+    conn = open_index(index)
+    failed = update(conn, files, treename)
+    if failed:
+        print("{}: {} files could not be opened, they are kept in the chain".format(filename, len(failed)))
+    meta = metadata(conn, files)
+    conn.close()
+    return [path for path in files if path not in meta or meta[path]["entries"] > 0]
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    checksum = "--checksum" in args
+    if checksum:
+        args.remove("--checksum")
+    redirector = ""
+    if "--redirector" in args:
+        i = args.index("--redirector")
+        redirector = args[i + 1]
+        del args[i:i + 2]
+    if not args:
+        print("Usage: python3 chain_index.py [--checksum] [--redirector R] <chain.txt> [...]")
+        sys.exit(1)
+
+    conn = open_index()
+    for chain_file in args:
+        with open(chain_file) as f:
+            files = [line.strip() for line in f if line.strip()]
+        if redirector != "":
+            files = [path.replace("file:///scratch/cms/", redirector) for path in files]
+        failed = update(conn, files, checksum=checksum)
+        meta = metadata(conn, files)
+        print("{}: {} files indexed, {} entries, {} not readable".format(chain_file, len(meta), sum(m["entries"] for m in meta.values()), len(failed)))
+    conn.close()
@@ -0,0 +1,134 @@
+#!/opt/conda/bin/python3
+
+# Batch TTree -> RNTuple conversion of the files of chain txt files, the
+# parallel version of converter-rnt.py.
+#
+# The files are converted by a pool of processes, each one loading ROOT once
+# and running RNTupleImporter on one file after the other. The output goes
+# straight to the mirrored /store/mcrnt layout (same path with /store/mc/
+# replaced by /store/mcrnt/, as mover_scratch-rnt.sh did by hand): written to
+# a .part file and renamed once the import is over, so an interrupted run
+# never leaves a truncated output behind.
+#
+# The outputs are recorded in the chain index (chain_index.py) with their
+# entries and adler32: a file is skipped when its output is in the index with
+# the entries of the input and the adler32 of the file on disk.
+#
+# usage: python3 convert_chain_rnt.py [--workers N] [--compression 505] [--redirector R] [--force] chain.txt [chain_gluglu.txt ...]
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import chain_index
+
+def rnt_path(path):
+    return path.replace("/store/mc/", "/store/mcrnt/", 1)
+
+def _convert(source, output, compression, treename="Events"):
+    # runs in a worker process: import, then the index record of the output
+    import ROOT
+    # ROOT::RNTupleImporter from 6.36, ROOT::Experimental before
+    RNTupleImporter = ROOT.RNTupleImporter if hasattr(ROOT, "RNTupleImporter") else ROOT.Experimental.RNTupleImporter
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    part = output + ".part"
+    if os.path.exists(part):
+        os.remove(part)
+
+    start = time.time()
+    importer = RNTupleImporter.Create(source, treename, part)
+    options = importer.GetWriteOptions()
+    options.SetCompression(compression)
+    importer.SetWriteOptions(options)
+    importer.SetIsQuiet(True)
+    importer.Import()
+    seconds = time.time() - start
+    os.replace(part, output)
+
+    record = chain_index.file_record(output, treename, checksum=True)
+    return {"record": record, "seconds": seconds, "input_bytes": os.path.getsize(source), "output_bytes": os.path.getsize(output)}
+
+def is_converted(conn, output, entries):
+    """the output is indexed with the entries of the input and its adler32 is unchanged"""
+    if not os.path.exists(output):
+        return False
+    row = conn.execute("SELECT entries, adler32 FROM files WHERE lfn = ?", (chain_index.lfn(output),)).fetchone()
+    return row is not None and row[0] == entries and row[1] == chain_index.adler32(output)
+
+def MB(nbytes):
+    return nbytes / 1024. / 1024.
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert the files of chain txt files to RNTuple in /store/mcrnt")
+    parser.add_argument("chains", nargs="+")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--compression", type=int, default=505, help="100 * algorithm + level, 505: ZSTD level 5")
+    parser.add_argument("--redirector", default="", help="replaces file:///scratch/cms/ in the chain, as in the preselection")
+    parser.add_argument("--force", action="store_true", help="convert also the files with a valid output")
+    parser.add_argument("--treename", default="Events")
+    args = parser.parse_args()
+
+    sources = []
+    for chain_file in args.chains:
+        with open(chain_file) as f:
+            files = [line.strip() for line in f if line.strip()]
+        if args.redirector != "":
+            files = [path.replace("file:///scratch/cms/", args.redirector) for path in files]
+        sources += files
+
+    # the importer writes local files only
+    remote = [path for path in sources if chain_index.local_path(path) is None]
+    if remote:
+        print("{} remote files skipped, stage them first".format(len(remote)))
+    sources = [chain_index.local_path(path) for path in sources if chain_index.local_path(path) is not None]
+
+    conn = chain_index.open_index()
+    chain_index.update(conn, sources, args.treename)
+    meta = chain_index.metadata(conn, sources)
+    todo = []
+    for source in sources:
+        if source not in meta:
+            print("cannot open {}, skipped".format(source))
+        elif args.force or not is_converted(conn, rnt_path(source), meta[source]["entries"]):
+            todo.append(source)
+    print("{} files to convert, {} already converted".format(len(todo), len(sources) - len(todo)))
+
+    results = []
+    start = time.time()
+    # spawn: ROOT is already loaded in this process
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(_convert, source, rnt_path(source), args.compression, args.treename): source for source in todo}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print("{}: conversion failed: {}".format(source, e))
+                continue
+            record = result["record"]
+            if record is None or record["entries"] != meta[source]["entries"]:
+                print("{}: {} entries in the output, {} in the input".format(source, record["entries"] if record else 0, meta[source]["entries"]))
+                continue
+            chain_index._store(conn, record)
+            conn.commit()
+            results.append((source, result))
+            print("converted {}/{}: {}".format(len(results), len(todo), rnt_path(source)))
+    wall = time.time() - start
+    conn.close()
+
+    if results:
+        print("")
+        print("{:<60} {:>10} {:>10} {:>7} {:>9}".format("file", "in [MB]", "out [MB]", "ratio", "MB/s"))
+        for source, result in sorted(results):
+            print("{:<60} {:>10.1f} {:>10.1f} {:>7.2f} {:>9.1f}".format(os.path.basename(source), MB(result["input_bytes"]), MB(result["output_bytes"]),
+                                                                       float(result["input_bytes"]) / result["output_bytes"], MB(result["input_bytes"]) / result["seconds"]))
+        total_in = sum(result["input_bytes"] for _, result in results)
+        total_out = sum(result["output_bytes"] for _, result in results)
+        print("")
+        print("{} files: {:.1f} MB -> {:.1f} MB (ratio {:.2f}), {:.1f} MB/s in {:.0f} s with {} workers".format(
+            len(results), MB(total_in), MB(total_out), float(total_in) / total_out, MB(total_in) / wall, wall, args.workers))
+    failed = len(todo) - len(results)
+    if failed:
+        print("{} files not converted".format(failed))
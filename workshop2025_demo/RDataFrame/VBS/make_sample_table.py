@@ -0,0 +1,159 @@
+#!/opt/conda/bin/python3
+
+# Generate the C++ tables of the samples from the sample registry (samplesUL,
+# samplesUL.json) and the sample ids (sample_ids.py, sampleDict), so that ids,
+# datasets, cross sections and generated events are written in one place only:
+#
+#   sample_table_UL.h    (preselection) constexpr arrays sorted by name, searched
+#                        with FindSampleInfo (binary search, no allocation):
+#       sample_table     LFN (/store/...) of every file of the chain txt files -> (sample id, year)
+#       dataset_table    DAS name of every dataset and of its other processings -> (sample id, year),
+#                        for the files that are not in the chains
+#   sample_weights_UL.h  (postselection) constexpr arrays indexed by sample id:
+#       sample_xsec      cross section [pb] of the MC samples (sigma)
+#       sample_nevents   generated events of the MC samples (nevents)
+#       sample_kind      kMC, kDataMu, kDataEle or kDataHT
+#
+# An id gets a cross section and a number of events from its samples that have
+# both sigma and nevents (0 when none has them, 1 for data). A dataset that
+# belongs to samples with different ids, or an id whose samples have different
+# weights, is an error here instead of a silently wrong weight later.
+#
+# usage: python3 make_sample_table.py [chain.txt chain_gluglu.txt ...]
+
+import sys
+
+import samplesUL
+from sample_ids import sampleDict
+
+chains = ["chain.txt", "chain_gluglu.txt", "chain_WZ.txt"]
+output = "sample_table_UL.h"
+output_weights = "sample_weights_UL.h"
+
+# must match enum DataYear in the generated header
+years = ["UL2016APV", "UL2016", "UL2017", "UL2018"]
+
+# label prefix -> kind of the data samples, the other samples are kMC
+data_kinds = [("DataMu", "kDataMu"), ("DataEle", "kDataEle"), ("DataHT", "kDataHT")]
+
+def lfn(path):
+    return path[path.index("/store/"):]
+
+def dataset_name(lfn):
+    # /store/mc/<campaign>/<primary>/<tier>/<conditions>/<block>/<file>.root -> /<primary>/<campaign>-<conditions>/<tier>
+    tokens = lfn.split("/")
+    return "/{}/{}-{}/{}".format(tokens[4], tokens[3], tokens[6], tokens[5])
+
+def build_datasets():
+    """{DAS name: (sample id, year)} of the samples with an id"""
+    datasets = {}
+    owners = {}
+    for label, sample_id in sampleDict.items():
+        if label not in samplesUL.registry().samples:
+            continue
+        s = samplesUL.get(label)
+        for name in [getattr(s, "dataset", "")] + getattr(s, "other_datasets", []):
+            if not name:
+                continue
+            if s.year not in years:
+                raise RuntimeError("{}: unknown year {} for {}".format(label, s.year, name))
+            if name in datasets and datasets[name] != (sample_id, s.year):
+                raise RuntimeError("{} is the dataset of {} (id {}) and of {} (id {}) in samplesUL.json".format(
+                    name, owners[name], datasets[name][0], label, sample_id))
+            datasets[name] = (sample_id, s.year)
+            owners[name] = label
+    return datasets
+
+def build_table(chains=chains, datasets=None):
+    """{LFN: (sample id, year)} of the files in the chains"""
+    if datasets is None:
+        datasets = build_datasets()
+    table = {}
+    for chain in chains:
+        with open(chain) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                key = lfn(line.strip())
+                dataset = dataset_name(key)
+                if dataset not in datasets:
+                    raise RuntimeError("{}: no sample in samplesUL.json for {}".format(chain, dataset))
+                table[key] = datasets[dataset]
+    return table
+
+def build_weights():
+    """[(xsec, nevents, kind)] indexed by sample id"""
+    n = max(sampleDict.values()) + 1
+    weights = [(0., 0., "kMC")] * n
+    weighted = {}
+    for label, sample_id in sorted(sampleDict.items(), key=lambda item: item[1]):
+        kind = [k for prefix, k in data_kinds if label.startswith(prefix)]
+        if kind:
+            weights[sample_id] = (1., 1., kind[0])
+            continue
+        if label not in samplesUL.registry().samples:
+            continue
+        s = samplesUL.get(label)
+        if not hasattr(s, "sigma") or not hasattr(s, "nevents"):
+            continue
+        if sample_id in weighted and weights[sample_id][:2] != (s.sigma, s.nevents):
+            raise RuntimeError("id {}: {} has sigma {} and nevents {}, {} has sigma {} and nevents {}".format(
+                sample_id, weighted[sample_id], weights[sample_id][0], weights[sample_id][1], label, s.sigma, s.nevents))
+        weights[sample_id] = (s.sigma, s.nevents, "kMC")
+        weighted[sample_id] = label
+    return weights
+
+def write_entries(f, name, entries):
+    f.write("constexpr std::array<SampleEntry, {}> {} = {{{{\n".format(len(entries), name))
+    for key in sorted(entries):
+        sample_id, year = entries[key]
+        f.write('    {{"{}", {{{}, k{}}}}},\n'.format(key, sample_id, year))
+    f.write("}};\n\n")
+
+def write_header(table, datasets, filename=output):
+    with open(filename, "w") as f:
+        f.write("// Generated by make_sample_table.py from samplesUL.json, sample_ids.py and the chain files: do not edit.\n\n")
+        f.write("#ifndef SAMPLE_TABLE_H\n#define SAMPLE_TABLE_H\n\n")
+        f.write("#include <algorithm>\n#include <array>\n#include <string_view>\n\n")
+        f.write("enum DataYear {{ {} }};\n\n".format(", ".join("k" + year for year in years)))
+        f.write("struct SampleInfo {\n    int id;\n    int year;\n};\n\n")
+        f.write("struct SampleEntry {\n    std::string_view name;\n    SampleInfo info;\n};\n\n")
+        f.write("// LFN of the input file -> (sample id, year), sorted by LFN\n")
+        write_entries(f, "sample_table", table)
+        f.write("// DAS name of the dataset -> (sample id, year), sorted by name\n")
+        write_entries(f, "dataset_table", datasets)
+        f.write("// binary search of a name in one of the tables, nullptr when it is not there\n")
+        f.write("template <std::size_t N>\n")
+        f.write("const SampleInfo *FindSampleInfo(const std::array<SampleEntry, N> &table, std::string_view name){\n")
+        f.write("    auto it = std::lower_bound(table.begin(), table.end(), name, [](const SampleEntry &entry, std::string_view key){ return entry.name < key; });\n")
+        f.write("    return it != table.end() && it->name == name ? &it->info : nullptr;\n")
+        f.write("}\n\n#endif\n")
+
+def cpp_float(value):
+    return repr(float(value)) + "f"
+
+def write_weights(weights, filename=output_weights):
+    with open(filename, "w") as f:
+        f.write("// Generated by make_sample_table.py from samplesUL.json and sample_ids.py: do not edit.\n\n")
+        f.write("#ifndef SAMPLE_WEIGHTS_H\n#define SAMPLE_WEIGHTS_H\n\n")
+        f.write("#include <array>\n\n")
+        f.write("enum SampleKind {{ {} }};\n\n".format(", ".join(["kMC"] + [kind for _, kind in data_kinds])))
+        f.write("constexpr int kNSamples = {};\n\n".format(len(weights)))
+        for name, column, comment in [("sample_xsec", 0, "cross section [pb]"), ("sample_nevents", 1, "generated events"), ("sample_kind", 2, "kind")]:
+            f.write("// sample id -> {}\n".format(comment))
+            f.write("constexpr std::array<{}, kNSamples> {} = {{{{\n".format("SampleKind" if column == 2 else "float", name))
+            for sample_id, weight in enumerate(weights):
+                f.write("    {}, // {}\n".format(weight[column] if column == 2 else cpp_float(weight[column]), sample_id))
+            f.write("}};\n\n")
+        f.write("#endif\n")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        chains = sys.argv[1:]
+    datasets = build_datasets()
+    table = build_table(chains, datasets)
+    write_header(table, datasets)
+    print("{}: {} files, {} datasets".format(output, len(table), len(datasets)))
+    weights = build_weights()
+    write_weights(weights)
+    print("{}: {} sample ids, {} with weights".format(output_weights, len(weights), sum(w[1] > 0 and w[2] == "kMC" for w in weights)))
@@ -0,0 +1,152 @@
+#!/opt/conda/bin/python3
+
+# Per-task monitoring of the Distributed RDataFrame on a stock ROOT release,
+# the files that the monitoring image writes with monitor_label=:
+#   distrdf_monitor_<task>.csv  task_id, cpu_percent, memory_rss, memory_percent_rss,
+#                               net_read, timestamp, hostname (one sample per second)
+#   distrdf_runtime_<task>.csv  task_id, hostname, processed_entries, runtime_mapper,
+#                               runtime_setup, runtime_rdf_creation, runtime_event_loop
+# (monitoring_report.py turns them into a report).
+#
+# TaskMonitor is a Dask worker plugin: at setup it wraps the mapper of DistRDF
+# (DistRDF.Backends.Base.distrdf_mapper, the function every task runs) on the
+# worker, so that each task
+#  - samples the worker process (CPU, RSS) and the network reads of the host
+#    every second in a thread while it runs,
+#  - times the three phases of the mapper: the initialization function
+#    (setup), the creation of the RDataFrame of its range and the event loop,
+#  - counts its entries with a Count booked on the RDataFrame of its range,
+#    run in the same event loop as the rest of the graph.
+#
+# usage, in the driver:
+#     client.register_plugin(UploadFile(os.path.abspath("monitoring_plugin.py")))
+#     client.register_plugin(TaskMonitor("distrdf_monitoring"))
+
+import csv
+import functools
+import inspect
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+
+from distributed import WorkerPlugin
+
+sample_seconds = 1.
+
+class _Sampler(threading.Thread):
+    def __init__(self, task_id, filename):
+        threading.Thread.__init__(self, daemon=True)
+        self.task_id = task_id
+        self.filename = filename
+        self.stop = threading.Event()
+
+    def run(self):
+        import psutil
+        process = psutil.Process()
+        hostname = socket.gethostname()
+        with open(self.filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["task_id", "cpu_percent", "memory_rss", "memory_percent_rss", "net_read", "timestamp", "hostname"])
+            # the first cpu_percent is 0, as in the files of the monitoring image
+            process.cpu_percent(interval=None)
+            while True:
+                writer.writerow([self.task_id, process.cpu_percent(interval=None), process.memory_info().rss, process.memory_percent("rss"),
+                                 psutil.net_io_counters().bytes_recv, datetime.now(), hostname])
+                f.flush()
+                if self.stop.wait(sample_seconds):
+                    break
+
+def _timed(function, times, phase):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            times[phase] = time.time() - start
+    return wrapper
+
+def _monitored_mapper(mapper, directory):
+    parameters = list(inspect.signature(mapper).parameters)
+
+    @functools.wraps(mapper)
+    def wrapper(*args, **kwargs):
+        call = dict(zip(parameters, args))
+        call.update(kwargs)
+        task_id = call["current_range"].id
+        times = {}
+        counts = []
+
+        def build_rdf(current_range):
+            # the Count is booked before the graph, it runs in the same event loop
+            rdf_plus = call_build(current_range)
+            if rdf_plus.rdf is not None:
+                counts.append(rdf_plus.rdf.Count())
+            return rdf_plus
+
+        call_build = _timed(call["build_rdf_from_range"], times, "runtime_rdf_creation")
+        call["build_rdf_from_range"] = build_rdf
+        call["initialization_fn"] = _timed(call["initialization_fn"], times, "runtime_setup")
+
+        sampler = _Sampler(task_id, os.path.join(directory, "distrdf_monitor_{}.csv".format(task_id)))
+        sampler.start()
+        _event_loop.times = times
+        start = time.time()
+        try:
+            return mapper(**call)
+        finally:
+            times["runtime_mapper"] = time.time() - start
+            _event_loop.times = None
+            sampler.stop.set()
+            sampler.join()
+            with open(os.path.join(directory, "distrdf_runtime_{}.csv".format(task_id)), "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["task_id", "hostname", "processed_entries", "runtime_mapper", "runtime_setup", "runtime_rdf_creation", "runtime_event_loop"])
+                # not ready if the mapper failed before the end of the event loop: GetValue would run it again
+                processed = counts[0].GetValue() if counts and counts[0].IsReady() else 0
+                writer.writerow([task_id, socket.gethostname(), processed, times.get("runtime_mapper", 0.),
+                                 times.get("runtime_setup", 0.), times.get("runtime_rdf_creation", 0.), times.get("runtime_event_loop", 0.)])
+    return wrapper
+
+# the times of the task running in this thread, for the event loop wrapper
+_event_loop = threading.local()
+
+def _monitored_event_loop(get_mergeable_values):
+    @functools.wraps(get_mergeable_values)
+    def wrapper(*args, **kwargs):
+        times = getattr(_event_loop, "times", None)
+        if times is None:
+            return get_mergeable_values(*args, **kwargs)
+        return _timed(get_mergeable_values, times, "runtime_event_loop")(*args, **kwargs)
+    return wrapper
+
+class TaskMonitor(WorkerPlugin):
+    """write distrdf_monitor_<task>.csv and distrdf_runtime_<task>.csv for every DistRDF task run by the workers"""
+
+    name = "distrdf-task-monitor"
+
+    def __init__(self, directory="distrdf_monitoring"):
+        self.directory = directory
+
+    def setup(self, worker):
+        from DistRDF.Backends import Base
+        if not hasattr(Base, "distrdf_mapper") or not hasattr(Base, "get_mergeable_values"):
+            print("TaskMonitor: DistRDF of this ROOT version has no distrdf_mapper/get_mergeable_values, tasks not monitored")
+            return
+        if not set(["current_range", "build_rdf_from_range", "initialization_fn"]) <= set(inspect.signature(Base.distrdf_mapper).parameters):
+            print("TaskMonitor: unknown signature of distrdf_mapper, tasks not monitored")
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        if not getattr(Base.distrdf_mapper, "_task_monitor", False):
+            # the tasks get the mapper by name: the one found in the module on the worker is the wrapped one
+            self._original = (Base.distrdf_mapper, Base.get_mergeable_values)
+            Base.get_mergeable_values = _monitored_event_loop(Base.get_mergeable_values)
+            Base.distrdf_mapper = _monitored_mapper(Base.distrdf_mapper, os.path.abspath(self.directory))
+            Base.distrdf_mapper._task_monitor = True
+
+    def teardown(self, worker):
+        if hasattr(self, "_original"):
+            from DistRDF.Backends import Base
+            Base.distrdf_mapper, Base.get_mergeable_values = self._original
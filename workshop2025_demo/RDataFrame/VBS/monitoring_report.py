@@ -0,0 +1,264 @@
+#!/opt/conda/bin/python3
+
+# Report of a Distributed RDataFrame run from the per-task monitoring files
+#   distrdf_runtime_<task>.csv  task_id, hostname, processed_entries, runtime_mapper,
+#                               runtime_setup, runtime_rdf_creation, runtime_event_loop
+#   distrdf_monitor_<task>.csv  task_id, cpu_percent, memory_rss, memory_percent_rss,
+#                               net_read, timestamp, hostname (one sample per second)
+# written by the monitoring ROOT image or by monitoring_plugin.py.
+#
+# The files of several runs can be in the same directory (the task files of a
+# run overwrite only those of the previous runs with the same task ids): tasks
+# are grouped in runs, a new run starting after run_gap_seconds without
+# samples. In a run the samples of all the tasks are put on the same time axis
+# (seconds from the first sample of the run). Computed:
+#  - per task: entries/s in the event loop, setup fraction ((setup + RDataFrame
+#    creation) / mapper time), mean CPU, peak RSS, network MB/s while it ran,
+#  - per host: tasks, entries, entries/s over the span of its tasks and network
+#    MB/s (net_read is a counter of the host: rates come from its increase over
+#    the merged samples of the tasks of that host, not from summing the tasks),
+#  - stragglers: tasks longer than straggler_factor times the median.
+# The report is one HTML file (tables and an SVG timeline, no dependencies);
+# with --png the timeline and the network rate are also drawn with ROOT.
+#
+# usage: python3 monitoring_report.py [--output report.html] [--png report.png] directory
+
+import argparse
+import csv
+import glob
+import os
+import statistics
+from datetime import datetime
+
+straggler_factor = 1.5
+run_gap_seconds = 600
+runtime_fields = ["runtime_mapper", "runtime_setup", "runtime_rdf_creation", "runtime_event_loop"]
+
+def read_runtime(directory):
+    """{task_id: row} from the distrdf_runtime_*.csv files"""
+    tasks = {}
+    for path in glob.glob(os.path.join(directory, "distrdf_runtime_*.csv")):
+        with open(path) as f:
+            for row in csv.DictReader(f):
+                task = int(row["task_id"])
+                tasks[task] = {"hostname": row["hostname"], "processed_entries": int(row["processed_entries"])}
+                for field in runtime_fields:
+                    tasks[task][field] = float(row[field])
+    return tasks
+
+def read_monitor(directory):
+    """{task_id: [sample, ...]} from the distrdf_monitor_*.csv files, samples in time order"""
+    samples = {}
+    for path in glob.glob(os.path.join(directory, "distrdf_monitor_*.csv")):
+        with open(path) as f:
+            for row in csv.DictReader(f):
+                samples.setdefault(int(row["task_id"]), []).append({
+                    "time": datetime.fromisoformat(row["timestamp"]),
+                    "cpu_percent": float(row["cpu_percent"]),
+                    "memory_rss": int(row["memory_rss"]),
+                    "net_read": int(row["net_read"]),
+                    "hostname": row["hostname"],
+                })
+    for task in samples:
+        samples[task].sort(key=lambda s: s["time"])
+    return samples
+
+def split_runs(tasks, samples):
+    """[[task_id, ...], ...] one list per run in time order, the tasks without samples in a last list"""
+    runs = []
+    end = None
+    for task in sorted(samples, key=lambda task: samples[task][0]["time"]):
+        start = samples[task][0]["time"]
+        if end is None or (start - end).total_seconds() > run_gap_seconds:
+            runs.append([])
+            end = start
+        runs[-1].append(task)
+        end = max(end, samples[task][-1]["time"])
+    unaligned = [task for task in tasks if task not in samples]
+    if unaligned:
+        runs.append(unaligned)
+    return runs
+
+def _rate(points):
+    # MB/s from the first to the last (seconds, counter) point
+    if len(points) < 2 or points[-1][0] <= points[0][0]:
+        return 0.
+    return (points[-1][1] - points[0][1]) / 1024. / 1024. / (points[-1][0] - points[0][0])
+
+def analyse(tasks, samples):
+    """(per task, per host, stragglers, t0); times in seconds from t0, the first sample of the run"""
+    all_samples = [s for task in samples.values() for s in task]
+    t0 = min(s["time"] for s in all_samples) if all_samples else None
+
+    per_task = {}
+    for task in sorted(set(tasks) | set(samples)):
+        runtime = tasks.get(task, {})
+        series = samples.get(task, [])
+        seconds = [(s["time"] - t0).total_seconds() for s in series]
+        row = {
+            "hostname": runtime.get("hostname", series[0]["hostname"] if series else ""),
+            "processed_entries": runtime.get("processed_entries", 0),
+            "start": seconds[0] if seconds else None,
+            "end": seconds[-1] if seconds else None,
+        }
+        for field in runtime_fields:
+            row[field] = runtime.get(field)
+        mapper = row["runtime_mapper"]
+        if mapper:
+            row["setup_fraction"] = (row["runtime_setup"] + row["runtime_rdf_creation"]) / mapper
+        loop = row["runtime_event_loop"]
+        row["entries_per_second"] = row["processed_entries"] / loop if loop else None
+        row["cpu_percent"] = statistics.mean(s["cpu_percent"] for s in series) if series else None
+        row["peak_rss_mb"] = max(s["memory_rss"] for s in series) / 1024. / 1024. if series else None
+        row["net_mb_per_second"] = _rate([(t, s["net_read"]) for t, s in zip(seconds, series)])
+        # the mapper time, or the span of the samples when the runtime file is missing
+        row["duration"] = mapper if mapper is not None else (row["end"] - row["start"] if seconds else None)
+        per_task[task] = row
+
+    per_host = {}
+    for task, row in per_task.items():
+        host = per_host.setdefault(row["hostname"], {"tasks": 0, "processed_entries": 0, "busy": 0., "points": [], "start": None, "end": None})
+        host["tasks"] += 1
+        host["processed_entries"] += row["processed_entries"]
+        host["busy"] += row["duration"] or 0.
+        for s in samples.get(task, []):
+            host["points"].append(((s["time"] - t0).total_seconds(), s["net_read"]))
+        if row["start"] is not None:
+            host["start"] = row["start"] if host["start"] is None else min(host["start"], row["start"])
+            host["end"] = row["end"] if host["end"] is None else max(host["end"], row["end"])
+    for host in per_host.values():
+        host["points"].sort()
+        span = host["end"] - host["start"] if host["start"] is not None and host["end"] > host["start"] else None
+        host["entries_per_second"] = host["processed_entries"] / span if span else None
+        host["net_mb_per_second"] = _rate(host["points"])
+
+    durations = [row["duration"] for row in per_task.values() if row["duration"]]
+    median = statistics.median(durations) if durations else 0.
+    stragglers = sorted((task for task, row in per_task.items() if row["duration"] and row["duration"] > straggler_factor * median),
+                        key=lambda task: -per_task[task]["duration"])
+    return per_task, per_host, stragglers, t0
+
+def _cell(value, fmt="{:.2f}"):
+    if value is None:
+        return "-"
+    return fmt.format(value) if isinstance(value, float) else str(value)
+
+def _table(header, rows):
+    html = "<table>\n<tr>" + "".join("<th>{}</th>".format(h) for h in header) + "</tr>\n"
+    for row in rows:
+        html += "<tr>" + "".join("<td>{}</td>".format(_cell(v)) for v in row) + "</tr>\n"
+    return html + "</table>\n"
+
+def _timeline_svg(per_task, stragglers, width=900, row_height=12):
+    # one bar per task from its first sample: setup + RDataFrame creation, then event loop
+    tasks = [task for task in sorted(per_task) if per_task[task]["start"] is not None]
+    if not tasks:
+        return "<p>no samples</p>\n"
+    end = max(per_task[t]["start"] + (per_task[t]["duration"] or 0.) for t in tasks)
+    scale = (width - 60) / end if end > 0 else 1.
+    svg = '<svg width="{}" height="{}" font-size="9">\n'.format(width, row_height * len(tasks) + 20)
+    for n, task in enumerate(tasks):
+        row = per_task[task]
+        y = n * row_height
+        x = 50 + row["start"] * scale
+        setup = (row["runtime_setup"] or 0.) + (row["runtime_rdf_creation"] or 0.)
+        loop = row["runtime_event_loop"] if row["runtime_event_loop"] is not None else row["duration"] or 0.
+        color = "#d62728" if task in stragglers else "#1f77b4"
+        svg += '<text x="0" y="{}">task {}</text>\n'.format(y + row_height - 3, task)
+        svg += '<rect x="{:.1f}" y="{}" width="{:.1f}" height="{}" fill="#ff7f0e"/>\n'.format(x, y + 1, setup * scale, row_height - 2)
+        svg += '<rect x="{:.1f}" y="{}" width="{:.1f}" height="{}" fill="{}"/>\n'.format(x + setup * scale, y + 1, loop * scale, row_height - 2, color)
+    svg += '<text x="50" y="{}">0 s</text><text x="{}" y="{}">{:.0f} s</text>\n'.format(row_height * len(tasks) + 15, width - 40, row_height * len(tasks) + 15, end)
+    return svg + "</svg>\n"
+
+def _run_html(per_task, per_host, stragglers, t0):
+    total_entries = sum(row["processed_entries"] for row in per_task.values())
+    mapper = sum(row["runtime_mapper"] or 0. for row in per_task.values())
+    setup = sum((row["runtime_setup"] or 0.) + (row["runtime_rdf_creation"] or 0.) for row in per_task.values())
+    html = "<h1>Run started {}</h1>\n".format(t0 if t0 is not None else "- (tasks without samples)")
+    html += "<p>{} tasks, {} hosts, {} entries; setup overhead {:.1f}% of the task time</p>\n".format(
+        len(per_task), len(per_host), total_entries, 100. * setup / mapper if mapper else 0.)
+    html += "<h2>Timeline</h2>\n<p>orange: setup and RDataFrame creation, blue: event loop, red: stragglers (more than {} times the median task)</p>\n".format(straggler_factor)
+    html += _timeline_svg(per_task, stragglers)
+    html += "<h2>Stragglers</h2>\n"
+    html += _table(["task", "host", "duration [s]", "entries", "entries/s", "net [MB/s]"],
+                   [[task, per_task[task]["hostname"], per_task[task]["duration"], per_task[task]["processed_entries"],
+                     per_task[task]["entries_per_second"], per_task[task]["net_mb_per_second"]] for task in stragglers]) if stragglers else "<p>none</p>\n"
+    html += "<h2>Hosts</h2>\n"
+    html += _table(["host", "tasks", "entries", "entries/s", "busy [s]", "net [MB/s]"],
+                   [[name, h["tasks"], h["processed_entries"], h["entries_per_second"], h["busy"], h["net_mb_per_second"]] for name, h in sorted(per_host.items())])
+    html += "<h2>Tasks</h2>\n"
+    html += _table(["task", "host", "entries", "mapper [s]", "setup [s]", "rdf creation [s]", "event loop [s]", "setup fraction", "entries/s", "cpu [%]", "peak RSS [MB]", "net [MB/s]"],
+                   [[task, r["hostname"], r["processed_entries"], r["runtime_mapper"], r["runtime_setup"], r["runtime_rdf_creation"], r["runtime_event_loop"],
+                     r.get("setup_fraction"), r["entries_per_second"], r["cpu_percent"], r["peak_rss_mb"], r["net_mb_per_second"]] for task, r in sorted(per_task.items())])
+    return html
+
+def write_html(filename, directory, runs):
+    """runs: [(per task, per host, stragglers, t0), ...]"""
+    html = "<html><head><title>DistRDF monitoring: {0}</title><style>td, th {{padding: 2px 8px; text-align: right}}</style></head><body>\n".format(directory)
+    html += "<p>DistRDF monitoring of {}: {} runs</p>\n".format(directory, len(runs))
+    for run in runs:
+        html += _run_html(*run)
+    html += "</body></html>\n"
+    with open(filename, "w") as f:
+        f.write(html)
+
+def write_png(filename, per_task, per_host):
+    # one run
+    import ROOT
+    ROOT.gROOT.SetBatch(True)
+    tasks = sorted(task for task in per_task if per_task[task]["start"] is not None)
+    c = ROOT.TCanvas("c", "", 1200, 900)
+    c.Divide(1, 2)
+
+    c.cd(1)
+    # timeline: one horizontal bar per task
+    end = max(per_task[t]["start"] + (per_task[t]["duration"] or 0.) for t in tasks) if tasks else 1.
+    c.cd(1).DrawFrame(0., -0.5, end * 1.02, len(tasks) - 0.5, "Tasks;seconds from the first sample;task")
+    boxes = []
+    for n, task in enumerate(tasks):
+        row = per_task[task]
+        setup = (row["runtime_setup"] or 0.) + (row["runtime_rdf_creation"] or 0.)
+        for start, length, color in ((row["start"], setup, ROOT.kOrange + 1), (row["start"] + setup, row["runtime_event_loop"] or 0., ROOT.kAzure + 1)):
+            box = ROOT.TBox(start, n - 0.4, start + length, n + 0.4)
+            box.SetFillColor(color)
+            box.Draw()
+            boxes.append(box)
+
+    c.cd(2)
+    # network rate of each host between consecutive samples
+    graphs = ROOT.TMultiGraph("net", "Network;seconds from the first sample;MB/s")
+    for n, (name, host) in enumerate(sorted(per_host.items())):
+        g = ROOT.TGraph()
+        g.SetTitle(name)
+        g.SetLineColor(n + 1)
+        points = host["points"]
+        for (t1, v1), (t2, v2) in zip(points, points[1:]):
+            if t2 > t1:
+                g.AddPoint(t2, (v2 - v1) / 1024. / 1024. / (t2 - t1))
+        graphs.Add(g, "L")
+    graphs.Draw("A")
+    c.cd(2).BuildLegend()
+    c.SaveAs(filename)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report of the distrdf_monitor/distrdf_runtime csv files of a run")
+    parser.add_argument("directory")
+    parser.add_argument("--output", default="distrdf_report.html")
+    parser.add_argument("--png", help="draw the timeline and the network rate with ROOT")
+    args = parser.parse_args()
+
+    tasks = read_runtime(args.directory)
+    samples = read_monitor(args.directory)
+    if not tasks and not samples:
+        print("no distrdf_runtime/distrdf_monitor csv files in {}".format(args.directory))
+        raise SystemExit(1)
+    runs = []
+    for run in split_runs(tasks, samples):
+        runs.append(analyse({t: tasks[t] for t in run if t in tasks}, {t: samples[t] for t in run if t in samples}))
+        per_task, per_host, stragglers, t0 = runs[-1]
+        print("run {}: {} tasks on {} hosts, {} stragglers".format(t0, len(per_task), len(per_host), len(stragglers)))
+    write_html(args.output, args.directory, runs)
+    print("report: {}".format(args.output))
+    if args.png:
+        # the last run
+        write_png(args.png, runs[-1][0], runs[-1][1])
@@ -1,11 +0,0 @@
-mkdir -p /shared/home/cms/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/
-
-mv /opt/workspace/persistent-storage/work/workshop2025_demo/RDataFrame/VBS/AF4D5462-30E8-EA43-AA8A-A1EADA9796BC.root /shared/home/cms/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/
-
-mkdir -p /shared/home/cms/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/
-
-mv /opt/workspace/persistent-storage/work/workshop2025_demo/RDataFrame/VBS/936C5557-15D6-B74C-9260-582B71C8B1C3.root /shared/home/cms/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/
-
-mkdir -p /shared/home/cms/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/
-
-mv /opt/workspace/persistent-storage/work/workshop2025_demo/RDataFrame/VBS/ABA8AAB6-89A8-2A4D-B574-82CB4162656E.root /shared/home/cms/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/
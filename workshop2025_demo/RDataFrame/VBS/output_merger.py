@@ -0,0 +1,202 @@
+#!/opt/conda/bin/python3
+
+# Background merger of the distributed Snapshot outputs.
+#
+# Every DistRDF task writes its own <name>_<task>.root, so a run leaves hundreds
+# of small files that every later read has to open one by one. The tasks write
+# them to a node-local buffer directory; a thread of the driver has the
+# completed ones merged while the graph is still running, into
+# <name>_merged_<node>_<k>.root files of about target_bytes each:
+#  - TFileMerger in fast mode: the baskets are copied as they are, without
+#    decompressing and recompressing them, so the clusters of the inputs are
+#    kept and a merge costs about the time to copy the bytes,
+#  - a file is merged only once it is complete (closed by its task, it opens
+#    without recovery), the parts are deleted after a successful merge.
+# With a Dask client the buffer is not read by the driver: every pass submits
+# one scan task to one worker of each node (the workers of a node share its
+# buffer), which merges the parts of that node into the destination, a
+# directory shared by the nodes or a URL; the driver only collects the names.
+# A scan task has a higher priority than the DistRDF tasks, so that it runs as
+# soon as a thread of its worker is free, and takes that thread while it merges. Without a client (local
+# run, or by hand) the driver scans the buffer itself and <node> is empty.
+# The list of merged files of each output is written to <name>_merged.txt, the
+# postselection reads its chain from there.
+#
+# usage in the preselection:
+#     merger = OutputMerger(buffer_dir, ["preselectionUL", ...], destination="./", client=client)
+#     merger.start()
+#     RunGraphs(proxies)
+#     merged = merger.finish()
+# or by hand on the parts of a finished run:
+#     python3 output_merger.py [--target-gb 2] [--destination dir] buffer_dir name [name ...]
+
+import os
+import re
+import sys
+import threading
+import time
+
+target_bytes = 2 * 1024**3
+poll_seconds = 30
+# Dask priority of the scan tasks, the DistRDF tasks have 0
+scan_priority = 100
+
+def parts(directory, name):
+    """{task: path} of the <name>_<task>.root files in directory"""
+    pattern = re.compile(re.escape(name) + r"_(\d+)\.root$")
+    result = {}
+    for entry in os.listdir(directory):
+        match = pattern.match(entry)
+        if match:
+            result[int(match.group(1))] = os.path.join(directory, entry)
+    return result
+
+def is_complete(path, treename="Events", settle_seconds=poll_seconds):
+    # a file still being written has a recent mtime and needs recovery to be opened
+    if time.time() - os.path.getmtime(path) < settle_seconds:
+        return False
+    import ROOT
+    f = ROOT.TFile.Open(path)
+    if not f or f.IsZombie():
+        return False
+    complete = not f.TestBit(ROOT.TFile.kRecovered) and bool(f.Get(treename))
+    f.Close()
+    return complete
+
+def merge(inputs, output):
+    """fast merge (baskets copied without recompression) of inputs into output, True on success"""
+    import ROOT
+    merger = ROOT.TFileMerger(False, False)
+    merger.SetFastMethod(True)
+    merger.SetPrintLevel(0)
+    for path in inputs:
+        if not merger.AddFile(path, False):
+            return False
+    if not merger.OutputFile(output, "RECREATE"):
+        return False
+    return merger.Merge()
+
+def output_path(destination, name, tag, k):
+    output = "{}_merged_{}{}.root".format(name, tag, k)
+    if "://" in destination:
+        return destination.rstrip("/") + "/" + output
+    return os.path.join(destination, output)
+
+def scan(directory, names, destination, counts, target_bytes=target_bytes, settle_seconds=poll_seconds, treename="Events", final=False, tag=""):
+    """merge the complete parts of names in directory, below target_bytes only if final; returns {name: [merged files]}
+
+    counts: {name: number of files already merged with this tag}, the new ones are numbered from there
+    """
+    merged = {name: [] for name in names}
+
+    def flush(name, inputs):
+        output = output_path(destination, name, tag, counts.get(name, 0) + len(merged[name]))
+        if not merge(inputs, output):
+            # the parts are kept, they are retried at the next pass or read as they are
+            print("output merger: merging {} files into {} failed".format(len(inputs), output))
+            return
+        print("output merger: {} files -> {}".format(len(inputs), output))
+        merged[name].append(output)
+        for path in inputs:
+            os.remove(path)
+
+    for name in names:
+        pending = []
+        size = 0
+        for _, path in sorted(parts(directory, name).items()):
+            if not is_complete(path, treename, settle_seconds):
+                continue
+            pending.append(path)
+            size += os.path.getsize(path)
+            if size >= target_bytes:
+                flush(name, pending)
+                pending = []
+                size = 0
+        if final and pending:
+            flush(name, pending)
+    return merged
+
+class OutputMerger(threading.Thread):
+    """merge the <name>_<task>.root parts in directory (on every node with a Dask client) into <name>_merged_<node>_<k>.root files in destination"""
+
+    def __init__(self, directory, names, destination="./", target_bytes=target_bytes, poll_seconds=poll_seconds, treename="Events", client=None):
+        threading.Thread.__init__(self, daemon=True)
+        self.directory = directory
+        self.names = names
+        self.destination = destination
+        self.target_bytes = target_bytes
+        self.poll_seconds = poll_seconds
+        self.treename = treename
+        self.client = client
+        self.merged = {name: [] for name in names}
+        # {node tag: {name: number of merged files}}
+        self.counts = {}
+        self.stop = threading.Event()
+
+    def nodes(self):
+        """{node tag: address of one of its workers}, {"": None} without a client"""
+        if self.client is None:
+            return {"": None}
+        nodes = {}
+        for address, info in sorted(self.client.scheduler_info()["workers"].items()):
+            nodes.setdefault(re.sub(r"\W", "_", info["host"]) + "_", address)
+        return nodes
+
+    def scan(self, final=False):
+        """one scan of the buffer of every node, the merged files are added to self.merged"""
+        settle_seconds = 0 if final else self.poll_seconds
+        results = {}
+        futures = {}
+        for tag, address in self.nodes().items():
+            args = (self.directory, self.names, self.destination, self.counts.get(tag, {}), self.target_bytes, settle_seconds, self.treename, final, tag)
+            if address is None:
+                results[tag] = scan(*args)
+            else:
+                # before the mapper tasks queued on that worker: the first thread that frees up merges
+                futures[tag] = self.client.submit(scan, *args, workers=[address], allow_other_workers=False, pure=False, priority=scan_priority)
+        for tag, future in futures.items():
+            try:
+                results[tag] = future.result()
+            except Exception as e:
+                # the parts of that node are kept and retried at the next pass
+                print("output merger: scan of node {} failed: {}".format(tag.rstrip("_"), e))
+        for tag, result in results.items():
+            counts = self.counts.setdefault(tag, {})
+            for name, merged in result.items():
+                counts[name] = counts.get(name, 0) + len(merged)
+                self.merged[name] += merged
+
+    def run(self):
+        while not self.stop.wait(self.poll_seconds):
+            self.scan()
+
+    def finish(self):
+        """stop the thread, merge what is left and write the <name>_merged.txt lists; returns {name: [merged files]}"""
+        self.stop.set()
+        if self.is_alive():
+            self.join()
+        self.scan(final=True)
+        for name, merged in self.merged.items():
+            with open(name + "_merged.txt", "w") as f:
+                for path in merged:
+                    f.write(os.path.basename(path) + "\n")
+        return self.merged
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    destination = "./"
+    if "--target-gb" in args:
+        i = args.index("--target-gb")
+        target_bytes = int(float(args[i + 1]) * 1024**3)
+        del args[i:i + 2]
+    if "--destination" in args:
+        i = args.index("--destination")
+        destination = args[i + 1]
+        del args[i:i + 2]
+    if len(args) < 2:
+        print("Usage: python3 output_merger.py [--target-gb 2] [--destination dir] <buffer_dir> <name> [name ...]")
+        sys.exit(1)
+
+    merger = OutputMerger(args[0], args[1:], destination, target_bytes)
+    for name, merged in merger.finish().items():
+        print("{}: {} merged files".format(name, len(merged)))
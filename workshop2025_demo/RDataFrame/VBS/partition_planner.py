@@ -0,0 +1,139 @@
+#!/opt/conda/bin/python3
+
+# Number of partitions and file order for the Distributed RDataFrame, from the
+# entries and the cluster layout of the input files instead of the fixed
+# "3*Nworkers" rule.
+#
+# DistRDF gives every task the same fraction of the list of files: with N files
+# and P partitions task i reads the files in [i*N/P, (i+1)*N/P), a file cut in
+# the middle being split at the cluster closest to that fraction of its
+# entries. With files of very different sizes some tasks get many more events
+# than others and the slowest of them sets the wall time. The planner
+#  - estimates the duration of the whole run from entries and bytes and picks
+#    the number of partitions giving tasks of about target_seconds,
+#  - orders the files so that these slices have about the same cost: files are
+#    placed from the largest, each in the free position that keeps the most
+#    loaded task the lowest.
+#
+# The metadata of each file (entries, clusters, bytes) comes from the chain
+# index (chain_index.py): only the files not indexed yet are opened.
+#
+# usage: python3 partition_planner.py chain.txt [target_seconds]
+
+import math
+import sys
+
+import chain_index
+
+# cost model of a task, tune it on the distrdf_runtime csv of a previous run
+seconds_per_event = 2.e-3
+bytes_per_second = 50.e6
+target_seconds = 300.
+
+def read_metadata(files, index=chain_index.index_file, treename="Events"):
+    """{file: metadata} of the files that could be opened"""
+    conn = chain_index.open_index(index)
+    chain_index.update(conn, files, treename)
+    meta = chain_index.metadata(conn, files)
+    conn.close()
+    return meta
+
+def task_seconds(meta):
+    return meta["entries"] * seconds_per_event + meta["zip_bytes"] / bytes_per_second
+
+def slices(nfiles, npartitions):
+    """[(task, fraction of the file read by task), ...] for each position in the list of files"""
+    step = float(nfiles) / npartitions
+    result = []
+    for j in range(nfiles):
+        overlaps = []
+        i = min(int(j / step), npartitions - 1)
+        while i < npartitions and i * step < j + 1:
+            overlaps.append((i, min(j + 1, (i + 1) * step) - max(j, i * step)))
+            i += 1
+        result.append(overlaps)
+    return result
+
+def balanced_order(files, costs, npartitions, samples=None):
+    """files ordered so that the slices DistRDF gives to the npartitions tasks have about the same cost
+
+    samples: sizes of the consecutive blocks of files that must stay together (the samples of an
+    RDatasetSpec), the files are only moved inside their block
+    """
+    positions = slices(len(files), npartitions)
+    tasks = [0.] * npartitions
+    block = {}
+    free = []
+    start = 0
+    for n, size in enumerate(samples or [len(files)]):
+        for path in files[start:start + size]:
+            block[path] = n
+        free.append(set(range(start, start + size)))
+        start += size
+    order = [None] * len(files)
+    for path in sorted(files, key=lambda path: -costs[path]):
+        cost = costs[path]
+        candidates = free[block[path]]
+        best = min(candidates, key=lambda j: max(tasks[i] + w * cost for i, w in positions[j]))
+        candidates.remove(best)
+        order[best] = path
+        for i, w in positions[best]:
+            tasks[i] += w * cost
+    return order
+
+def plan(files, target_seconds=target_seconds, min_partitions=1, index=chain_index.index_file, treename="Events"):
+    """(ordered files, npartitions) for RDataFrame(treename, files, npartitions=npartitions)"""
+    ordered, npartitions = plan_samples([files], target_seconds, min_partitions, index, treename)
+    return ordered[0], npartitions
+
+def plan_samples(samples, target_seconds=target_seconds, min_partitions=1, index=chain_index.index_file, treename="Events"):
+    """([ordered files of each sample], npartitions) for a RDatasetSpec with one RSample per list of files"""
+    meta = read_metadata([path for files in samples for path in files], index, treename)
+    samples = [[path for path in files if path not in meta or meta[path]["entries"] > 0] for files in samples]
+    files = [path for files in samples for path in files]
+    # TTree and RNTuple inputs are both read by RDataFrame, not in the same dataset
+    formats = set(meta[path]["format"] for path in files if path in meta)
+    if len(formats) > 1:
+        raise RuntimeError("inputs mix the formats {}".format(", ".join(sorted(formats))))
+    costs = {path: task_seconds(meta[path]) for path in files if path in meta}
+    # files that could not be opened are left to RDataFrame, with the average cost
+    average = sum(costs.values()) / len(costs) if costs else 1.
+    for path in files:
+        costs.setdefault(path, average)
+    clusters = sum(len(meta[path]["clusters"]) if path in meta else 1 for path in files)
+
+    # a task cannot be smaller than a cluster
+    npartitions = int(math.ceil(sum(costs.values()) / target_seconds))
+    npartitions = max(1, min(max(npartitions, min_partitions), clusters))
+
+    ordered = balanced_order(files, costs, npartitions, [len(f) for f in samples])
+    result = []
+    for f in samples:
+        result.append(ordered[:len(f)])
+        ordered = ordered[len(f):]
+    return result, npartitions
+
+def describe(files, npartitions, index=chain_index.index_file, treename="Events"):
+    # entries per task, for the DistRDF split in equal fractions of the list of files
+    meta = read_metadata(files, index, treename)
+    tasks = [0.] * npartitions
+    for path, overlaps in zip(files, slices(len(files), npartitions)):
+        for i, w in overlaps:
+            tasks[i] += w * meta[path]["entries"] if path in meta else 0.
+    return tasks
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 partition_planner.py <chain.txt> [target_seconds]")
+        sys.exit(1)
+    chain_file = sys.argv[1]
+    if len(sys.argv) > 2:
+        target_seconds = float(sys.argv[2])
+    files = chain_index.read_chain(chain_file)
+
+    ordered, npartitions = plan(files, target_seconds)
+    before = describe([path for path in files if path in ordered], npartitions)
+    after = describe(ordered, npartitions)
+    print("{} files, {} partitions".format(len(ordered), npartitions))
+    print("entries per task, planned order: min {:.0f}, max {:.0f}, mean {:.0f}".format(min(after), max(after), sum(after) / len(after)))
+    print("entries per task, chain order:   min {:.0f}, max {:.0f}".format(min(before), max(before)))
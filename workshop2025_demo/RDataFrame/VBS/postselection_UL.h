@@ -16,7 +16,10 @@
 #include "TLatex.h"
 #include "Math/Vector4D.h"
 #include "TStyle.h"
+#include <algorithm>
+#include <array>
 #include <map>
+#include <vector>
 
 #include "TDavixFile.h"
 
@@ -113,7 +116,7 @@ const string vsMuwp = "Tight";
 //const string remote_storage = "https://ttedesch.web.cern.ch/ttedesch/nanoAOD-tools_UL/python/postprocessing/";
 const string remote_storage = "https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/python/postprocessing/";
 
-TFile *TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017 = TFile::Open(TString(remote_storage) + TString("data/tauSF/TauID_SF_pt_") + TString("DeepTau2017v2p1VSjet") + TString("_") + TString("UL2017") + TString(".root"));
+TFile *TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("data/tauSF/TauID_SF_pt_") + TString("DeepTau2017v2p1VSjet") + TString("_") + TString("UL2017") + TString(".root")));
 TString path_down = TString(TString(vsJetwp) + TString("_down"));
 TString path_cent = TString(TString(vsJetwp) + TString("_cent"));
 TString path_up = TString(TString(vsJetwp) + TString("_up"));
@@ -121,24 +124,24 @@ TF1 * TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_down = (TF1*)TauID_SF_pt_DeepTau
 TF1 * TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_cent =  (TF1*)TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017->Get(path_cent);
 TF1 * TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_up =  (TF1*)TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017->Get(path_up);
 
-TFile *TauID_SF_eta_DeepTau2017v2p1VSe_UL2017 = TFile::Open(TString(remote_storage) + TString("data/tauSF/TauID_SF_eta_") + TString("DeepTau2017v2p1VSe") + TString("_") + TString("UL2017") + TString(".root"));
+TFile *TauID_SF_eta_DeepTau2017v2p1VSe_UL2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("data/tauSF/TauID_SF_eta_") + TString("DeepTau2017v2p1VSe") + TString("_") + TString("UL2017") + TString(".root")));
 TString histoname_ele = TString(vsElewp);
 TH1F * TauID_SF_eta_DeepTau2017v2p1VSe_UL2017_hist = (TH1F *) TauID_SF_eta_DeepTau2017v2p1VSe_UL2017->Get(histoname_ele);
 
-TFile *TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017 = TFile::Open(TString(remote_storage) + TString("data/tauSF/TauID_SF_eta_") + TString("DeepTau2017v2p1VSmu") + TString("_") + TString("2017ReReco") + TString(".root"));
+TFile *TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("data/tauSF/TauID_SF_eta_") + TString("DeepTau2017v2p1VSmu") + TString("_") + TString("2017ReReco") + TString(".root")));
 TString histoname_mu = TString(vsMuwp);
 TH1F * TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017_hist = (TH1F *) TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017->Get(histoname_mu);
 
-TFile *TauES_dm_DeepTau2017v2p1VSjet_UL2017 = TFile::Open(TString(remote_storage) + TString("data/tauSF/TauES_dm_") + TString("DeepTau2017v2p1VSjet") + TString("_") + TString("UL2017") +  TString(".root"));        
+TFile *TauES_dm_DeepTau2017v2p1VSjet_UL2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("data/tauSF/TauES_dm_") + TString("DeepTau2017v2p1VSjet") + TString("_") + TString("UL2017") +  TString(".root")));        
 TH1F * TauES_dm_DeepTau2017v2p1VSjet_UL2017_hist_low = (TH1F *) TauES_dm_DeepTau2017v2p1VSjet_UL2017->Get("tes");
 
-TFile *TauES_dm_DeepTau2017v2p1VSjet_UL2017_ptgt100 = TFile::Open(TString(remote_storage) + TString("data/tauSF/TauES_dm_") + TString("DeepTau2017v2p1VSjet") + TString("_") + TString("2017ReReco") + TString("_ptgt100.root"));
+TFile *TauES_dm_DeepTau2017v2p1VSjet_UL2017_ptgt100 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("data/tauSF/TauES_dm_") + TString("DeepTau2017v2p1VSjet") + TString("_") + TString("2017ReReco") + TString("_ptgt100.root")));
 TH1F * TauES_dm_DeepTau2017v2p1VSjet_UL2017_ptgt100_hist_high = (TH1F *) TauES_dm_DeepTau2017v2p1VSjet_UL2017_ptgt100->Get("tes");
 
-TFile *TauFES_eta_dm_DeepTau2017v2p1VSe_UL2017 = TFile::Open(TString(remote_storage) + TString("data/tauSF/TauFES_eta-dm_") + TString("DeepTau2017v2p1VSe") + TString("_") + TString("2017")  + TString("ReReco") + TString(".root"));
+TFile *TauFES_eta_dm_DeepTau2017v2p1VSe_UL2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("data/tauSF/TauFES_eta-dm_") + TString("DeepTau2017v2p1VSe") + TString("_") + TString("2017")  + TString("ReReco") + TString(".root")));
 TGraphAsymmErrors * TauFES_eta_dm_DeepTau2017v2p1VSe_UL2017_graph = (TGraphAsymmErrors *) TauFES_eta_dm_DeepTau2017v2p1VSe_UL2017->Get("fes");
 
-TFile *Btag_eff_UL2017 = TFile::Open(TString(remote_storage) + TString("Btag_eff_") + TString("UL2017") + TString(".root"));
+TFile *Btag_eff_UL2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString("Btag_eff_") + TString("UL2017") + TString(".root")));
 TEfficiency *eff_b = (TEfficiency *) Btag_eff_UL2017->Get("h2_BTaggingEff_b");
 TH2F *Btag_eff_UL2017_h_b = (TH2F *) eff_b->CreateHistogram();
 TEfficiency *eff_c = (TEfficiency *) Btag_eff_UL2017->Get("h2_BTaggingEff_c");
@@ -210,36 +213,45 @@ bool atleast2GoodJets(rvec_i GoodJets_idx){
 }
 
 
+// four-momentum of a good jet, computed once per event by SelectVBSJets_invmass
+struct JetP4 {
+    size_t idx;
+    float eta;
+    double px, py, pz, e;
+};
+
 RVec<size_t> SelectVBSJets_invmass(rvec_f pt, rvec_f eta, rvec_f phi, rvec_f mass, rvec_i GoodJets_idx)
 {
-    
-    RVec<size_t> idx;
-    // Find first lepton pair with invariant mass closest to Z mass
-    auto idx_cmb = Combinations(GoodJets_idx, 2);
-    //auto best_mass = -1.;
-    float best_mass = -1.;
+    // Find the pair with the largest invariant mass among the ones with |deta| >= DELTAETA_JJ_CUT:
+    // the jets are turned into (px, py, pz, E) once and the pairs compared by m2, the same order as m
+    // (m < 0 is -sqrt(-m2) for PtEtaPhiMVector). The buffer is kept by the thread, no allocation per event.
+    thread_local std::vector<JetP4> jets;
+    jets.clear();
+    for (auto j : GoodJets_idx) {
+        const double p = pt[j], m = mass[j];
+        const double px = p*cos(phi[j]), py = p*sin(phi[j]), pz = p*sinh(eta[j]);
+        const double e2 = px*px + py*py + pz*pz + (m >= 0 ? m*m : -m*m);
+        jets.push_back({size_t(j), eta[j], px, py, pz, e2 > 0 ? sqrt(e2) : 0.});
+    }
+
+    // m > -1 as the best_mass = -1 of the selection with m
+    double best_m2 = -1.;
     size_t best_i1 = 0; size_t best_i2 = 0;
-    for (size_t i = 0; i < idx_cmb[0].size(); i++) {
-        const auto i1 = idx_cmb[0][i];
-        const auto i2 = idx_cmb[1][i];
-        //cout<<i1<<i2<<endl;
-        if (abs(eta[GoodJets_idx[i1]] - eta[GoodJets_idx[i2]]) >= DELTAETA_JJ_CUT) {
-            ROOT::Math::PtEtaPhiMVector p1(pt[GoodJets_idx[i1]], eta[GoodJets_idx[i1]], phi[GoodJets_idx[i1]], mass[GoodJets_idx[i1]]);
-            ROOT::Math::PtEtaPhiMVector p2(pt[GoodJets_idx[i2]], eta[GoodJets_idx[i2]], phi[GoodJets_idx[i2]], mass[GoodJets_idx[i2]]);
-            //const auto this_mass = (p1 + p2).M();
-            float this_mass = (p1 + p2).M();
-            //cout<<this_mass<<endl;
-            if (this_mass > best_mass) {
-                best_mass = this_mass;
-                best_i1 = GoodJets_idx[i1];
-                best_i2 = GoodJets_idx[i2];
+    for (size_t i1 = 0; i1 < jets.size(); i1++) {
+        const auto &j1 = jets[i1];
+        for (size_t i2 = i1 + 1; i2 < jets.size(); i2++) {
+            const auto &j2 = jets[i2];
+            if (abs(j1.eta - j2.eta) < DELTAETA_JJ_CUT) continue;
+            const double e = j1.e + j2.e, px = j1.px + j2.px, py = j1.py + j2.py, pz = j1.pz + j2.pz;
+            const double this_m2 = e*e - px*px - py*py - pz*pz;
+            if (this_m2 > best_m2) {
+                best_m2 = this_m2;
+                best_i1 = j1.idx;
+                best_i2 = j2.idx;
             }
         }
-    } 
-    //cout<<"best "<<best_i1<<best_i2<<best_mass;
-    idx.emplace_back(best_i1);
-    idx.emplace_back(best_i2);
-    return idx;
+    }
+    return {best_i1, best_i2};
 }
 
 float GetInvMass(rvec_f pt, rvec_f eta, rvec_f phi, rvec_f mass, rvec_i VBSJets_idx)
@@ -783,116 +795,78 @@ int IsGenMatched(int i, int j){
     else return 0;
 }
 
-RVec<RVec<float>> getTauSF(float SelectedTau_pt, float SelectedTau_eta, int SelectedTau_genPartFlav, bool IsMC, string year){
-    RVec<float> vsJet, vsEle, vsMu;
-    if (IsMC == false){
-        vsJet.emplace_back(1.0);
-        vsJet.emplace_back(1.0);
-        vsJet.emplace_back(1.0);
-        vsEle.emplace_back(1.0);
-        vsEle.emplace_back(1.0);
-        vsEle.emplace_back(1.0);
-        vsMu.emplace_back(1.0);
-        vsMu.emplace_back(1.0);
-        vsMu.emplace_back(1.0);
-        
-        
+// TF1 of a tau ID SF vs pt sampled at init on a uniform grid of its range: linear interpolation
+// in the cells where it reproduces the function at the midpoint, TF1::Eval in the other cells
+// (the steps of the pt bins) and out of the range
+struct TF1Table {
+    TF1 *f;
+    double xmin, xmax, step;
+    std::vector<double> y;
+    std::vector<char> exact;
+
+    TF1Table(TF1 *f_, int ncells = 4000, double tolerance = 1e-6) : f(f_), xmin(f_->GetXmin()), xmax(f_->GetXmax()), step((xmax - xmin)/ncells), y(ncells + 1), exact(ncells){
+        for (int i = 0; i <= ncells; i++) y[i] = f->Eval(xmin + i*step);
+        for (int i = 0; i < ncells; i++) exact[i] = abs(f->Eval(xmin + (i + 0.5)*step) - 0.5*(y[i] + y[i+1])) > tolerance;
     }
-    
-    else{
-        string id;
-        //std::string year = std::to_string(2017);
-        // vs Jet
-        id =  "DeepTau2017v2p1VSjet";
-        //TString path = TString(remote_storage) + TString("data/tauSF/TauID_SF_pt_") + TString(id) + TString("_") + TString(year) + TString("ReReco") + TString(".root");
-        //TFile *f = new TFile(path);
-        //TFile *f =  TauID_SF_pt_DeepTau2017v2p1VSjet_2017ReReco;
-        //else if (year == "2017") TFile *f =  TauID_SF_pt_DeepTau2017v2p1VSjet_2018ReReco;
-        //TFile *f = TFile::Open(path);
-        //TFile *f = new TFile();
-        double_t pt = SelectedTau_pt;
-        if (SelectedTau_genPartFlav==5){
-            //TString path_down = TString(TString(vsJetwp) + TString("_down"));
-            //TString path_cent = TString(TString(vsJetwp) + TString("_cent"));
-            //TString path_up = TString(TString(vsJetwp) + TString("_up"));
-            //TF1 * h_down = (TF1*)f->Get(path_down);
-            //TF1 * h_cent =  (TF1*)f->Get(path_cent);
-            //TF1 * h_up =  (TF1*)f->Get(path_up);
-            //vsJet.emplace_back(h_down->Eval(pt));
-            //vsJet.emplace_back(h_cent->Eval(pt));
-            //vsJet.emplace_back(h_up->Eval(pt));
-            vsJet.emplace_back(TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_down->Eval(pt));
-            vsJet.emplace_back(TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_cent->Eval(pt));
-            vsJet.emplace_back(TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_up->Eval(pt));
-        }
-        else{
-            vsJet.emplace_back(1.0);
-            vsJet.emplace_back(1.0);
-            vsJet.emplace_back(1.0);
-        }
 
-        int bin;
-        float sf, err;
-        float eta = abs(SelectedTau_eta);  
-
-        // vs ele
-        id = "DeepTau2017v2p1VSe";
-        //TString path_ele =  TString(remote_storage) + TString("data/tauSF/TauID_SF_eta_") + TString(id) + TString("_") + TString(year) + TString("ReReco") + TString(".root");
-        //TFile *f_ele = new TFile(path_ele);
-        //TFile *f_ele = TFile::Open(path_ele);
-
-        //TFile *f_ele = TauID_SF_eta_DeepTau2017v2p1VSe_2017ReReco;
-        //else if(year == "2018") TFile *f_ele = TauID_SF_eta_DeepTau2017v2p1VSe_2018ReReco;
-        //TString histoname_ele = TString(vsElewp);
-        //TH1F * hist = (TH1F *) f_ele->Get(histoname_ele);
-        if (SelectedTau_genPartFlav == 1 || SelectedTau_genPartFlav == 3){
-            //bin = hist->GetXaxis()->FindBin(eta);
-            //sf  = hist->GetBinContent(bin);
-            //err = hist->GetBinError(bin);
-            bin = TauID_SF_eta_DeepTau2017v2p1VSe_UL2017_hist->GetXaxis()->FindBin(eta);
-            sf  = TauID_SF_eta_DeepTau2017v2p1VSe_UL2017_hist->GetBinContent(bin);
-            err = TauID_SF_eta_DeepTau2017v2p1VSe_UL2017_hist->GetBinError(bin);
-            vsEle.emplace_back(sf-err);
-            vsEle.emplace_back(sf);
-            vsEle.emplace_back(sf+err);
-        }
-        else{
-            vsEle.emplace_back(1.0);
-            vsEle.emplace_back(1.0);
-            vsEle.emplace_back(1.0);
-        }
+    double Eval(double x) const {
+        if (!(x >= xmin && x < xmax)) return f->Eval(x);
+        const double u = (x - xmin)/step;
+        const size_t i = u;
+        if (i >= exact.size() || exact[i]) return f->Eval(x);
+        return y[i] + (u - i)*(y[i+1] - y[i]);
+    }
+};
 
-        //vs Mu
-        id = "DeepTau2017v2p1VSmu";
-        //TString path_mu =  TString(remote_storage) + TString("data/tauSF/TauID_SF_eta_") + TString(id) + TString("_") + TString(year)  + TString("ReReco")+ TString(".root");
-        //TFile *f_mu = new TFile(path_mu);
-        //TFile *f_mu = TFile::Open(path_mu);
-        //TFile *f_mu = TauID_SF_eta_DeepTau2017v2p1VSmu_2017ReReco;
-        //else if (year == "2018") TFile *f_mu = TauID_SF_eta_DeepTau2017v2p1VSmu_2018ReReco
-        //TString histoname_mu = TString(vsMuwp);
-        //TH1F * hist_mu = (TH1F *) f_mu->Get(histoname_mu);
-        if (SelectedTau_genPartFlav == 2 || SelectedTau_genPartFlav == 4){
-            //bin = hist_mu->GetXaxis()->FindBin(eta);
-            //sf  = hist_mu->GetBinContent(bin);
-            //err = hist_mu->GetBinError(bin);
-            bin = TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017_hist->GetXaxis()->FindBin(eta);
-            sf  = TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017_hist->GetBinContent(bin);
-            err = TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017_hist->GetBinError(bin);
-            vsMu.emplace_back(sf-err);
-            vsMu.emplace_back(sf);
-            vsMu.emplace_back(sf+err);
-        }
-        else{
-            vsMu.emplace_back(1.0);
-            vsMu.emplace_back(1.0);
-            vsMu.emplace_back(1.0);
+// bins of a tau ID SF vs |eta| as (sf - err, sf, sf + err), under- and overflow included
+struct TH1SFTable {
+    const TAxis *axis;
+    std::vector<std::array<float, 3>> bins;
+
+    TH1SFTable(TH1 *h) : axis(h->GetXaxis()), bins(h->GetNbinsX() + 2){
+        for (size_t b = 0; b < bins.size(); b++) {
+            float sf = h->GetBinContent(b), err = h->GetBinError(b);
+            bins[b] = {sf - err, sf, sf + err};
         }
     }
-    
-    RVec<RVec<float>> result;
-    result.emplace_back(vsJet);
-    result.emplace_back(vsEle);
-    result.emplace_back(vsMu);
+
+    const std::array<float, 3> &operator()(float x) const { return bins[axis->FindFixBin(x)]; }
+};
+
+const TF1Table TauID_SF_vsJet_down(TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_down);
+const TF1Table TauID_SF_vsJet_cent(TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_cent);
+const TF1Table TauID_SF_vsJet_up(TauID_SF_pt_DeepTau2017v2p1VSjet_UL2017_h_up);
+const TH1SFTable TauID_SF_vsEle(TauID_SF_eta_DeepTau2017v2p1VSe_UL2017_hist);
+const TH1SFTable TauID_SF_vsMu(TauID_SF_eta_DeepTau2017v2p1VSmu_UL2017_hist);
+
+// (down, central, up) of the tau ID SF vs jet, vs electron and vs muon:
+// [0-2] vsJet, [3-5] vsEle, [6-8] vsMu, 1 for data and for the taus not matched to the right generator particle
+std::array<float, 9> getTauSF(float SelectedTau_pt, float SelectedTau_eta, int SelectedTau_genPartFlav, bool IsMC, string year){
+    std::array<float, 9> result;
+    result.fill(1.0);
+    if (IsMC == false) return result;
+
+    // vs Jet
+    if (SelectedTau_genPartFlav == 5){
+        double_t pt = SelectedTau_pt;
+        result[0] = TauID_SF_vsJet_down.Eval(pt);
+        result[1] = TauID_SF_vsJet_cent.Eval(pt);
+        result[2] = TauID_SF_vsJet_up.Eval(pt);
+    }
+
+    float eta = abs(SelectedTau_eta);
+
+    // vs ele
+    if (SelectedTau_genPartFlav == 1 || SelectedTau_genPartFlav == 3){
+        const auto &sf = TauID_SF_vsEle(eta);
+        std::copy(sf.begin(), sf.end(), result.begin() + 3);
+    }
+
+    // vs Mu
+    if (SelectedTau_genPartFlav == 2 || SelectedTau_genPartFlav == 4){
+        const auto &sf = TauID_SF_vsMu(eta);
+        std::copy(sf.begin(), sf.end(), result.begin() + 6);
+    }
 
     return result;
 }
@@ -995,636 +969,114 @@ RVec<float> getFES(rvec_f Tau_eta, rvec_i Tau_decayMode, rvec_i Tau_genPartFlav,
 }
 
 
-float efficiency(int flv, float eta, float pt, string year){
+// b-tag efficiency map of one flavour frozen at init: bin edges in pt and |eta| and the
+// efficiencies in a flat array, the jets out of the map take the first or the last bin
+struct BTagEffGrid {
+    std::vector<double> pt_edges, eta_edges;
+    std::vector<float> eff;
 
-    //TString path = TString(remote_storage) + TString("Btag_eff_") + TString(year) + TString(".root");
-    //TFile *infile = new TFile(path);
-    //TFile *infile = TFile::Open(path);
-    TFile *infile = Btag_eff_UL2017;
-    //else if(year =="2018") infile = Btag_eff_2018;
-    TH2F * h;
-    if(flv == 5){
-        //TH2F * h = (TH2F *) infile->Get("h2_BTaggingEff_b")->CreateHistogram();
-        //TEfficiency *eff = (TEfficiency *) infile->Get("h2_BTaggingEff_b");
-        //h = (TH2F *) eff->CreateHistogram();
-        h = Btag_eff_UL2017_h_b;
-        
+    static std::vector<double> edges(const TAxis *axis){
+        std::vector<double> result(axis->GetNbins() + 1);
+        for (int b = 0; b < axis->GetNbins(); b++) result[b] = axis->GetBinLowEdge(b + 1);
+        result.back() = axis->GetBinUpEdge(axis->GetNbins());
+        return result;
     }
-    else if(flv == 4){
-        //TEfficiency *eff = (TEfficiency *) infile->Get("h2_BTaggingEff_c");
-        //h = (TH2F *) eff->CreateHistogram();
-        h = Btag_eff_UL2017_h_c;
+
+    static size_t find(const std::vector<double> &edges, double x){
+        // index of the last lower edge <= x, clamped to the bins
+        size_t b = std::upper_bound(edges.begin(), edges.end(), x) - edges.begin();
+        return std::min(std::max(b, size_t(1)), edges.size() - 1) - 1;
     }
-    else{
-        //h = (TH2F *) infile->Get("h2_BTaggingEff_udsg");
-        //TEfficiency *eff = (TEfficiency *) infile->Get("h2_BTaggingEff_udsg");
-        //h = (TH2F *) eff->CreateHistogram();
-        h = Btag_eff_UL2017_h_udsg;
+
+    BTagEffGrid(TH2F *h) : pt_edges(edges(h->GetXaxis())), eta_edges(edges(h->GetYaxis())){
+        const size_t neta = eta_edges.size() - 1;
+        eff.resize((pt_edges.size() - 1)*neta);
+        for (size_t x = 0; x < pt_edges.size() - 1; x++)
+            for (size_t y = 0; y < neta; y++) eff[x*neta + y] = h->GetBinContent(x + 1, y + 1);
     }
-    
-    int binx = max(1, min(h->GetNbinsX(), h->GetXaxis()->FindBin(pt)));
-    int biny = max(1, min(h->GetNbinsY(), h->GetYaxis()->FindBin(abs(eta))));
-    
-    return h->GetBinContent(binx,biny);
-}
-    
-RVec<float> btagcalc(rvec_i GoodJets_idx, rvec_f Jet_pt, rvec_f Jet_eta, rvec_i Jet_partonFlavour, rvec_f Jet_btagDeepFlavB, rvec_f Jet_btagSF_deepjet_M_up, rvec_f Jet_btagSF_deepjet_M_down, rvec_f Jet_btagSF_deepjet_M, rvec_f Jet_btagDeepB, bool IsMC, string year){
-
-    if (IsMC == false){
-        RVec<float> result_dummy(5);
-        result_dummy[0] = 1.;
-        result_dummy[1] = 1.;
-        result_dummy[2] = 1.;
-        result_dummy[3] = 1.;
-        result_dummy[4] = 1.;
-    
-    return result_dummy;
-    
+
+    float operator()(float pt, float eta) const {
+        return eff[find(pt_edges, pt)*(eta_edges.size() - 1) + find(eta_edges, abs(eta))];
     }
-    
-    string tagger = "DeepFlv"; 
-    string WP = "M";
-    float threshold;
-    //string year = "2017";
-    
+};
+
+const BTagEffGrid Btag_eff_UL2017_b(Btag_eff_UL2017_h_b);
+const BTagEffGrid Btag_eff_UL2017_c(Btag_eff_UL2017_h_c);
+const BTagEffGrid Btag_eff_UL2017_udsg(Btag_eff_UL2017_h_udsg);
+
+float efficiency(int flv, float eta, float pt, const string &year){
+    if(flv == 5) return Btag_eff_UL2017_b(pt, eta);
+    else if(flv == 4) return Btag_eff_UL2017_c(pt, eta);
+    else return Btag_eff_UL2017_udsg(pt, eta);
+}
+
+// tagger and medium working point of btagcalc
+enum BTagger { kDeepFlv, kDeepCSV };
+const BTagger BTAG_CALC_TAGGER = kDeepFlv;
+const float BTAG_CALC_WP_DEEPFLV = 0.2770;
+const float BTAG_CALC_WP_DEEPCSV = 0.4184;
+
+// event b-tag weight p_data/p_MC: [0] central, [1] btag up, [2] btag down, [3] mistag up, [4] mistag down
+// (the SF variation is applied to the b and c jets for btag, to the light jets for mistag)
+std::array<float, 5> btagcalc(rvec_i GoodJets_idx, rvec_f Jet_pt, rvec_f Jet_eta, rvec_i Jet_partonFlavour, rvec_f Jet_btagDeepFlavB, rvec_f Jet_btagSF_deepjet_M_up, rvec_f Jet_btagSF_deepjet_M_down, rvec_f Jet_btagSF_deepjet_M, rvec_f Jet_btagDeepB, bool IsMC, string year){
+
+    std::array<float, 5> result;
+    result.fill(1.);
+    if (IsMC == false) return result;
+
     float p_MC = 1.;
     float p_data = 1.;
     float p_data_btagUp = 1.;
     float p_data_btagDown = 1.;
     float p_data_mistagUp = 1.;
     float p_data_mistagDown = 1.;
-    
-    //map<string, float> WPbtagger = {
-    //    {"DeepFlv_T", 0.7264}, 
-    //    {"DeepFlv_M", 0.2770}, 
-    //    {"DeepFlv_L", 0.0494}, 
-    //    {"DeepCSV_T", 0.7527}, 
-    //    {"DeepCSV_M", 0.4184}, 
-    //    {"DeepCSV_L", 0.1241}
-    //};
-
-
-    for (size_t i = 0; i < GoodJets_idx.size(); i++) {
-        int j = GoodJets_idx[i];
-        
-        if(tagger == "DeepFlv"){
-            //threshold = WPbtagger[tagger + "_" + WP];
-            threshold = 0.2770;
-            if(Jet_btagDeepFlavB[j] >= threshold && Jet_pt[j] > BTAG_PT_CUT && abs(Jet_eta[j])<BTAG_ETA_CUT){
-                p_MC =  p_MC * efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                p_data = p_data * Jet_btagSF_deepjet_M[j] * efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                if (abs(Jet_partonFlavour[j]) == 4 or abs(Jet_partonFlavour[j]) == 5){
-                    p_data_btagUp = p_data_btagUp * Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagUp = p_data_mistagUp * Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_btagDown = p_data_btagDown * Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagDown = p_data_mistagDown * Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                }
-                else{
-                    p_data_btagUp = p_data_btagUp *Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagUp = p_data_mistagUp * Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_btagDown = p_data_btagDown * Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagDown = p_data_mistagDown *Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                }
-            }  
-            else if (Jet_btagDeepFlavB[j] < threshold && Jet_pt[j] > BTAG_PT_CUT && abs(Jet_eta[j])<BTAG_ETA_CUT){
-                p_MC = p_MC *(1 - efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                p_data = p_data *(1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                if (abs(Jet_partonFlavour[j]) == 4 || abs(Jet_partonFlavour[j]) == 5){
-                    p_data_btagUp =  p_data_btagUp * (1 - Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagUp = p_data_mistagUp * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_btagDown = p_data_btagDown * (1 - Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagDown = p_data_mistagDown * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                }
-                else{
-                    p_data_btagUp = p_data_btagUp * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagUp = p_data_mistagUp * (1 - Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_btagDown = p_data_btagDown * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagDown =  p_data_mistagDown * (1 - Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                }
-            }
+
+    for (auto j : GoodJets_idx) {
+        bool tagged;
+        if (BTAG_CALC_TAGGER == kDeepFlv){
+            // DeepFlv: only the jets in the acceptance of the SFs
+            if (!(Jet_pt[j] > BTAG_PT_CUT && abs(Jet_eta[j]) < BTAG_ETA_CUT)) continue;
+            tagged = Jet_btagDeepFlavB[j] >= BTAG_CALC_WP_DEEPFLV;
         }
-        
-        else if(tagger == "DeepCSV"){
-            //threshold = WPbtagger[tagger + "_" + WP];
-            threshold = 0.4184;
-            if (Jet_btagDeepB[j] >= threshold){
-                p_MC =  p_MC * efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                p_data = p_data * Jet_btagSF_deepjet_M[j] * efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                if (abs(Jet_partonFlavour[j]) == 4 || abs(Jet_partonFlavour[j]) == 5){
-                    p_data_btagUp = p_data_btagUp * Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagUp = p_data_mistagUp * Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_btagDown = p_data_btagDown * Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagDown = p_data_mistagDown * Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                }
-                else{
-                    p_data_btagUp = p_data_btagUp *Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagUp = p_data_mistagUp * Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_btagDown = p_data_btagDown * Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                    p_data_mistagDown = p_data_mistagDown *Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year);
-                }
-            }
-            else if (Jet_btagDeepB[j] < threshold){
-                p_MC = p_MC * (1 - efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                p_data = p_data *(1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                if (abs(Jet_partonFlavour[j]) == 4 || abs(Jet_partonFlavour[j]) == 5){
-                    p_data_btagUp =  p_data_btagUp * (1 - Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagUp = p_data_mistagUp * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_btagDown = p_data_btagDown * (1 - Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagDown = p_data_mistagDown * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                }
-                else{
-                    p_data_btagUp = p_data_btagUp * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagUp = p_data_mistagUp * (1 - Jet_btagSF_deepjet_M_up[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_btagDown = p_data_btagDown * (1 - Jet_btagSF_deepjet_M[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                    p_data_mistagDown =  p_data_mistagDown * (1 - Jet_btagSF_deepjet_M_down[j]*efficiency(abs(Jet_partonFlavour[j]), Jet_eta[j], Jet_pt[j], year));
-                }
-            }
+        else tagged = Jet_btagDeepB[j] >= BTAG_CALC_WP_DEEPCSV;
+
+        const int flv = abs(Jet_partonFlavour[j]);
+        const float eff = efficiency(flv, Jet_eta[j], Jet_pt[j], year);
+        const float sf = Jet_btagSF_deepjet_M[j], sf_up = Jet_btagSF_deepjet_M_up[j], sf_down = Jet_btagSF_deepjet_M_down[j];
+        const bool heavy = flv == 4 || flv == 5;
+
+        p_MC = p_MC*(tagged ? eff : 1 - eff);
+        if (tagged) {
+            p_data = p_data*sf*eff;
+            p_data_btagUp = p_data_btagUp*(heavy ? sf_up : sf)*eff;
+            p_data_btagDown = p_data_btagDown*(heavy ? sf_down : sf)*eff;
+            p_data_mistagUp = p_data_mistagUp*(heavy ? sf : sf_up)*eff;
+            p_data_mistagDown = p_data_mistagDown*(heavy ? sf : sf_down)*eff;
+        }
+        else {
+            p_data = p_data*(1 - sf*eff);
+            p_data_btagUp = p_data_btagUp*(1 - (heavy ? sf_up : sf)*eff);
+            p_data_btagDown = p_data_btagDown*(1 - (heavy ? sf_down : sf)*eff);
+            p_data_mistagUp = p_data_mistagUp*(1 - (heavy ? sf : sf_up)*eff);
+            p_data_mistagDown = p_data_mistagDown*(1 - (heavy ? sf : sf_down)*eff);
         }
     }
-    
-    RVec<float> result(5);
+
     result[0] = p_data/p_MC;
     result[1] = p_data_btagUp/p_MC;
     result[2] = p_data_btagDown/p_MC;
     result[3] = p_data_mistagUp/p_MC;
     result[4] = p_data_mistagDown/p_MC;
-    
+
     return result;
 }
 
-unordered_set<int> data_flags({339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383, 384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, });
-
-
-unordered_set<int> dataEle_flags({361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, });
-
-unordered_set<int> dataMu_flags({339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,});
-
-unordered_map<int,float> xsecs({
-{208,35.85},
-{25,51.1},
-{26,191.3},
-{18,3.697},
-{19,0.5297},
-{20,0.2529},
-{21,0.4062},
-{22,0.216},
-{23,0.0758},
-{28,12.178},
-{50,0.2086},
-{51,0.1651},
-{52,0.05565},
-{53,0.01398},
-{54,0.2147},
-{15,72.1},
-{64,27.59},
-{67,7181.0},
-{28,12.178},
-{29,0.014193333333333334},
-{30,0.007096666666666667},
-{31,0.007096666666666667},
-{32,0.007096666666666667},
-{33,0.014193333333333334},
-{34,0.007096666666666667},
-{35,0.007096666666666667},
-{36,0.007096666666666667},
-{37,0.014193333333333334},
-{38,35.85},
-{40,1.0315},
-{42,0.0118},
-{43,2.7757},
-{44,0.0896},
-{45,0.237},
-{46,0.212},
-{47,0.952},
-{1,0.564},
-{2,13.74},
-{11,0.003194},
-{4,0.003194},
-{5,0.003194},
-{6,0.003194},
-{8,0.003194},
-{3,0.001586},
-{7,0.001586},
-{10,0.001586},
-{71,0.002014},
-{72,0.01036},
-{73,0.01595},
-{363,1.},
-{364,1.},
-{365,1.},
-{366,1.},
-{367,1.},
-{341,1.},
-{342,1.},
-{343,1.},
-{344,1.},
-{345,1.},
-{110,51.1},
-{111,191.3},
-{103,3.697},
-{104,0.5297},
-{105,0.2529},
-{106,0.4062},
-{107,0.216},
-{108,0.0758},
-{113,12.178},
-{134,0.2086},
-{135,0.1651},
-{136,0.05565},
-{137,0.01398},
-{138,0.2147},
-{100,72.1},
-{148,27.59},
-{151,7181.0},
-{113,12.178},
-{114,0.014193333333333334},
-{115,0.007096666666666667},
-{116,0.007096666666666667},
-{117,0.007096666666666667},
-{118,0.014193333333333334},
-{119,0.007096666666666667},
-{120,0.007096666666666667},
-{121,0.007096666666666667},
-{122,0.014193333333333334},
-{123,35.85},
-{125,1.0315},
-{127,0.0118},
-{128,2.7757},
-{129,0.0896},
-{130,0.237},
-{131,0.212},
-{132,0.952},
-{86,0.9738},
-{87,13.74},
-{96,0.003194},
-{89,0.003194},
-{90,0.003194},
-{91,0.003194},
-{93,0.003194},
-{88,0.001586},
-{92,0.001586},
-{95,0.001586},
-{155,0.002014},
-{156,0.01036},
-{157,0.01595},
-{369,1.},
-{370,1.},
-{371,1.},
-{347,1.},
-{348,1.},
-{349,1.},
-{194,51.1},
-{195,191.3},
-{187,3.697},
-{188,0.5297},
-{189,0.2529},
-{190,0.4062},
-{191,0.216},
-{192,0.0758},
-{197,12.178},
-{219,0.2086},
-{220,0.1651},
-{221,0.05565},
-{222,0.01398},
-{223,0.2147},
-{184,72.1},
-{233,27.59},
-{236,7181.0},
-{197,12.178},
-{198,0.014193333333333334},
-{199,0.007096666666666667},
-{200,0.007096666666666667},
-{201,0.007096666666666667},
-{202,0.014193333333333334},
-{203,0.007096666666666667},
-{204,0.007096666666666667},
-{205,0.007096666666666667},
-{206,0.014193333333333334},
-{207,35.85},
-{209,1.0315},
-{211,0.0118},
-{212,2.7757},
-{213,0.0896},
-{214,0.237},
-{215,0.212},
-{216,0.952},
-{170,0.9738},
-{171,13.74},
-{180,0.003194},
-{173,0.003194},
-{174,0.003194},
-{175,0.003194},
-{177,0.003194},
-{172,0.001586},
-{176,0.001586},
-{179,0.001586},
-{240,0.002014},
-{241,0.01036},
-{242,0.01595},
-{373,1.},
-{374,1.},
-{375,1.},
-{376,1.},
-{377,1.},
-{351,1.},
-{352,1.},
-{353,1.},
-{354,1.},
-{355,1.},
-{279,51.1},
-{280,191.3},
-{272,3.697},
-{273,0.5297},
-{274,0.2529},
-{275,0.4062},
-{276,0.216},
-{277,0.0758},
-{282,12.178},
-{304,0.2086},
-{305,0.1651},
-{306,0.05565},
-{307,0.01398},
-{308,0.2147},
-{269,72.1},
-{318,27.59},
-{321,7181.0},
-{282,12.178},
-{283,0.014193333333333334},
-{284,0.007096666666666667},
-{285,0.007096666666666667},
-{286,0.007096666666666667},
-{287,0.014193333333333334},
-{288,0.007096666666666667},
-{289,0.007096666666666667},
-{290,0.007096666666666667},
-{291,0.014193333333333334},
-{292,35.85},
-{294,1.0315},
-{296,0.0118},
-{297,2.7757},
-{298,0.0896},
-{299,0.237},
-{300,0.212},
-{301,0.952},
-{255,0.9738},
-{256,13.74},
-{265,0.003194},
-{258,0.003194},
-{259,0.003194},
-{260,0.003194},
-{262,0.003194},
-{257,0.001586},
-{261,0.001586},
-{264,0.001586},
-{325,0.002014},
-{326,0.01036},
-{327,0.01595},
-{379,1.},
-{380,1.},
-{381,1.},
-{382,1.},
-{357,1.},
-{358,1.},
-{359,1.},
-{360,1.},
-});
-
-
-unordered_map<int,float> Nevents({
-{208,5674000},
-{25,27805647},
-{26,53848477},
-{18,1511805},
-{19,6277000},
-{20,5792000},
-{21,308442},
-{22,1264826},
-{23,3723000},
-{28,3018000},
-{50,5190000},
-{51,5072000},
-{52,5394000},
-{53,5302000},
-{54,800000},
-{15,37505000},
-{64,7934000},
-{67,90947213},
-{28,3018000},
-{29,1994000},
-{30,1991000},
-{31,1906000},
-{32,1997000},
-{33,1953000},
-{34,1914000},
-{35,1958000},
-{36,1994000},
-{37,1956000},
-{38,2300000},
-{40,4666982},
-{42,1000000},
-{43,6134000},
-{44,2204000},
-{45,1452000},
-{46,1977996},
-{47,440780},
-{1,16862000},
-{2,19622315},
-{11,500000},
-{4,500000},
-{5,500000},
-{6,500000},
-{8,500000},
-{3,972000},
-{7,927966},
-{10,497032},
-{71,1921000},
-{72,1983000},
-{73,1994000},
-{363,0},
-{364,0},
-{365,0},
-{366,0},
-{367,0},
-{341,0},
-{342,0},
-{343,0},
-{344,0},
-{345,0},
-{110,31562465},
-{111,55939475},
-{103,1416230},
-{104,5401000},
-{105,6017000},
-{106,308983},
-{107,1264826},
-{108,3967000},
-{113,2900000},
-{134,4159000},
-{135,4595000},
-{136,4554000},
-{137,4534000},
-{138,698000},
-{100,43546000},
-{148,7584000},
-{151,71839442},
-{113,2900000},
-{114,1959000},
-{115,1927000},
-{116,1982000},
-{117,1991000},
-{118,1984000},
-{119,1859000},
-{120,1996000},
-{121,1973000},
-{122,1991000},
-{123,2491000},
-{125,4882983},
-{127,1000000},
-{128,6443000},
-{129,2893000},
-{130,1500000},
-{131,2240994},
-{132,330462},
-{86,15928000},
-{87,15890000},
-{96,500000},
-{89,499000},
-{90,500000},
-{91,493000},
-{93,500000},
-{88,992608},
-{92,997445},
-{95,499183},
-{155,1926000},
-{156,1956000},
-{157,1953000},
-{369,0},
-{370,0},
-{371,0},
-{347,0},
-{348,0},
-{349,0},
-{194,29890946},
-{195,60212926},
-{187,3534208},
-{188,13822000},
-{189,14036000},
-{190,655018},
-{191,2891483},
-{192,9530000},
-{197,7098000},
-{219,9854000},
-{220,178000},
-{221,9898000},
-{222,9524000},
-{223,1736000},
-{184,106724000},
-{233,7889000},
-{236,195529774},
-{197,7098000},
-{198,3780000},
-{199,3876000},
-{200,3998000},
-{201,3962000},
-{202,3978000},
-{203,3985000},
-{204,3840000},
-{205,3984000},
-{206,1910000},
-{207,5649000},
-{209,6828983},
-{211,998000},
-{212,12974000},
-{213,6440000},
-{214,2811630},
-{215,5070989},
-{216,869559},
-{170,40839000},
-{171,41708429},
-{180,497000},
-{173,500000},
-{174,498000},
-{175,500000},
-{177,500000},
-{172,997000},
-{176,975090},
-{179,499000},
-{240,1978000},
-{241,1952000},
-{242,1902000},
-{373,0},
-{374,0},
-{375,0},
-{376,0},
-{377,0},
-{351,0},
-{352,0},
-{353,0},
-{354,0},
-{355,0},
-{279,29919798},
-{280,61613294},
-{272,4437068},
-{273,19816000},
-{274,19608000},
-{275,970179},
-{276,10450000},
-{277,14000000},
-{282,9994000},
-{304,9894000},
-{305,9961999},
-{306,9994000},
-{307,9889000},
-{308,2500000},
-{269,145020000},
-{318,7940000},
-{321,195510810},
-
-{282,9994000},
-{283,4904000},
-{284,4928000},
-{285,4784000},
-{286,4998000},
-{287,4986000},
-{288,4864000},
-{289,4948000},
-{290,4958000},
-{291,4678000},
-{292,7956000},
-{294,9865972},
-{296,940000},
-{297,12966000},
-{298,9492608},
-{299,2987000},
-{300,7328993},
-{301,1208288},
-{255,56886000},
-{256,64107525},
-{265,500000},
-{258,500000},
-{259,500000},
-{260,500000},
-{262,496000},
-{257,974000},
-{261,994626},
-{264,493998},
-{325,1927000},
-{326,1939000},
-{327,1930000},
-{379,0},
-{380,0},
-{381,0},
-{382,0},
-{357,0},
-{358,0},
-{359,0},
-{360,0},
-});
+// sample kind, cross section and generated events by sample id: sample_weights_UL.h,
+// generated with make_sample_table.py from samplesUL.json and sample_ids.py
 
 bool isMC(int SampleFlag){
-    bool is_in = data_flags.find(SampleFlag) != data_flags.end();
-    if (is_in == true) return false;
-    else return true;
+    if (SampleFlag < 0 || SampleFlag >= kNSamples) return true;
+    return sample_kind[SampleFlag] == kMC;
 }
 
 float getLumi(string Year, bool IsMC){
@@ -1638,16 +1090,14 @@ float getLumi(string Year, bool IsMC){
 
 float getXSec(int Sample, bool IsMC){
     if (IsMC == false) return 1.;
-    else{
-        return  xsecs[Sample];
-    }
+    else if (Sample < 0 || Sample >= kNSamples) return 0.;
+    else return sample_xsec[Sample];
 }
 
 float getNevents(int Sample, bool IsMC){
     if (IsMC == false) return 1.;
-    else{
-        return  Nevents[Sample];
-    }
+    else if (Sample < 0 || Sample >= kNSamples) return 0.;
+    else return sample_nevents[Sample];
 }
 
 
@@ -1681,10 +1131,9 @@ RVec<int> GetGenMatched(rvec_i Jet_genJetIdx, rvec_i GenJet_idx){
 
 bool DataLeptonCheck(int SampleFlag, int GoodLeptonFamily, bool isMC){
     if(isMC == false){
-        bool is_in_ele = dataEle_flags.find(SampleFlag) != dataEle_flags.end();
-        if(is_in_ele == true && GoodLeptonFamily == 1) return false;
-        bool is_in_mu = dataMu_flags.find(SampleFlag) != dataMu_flags.end();
-        if(is_in_mu == true && GoodLeptonFamily == 0) return false;
+        SampleKind kind = SampleFlag >= 0 && SampleFlag < kNSamples ? sample_kind[SampleFlag] : kMC;
+        if(kind == kDataEle && GoodLeptonFamily == 1) return false;
+        if(kind == kDataMu && GoodLeptonFamily == 0) return false;
     }
     return true;
 }
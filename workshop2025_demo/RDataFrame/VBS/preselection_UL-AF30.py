@@ -4,6 +4,7 @@ import ROOT
 import os
 from dask.distributed import Client, PipInstall, WorkerPlugin, LocalCluster
 import json
+import samplesUL
 from samplesUL import *
 import sys
 from dask_jobqueue import SLURMCluster, HTCondorCluster
@@ -25,7 +26,18 @@ redirector = ""
 # Default in the txt chain files
 #redirector = "file:///scratch/cms" # Local storage nvme
 maxNfilespersample = 1 # 99999 #5 lower this number just for debugging purposes: 99999 prod.
-nPartitions = 1*3  #used only in distributed mode (golden rule 3*Nworkers)
+nPartitions = None  #used only in distributed mode: None -> planned from the entries of the files (partition_planner.py), or fixed (golden rule 3*Nworkers)
+targetTaskSeconds = 300  #duration of a task aimed at by the partition planner
+singlePass = True  #the chains share one graph (RDatasetSpec, execute_MC_datasets), else one execute_MC per chain
+mergeOutputs = True  #merge the per task snapshot files into <name>_merged_<node>_<k>.root while the graph runs (output_merger.py)
+outputBuffer = os.environ.get("VBS_OUTPUT_BUFFER", "./")  #node-local directory where the tasks write their snapshot files
+mergedDestination = "./"  #directory or URL of the merged files, written by the workers of every node: a shared directory (relative to the worker directory) or a URL
+mergedTargetBytes = 2 * 1024**3  #size of a merged file
+outputFormat = "TTree"  #"TTree" or "RNTuple" (ROOT >= 6.32), the postselection reads both
+outputCompression = None  #100 * algorithm + level (505: ZSTD level 5, as the converted RNTuple inputs), None -> Snapshot default
+outputPageSize = 64 * 1024  #RNTuple only: maximum uncompressed page size in bytes (ROOT >= 6.36), None -> ROOT default
+monitorTasks = True  #distrdf_monitor/distrdf_runtime csv files of every task in monitorDirectory (monitoring_plugin.py), no monitoring ROOT image needed
+monitorDirectory = "distrdf_monitoring"
 
 if distributed != True and MT == True:
     ROOT.ROOT.EnableImplicitMT()
@@ -75,6 +87,25 @@ data = text_file.read()
 text_file = open("preselection_part2_UL.h", "r")
 data_2 = text_file.read()
 
+# file -> (sample id, year), regenerate with python3 make_sample_table.py when the chains change
+text_file = open("sample_table_UL.h", "r")
+data_samples = text_file.read()
+
+# ReplicaPath: the ROOT files opened by preselection_UL.h are read from the node-local cache
+text_file = open("replica_cache.h", "r")
+data_replicas = text_file.read()
+
+remote_storage = "https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/"
+
+# precompiled headers (python3 build_preselection_lib.py), None -> JIT with gInterpreter.Declare
+from build_preselection_lib import library_path, library_files
+from partition_planner import plan as plan_partitions, plan_samples
+from chain_index import read_chain
+from output_merger import OutputMerger
+from monitoring_plugin import TaskMonitor
+preselection_lib = library_path()
+print("preselection library: {}".format(preselection_lib))
+
 def my_initialization_function():
     
     import ROOT
@@ -88,29 +119,44 @@ def my_initialization_function():
     jec_prefix_MC = "Summer19UL17_V6_MC"
     jer_prefix_MC = "Summer19UL17_JRV3_MC"
     
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/python/postprocessing/data/roccor.Run2.v5/RoccoR2017UL.txt", "RoccoR2017UL.txt")
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/python/postprocessing/data/roccor.Run2.v5/RoccoR.cc", "RoccoR.cc")
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/python/postprocessing/data/roccor.Run2.v5/RoccoR.h", "RoccoR.h")
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/btagSF/DeepJet_106XUL17_v3_new.csv", "DeepJet_106XUL17_v3_new.csv")
+    # calibration files are downloaded once per node and shared by all the workers (see calibration_cache.py)
+    from calibration_cache import cached_get_file, prefetch, replica_files
+
+    cached_get_file(remote_storage + "python/postprocessing/data/roccor.Run2.v5/RoccoR2017UL.txt", "RoccoR2017UL.txt")
+    cached_get_file(remote_storage + "python/postprocessing/data/roccor.Run2.v5/RoccoR.cc", "RoccoR.cc")
+    cached_get_file(remote_storage + "python/postprocessing/data/roccor.Run2.v5/RoccoR.h", "RoccoR.h")
+    cached_get_file(remote_storage + "data/btagSF/DeepJet_106XUL17_v3_new.csv", "DeepJet_106XUL17_v3_new.csv")
+    # the ROOT files opened by the globals of preselection_UL.h
+    prefetch(replica_files["preselection_UL.h"])
     
-    ROOT.gInterpreter.Declare(
-        '''
-        #ifndef ROCCOR
-        #define ROCCOR
-        #include "RoccoR.cc"
-        #endif
-        ''')
-
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_L1FastJet_AK4PFchs.txt".format(jec_prefix_MC), "{}_L1FastJet_AK4PFchs.txt".format(jec_prefix_MC))
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_L2Relative_AK4PFchs.txt".format(jec_prefix_MC), "{}_L2Relative_AK4PFchs.txt".format(jec_prefix_MC))
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_L3Absolute_AK4PFchs.txt".format(jec_prefix_MC), "{}_L3Absolute_AK4PFchs.txt".format(jec_prefix_MC))
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_L2L3Residual_AK4PFchs.txt".format(jec_prefix_MC), "{}_L2L3Residual_AK4PFchs.txt".format(jec_prefix_MC))
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_UncertaintySources_AK4PFchs.txt".format(jec_prefix_MC), "{}_UncertaintySources_AK4PFchs.txt".format(jec_prefix_MC))
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_PtResolution_AK4PFchs.txt".format(jer_prefix_MC), "{}_PtResolution_AK4PFchs.txt".format(jer_prefix_MC))
-    https_get_file("https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/data/jme/{}_SF_AK4PFchs.txt".format(jer_prefix_MC), "{}_SF_AK4PFchs.txt".format(jer_prefix_MC))
+    # the library must be loaded after the downloads: its globals read RoccoR2017UL.txt and the DeepJet csv
+    # (on a remote worker it is the copy uploaded by the driver)
+    from build_preselection_lib import locate
+    lib = locate(preselection_lib)
+    lib_loaded = lib is not None and ROOT.gSystem.Load(lib) >= 0
+
+    if not lib_loaded:
+        ROOT.gInterpreter.Declare(
+            '''
+            #ifndef ROCCOR
+            #define ROCCOR
+            #include "RoccoR.cc"
+            #endif
+            ''')
+
+    cached_get_file(remote_storage + "data/jme/{}_L1FastJet_AK4PFchs.txt".format(jec_prefix_MC), "{}_L1FastJet_AK4PFchs.txt".format(jec_prefix_MC))
+    cached_get_file(remote_storage + "data/jme/{}_L2Relative_AK4PFchs.txt".format(jec_prefix_MC), "{}_L2Relative_AK4PFchs.txt".format(jec_prefix_MC))
+    cached_get_file(remote_storage + "data/jme/{}_L3Absolute_AK4PFchs.txt".format(jec_prefix_MC), "{}_L3Absolute_AK4PFchs.txt".format(jec_prefix_MC))
+    cached_get_file(remote_storage + "data/jme/{}_L2L3Residual_AK4PFchs.txt".format(jec_prefix_MC), "{}_L2L3Residual_AK4PFchs.txt".format(jec_prefix_MC))
+    cached_get_file(remote_storage + "data/jme/{}_UncertaintySources_AK4PFchs.txt".format(jec_prefix_MC), "{}_UncertaintySources_AK4PFchs.txt".format(jec_prefix_MC))
+    cached_get_file(remote_storage + "data/jme/{}_PtResolution_AK4PFchs.txt".format(jer_prefix_MC), "{}_PtResolution_AK4PFchs.txt".format(jer_prefix_MC))
+    cached_get_file(remote_storage + "data/jme/{}_SF_AK4PFchs.txt".format(jer_prefix_MC), "{}_SF_AK4PFchs.txt".format(jer_prefix_MC))
     
     
-    ROOT.gInterpreter.Declare('{}'.format(data))
+    if not lib_loaded:
+        ROOT.gInterpreter.Declare('{}'.format(data_replicas))
+        ROOT.gInterpreter.Declare('{}'.format(data_samples))
+        ROOT.gInterpreter.Declare('{}'.format(data))
 
     ROOT.gInterpreter.ProcessLine('#ifndef LOADING')
     ROOT.gInterpreter.ProcessLine('#define LOADING')
@@ -121,7 +167,8 @@ def my_initialization_function():
 
     ROOT.gInterpreter.ProcessLine('#endif')
     
-    ROOT.gInterpreter.Declare('{}'.format(data_2))
+    if not lib_loaded:
+        ROOT.gInterpreter.Declare('{}'.format(data_2))
     
 
     from CMSJMECalculators import loadJMESystematicsCalculators
@@ -232,6 +279,15 @@ if distributed == True:
         print("after register plugin")
     except:
         print("no Upload file proxy")
+    client.register_plugin(UploadFile(os.path.abspath("calibration_cache.py")))
+    client.register_plugin(UploadFile(os.path.abspath("build_preselection_lib.py")))
+    client.register_plugin(UploadFile(os.path.abspath("output_merger.py")))
+    if preselection_lib is not None:
+        for name in library_files(preselection_lib):
+            client.register_plugin(UploadFile(name))
+    if monitorTasks == True:
+        client.register_plugin(UploadFile(os.path.abspath("monitoring_plugin.py")))
+        client.register_plugin(TaskMonitor(monitorDirectory))
     client.run(set_proxy)
     print("after set proxy")
     ROOT.RDF.Experimental.Distributed.initialize(my_initialization_function)
@@ -240,42 +296,22 @@ else:
     my_initialization_function()
 
 print("before chains")
-sampleDict = {'ZZtoLep_UL2016APV': 0,'ZZTo2L2Nu_UL2016APV': 1,'ZZTo4L_UL2016APV': 2,'GluGluToContinToZZTo4e_UL2016APV': 3,'GluGluToContinToZZTo2e2mu_UL2016APV': 4,'GluGluToContinToZZTo2e2tau_UL2016APV': 5,'GluGluToContinToZZTo2mu2nu_UL2016APV': 6,'GluGluToContinToZZTo4mu_UL2016APV': 7,'GluGluToContinToZZTo2mu2tau_UL2016APV': 8,'GluGluToContinToZZTo2tau2nu_UL2016APV': 9,'GluGluToContinToZZTo4tau_UL2016APV': 10,'GluGluToContinToZZTo2e2nu_UL2016APV': 11,'TT_UL2016APV': 12,'TT_SemiLep_UL2016APV': 13,'TT_Had_UL2016APV': 14,'TTTo2L2Nu_UL2016APV': 15,'TT_beff_UL2016APV': 16,'TVX_UL2016APV': 17,'TTGJets_UL2016APV': 18,'TTZToQQ_UL2016APV': 19,'TTZToLLNuNu_UL2016APV': 20,'TTWJetsToQQ_UL2016APV': 21,'TTWJetsToLNu_UL2016APV': 22,'tZq_ll_4f_UL2016APV': 23,'VG_UL2016APV': 24,'ZG_UL2016APV': 25,'WG_UL2016APV': 26,'WrongSign_UL2016APV': 27,'WWto2L2Nu_UL2016APV': 28,'GluGluToWWToENEN_UL2016APV': 29,'GluGluToWWToENMN_UL2016APV': 30,'GluGluToWWToENTN_UL2016APV': 31,'GluGluToWWToMNEN_UL2016APV': 32,'GluGluToWWToMNMN_UL2016APV': 33,'GluGluToWWToMNTN_UL2016APV': 34,'GluGluToWWToTNEN_UL2016APV': 35,'GluGluToWWToTNMN_UL2016APV': 36,'GluGluToWWToTNTN_UL2016APV': 37,'ST_tW_top_UL2016APV': 38,'ST_tW_antitop_UL2016APV': 39,'GluGluHToWWTo2L2Nu_UL2016APV': 40,'GluGluHToWWToLNuQQ_UL2016APV': 41,'GluGluHToZZTo4L_UL2016APV': 42,'GluGluHToTauTau_UL2016APV': 43,'VBFHToWWTo2L2Nu_UL2016APV': 44,'VBFHToTauTau_UL2016APV': 45,'ttHToNonbb_UL2016APV': 46,'VHToNonbb_UL2016APV': 47,'Triboson_UL2016APV': 48,'WWTo2L2Nu_DoubleScattering_UL2016': 49,'WWW_4F_UL2016APV': 50,'WWZ_4F_UL2016APV': 51,'WZZ_UL2016APV': 52,'ZZZ_UL2016APV': 53,'WWG_UL2016APV': 54,'WJets_UL2016APV': 55,'WJetsHT70to100_UL2016APV': 56,'WJetsHT100to200_UL2016APV': 57,'WJetsHT200to400_UL2016APV': 58,'WJetsHT400to600_UL2016APV': 59,'WJetsHT600to800_UL2016APV': 60,'WJetsHT800to1200_UL2016APV': 61,'WJetsHT1200to2500_UL2016APV': 62,'WJetsHT2500toInf_UL2016APV': 63,'WZ_UL2016APV': 64,'DYJetsToLL_UL2016APV': 65,'DYJetsToLL_FxFx_UL2016APV': 65,'DYJetsToLL_M10to50_UL2016APV': 66,'DYJetsToLL_M50_UL2016APV': 67,'DYJetsToLL_M50_FxFx_UL2016APV': 67,'DYJetsToLL_M50_UL2016APV_ext': 67,'WpWpJJ_EWK_UL2016APV': 68,'WpWpJJ_QCD_UL2016APV': 69,'VBS_SSWW_SM_UL2016APV': 70,'VBS_SSWW_LL_SM_UL2016APV': 71,'VBS_SSWW_TL_SM_UL2016APV': 72,'VBS_SSWW_TT_SM_UL2016APV': 73,'VBS_SSWW_cW_UL2016APV': 74,'VBS_SSWW_cW_SM_UL2016APV': 75,'VBS_SSWW_cW_BSM_UL2016APV': 76,'VBS_SSWW_cW_INT_UL2016APV': 77,'VBS_SSWW_cHW_UL2016APV': 78,'VBS_SSWW_cHW_SM_UL2016APV': 79,'VBS_SSWW_cHW_BSM_UL2016APV': 80,'VBS_SSWW_cHW_INT_UL2016APV': 81,'VBS_SSWW_cW_cHW_UL2016APV': 82,'VBS_SSWW_DIM6_UL2016APV': 83,'VBS_SSWW_DIM6_SM_UL2016APV': 84,'ZZtoLep_UL2016': 85,'ZZTo2L2Nu_UL2016': 86,'ZZTo4L_UL2016': 87,'GluGluToContinToZZTo4e_UL2016': 88,'GluGluToContinToZZTo2e2mu_UL2016': 89,'GluGluToContinToZZTo2e2tau_UL2016': 90,'GluGluToContinToZZTo2mu2nu_UL2016': 91,'GluGluToContinToZZTo4mu_UL2016': 92,'GluGluToContinToZZTo2mu2tau_UL2016': 93,'GluGluToContinToZZTo2tau2nu_UL2016': 94,'GluGluToContinToZZTo4tau_UL2016': 95,'GluGluToContinToZZTo2e2nu_UL2016': 96,'TT_UL2016': 97,'TT_SemiLep_UL2016': 98,'TT_Had_UL2016': 99,'TTTo2L2Nu_UL2016': 100,'TT_beff_UL2016': 101,'TVX_UL2016': 102,'TTGJets_UL2016': 103,'TTZToQQ_UL2016': 104,'TTZToLLNuNu_UL2016': 105,'TTWJetsToQQ_UL2016': 106,'TTWJetsToLNu_UL2016': 107,'tZq_ll_4f_UL2016': 108,'VG_UL2016': 109,'ZG_UL2016': 110,'WG_UL2016': 111,'WrongSign_UL2016': 112,'WWto2L2Nu_UL2016': 113,'GluGluToWWToENEN_UL2016': 114,'GluGluToWWToENMN_UL2016': 115,'GluGluToWWToENTN_UL2016': 116,'GluGluToWWToMNEN_UL2016': 117,'GluGluToWWToMNMN_UL2016': 118,'GluGluToWWToMNTN_UL2016': 119,'GluGluToWWToTNEN_UL2016': 120,'GluGluToWWToTNMN_UL2016': 121,'GluGluToWWToTNTN_UL2016': 122,'ST_tW_top_UL2016': 123,'ST_tW_antitop_UL2016': 124,'GluGluHToWWTo2L2Nu_UL2016': 125,'GluGluHToWWToLNuQQ_UL2016': 126,'GluGluHToZZTo4L_UL2016': 127,'GluGluHToTauTau_UL2016': 128,'VBFHToWWTo2L2Nu_UL2016': 129,'VBFHToTauTau_UL2016': 130,'ttHToNonbb_UL2016': 131,'VHToNonbb_UL2016': 132,'Triboson_UL2016': 133,'WWW_4F_UL2016': 134,'WWZ_4F_UL2016': 135,'WZZ_UL2016': 136,'ZZZ_UL2016': 137,'WWG_UL2016': 138,'WJets_UL2016': 139,'WJetsHT70to100_UL2016': 140,'WJetsHT100to200_UL2016': 141,'WJetsHT200to400_UL2016': 142,'WJetsHT400to600_UL2016': 143,'WJetsHT600to800_UL2016': 144,'WJetsHT800to1200_UL2016': 145,'WJetsHT1200to2500_UL2016': 146,'WJetsHT2500toInf_UL2016': 147,'WZ_UL2016': 148,'DYJetsToLL_UL2016': 149,'DYJetsToLL_FxFx_UL2016': 149,'DYJetsToLL_M10to50_UL2016': 150,'DYJetsToLL_M50_UL2016': 151,'DYJetsToLL_M50_FxFx_UL2016': 151,'DYJetsToLL_M50_UL2016_ext': 151,'WpWpJJ_EWK_UL2016': 152,'WpWpJJ_QCD_UL2016': 153,'VBS_SSWW_SM_UL2016': 154,'VBS_SSWW_LL_SM_UL2016': 155,'VBS_SSWW_TL_SM_UL2016': 156,'VBS_SSWW_TT_SM_UL2016': 157,'VBS_SSWW_cW_UL2016': 158,'VBS_SSWW_cW_SM_UL2016': 159,'VBS_SSWW_cW_BSM_UL2016': 160,'VBS_SSWW_cW_INT_UL2016': 161,'VBS_SSWW_cHW_UL2016': 162,'VBS_SSWW_cHW_SM_UL2016': 163,'VBS_SSWW_cHW_BSM_UL2016': 164,'VBS_SSWW_cHW_INT_UL2016': 165,'VBS_SSWW_cW_cHW_UL2016': 166,'VBS_SSWW_DIM6_UL2016': 167,'VBS_SSWW_DIM6_SM_UL2016': 168,'ZZtoLep_UL2017': 169,'ZZTo2L2Nu_UL2017': 170,'ZZTo4L_UL2017': 171,'GluGluToContinToZZTo4e_UL2017': 172,'GluGluToContinToZZTo2e2mu_UL2017': 173,'GluGluToContinToZZTo2e2tau_UL2017': 174,'GluGluToContinToZZTo2mu2nu_UL2017': 175,'GluGluToContinToZZTo4mu_UL2017': 176,'GluGluToContinToZZTo2mu2tau_UL2017': 177,'GluGluToContinToZZTo2tau2nu_UL2017': 178,'GluGluToContinToZZTo4tau_UL2017': 179,'GluGluToContinToZZTo2e2nu_UL2017': 180,'TT_UL2017': 181,'TT_SemiLep_UL2017': 182,'TT_Had_UL2017': 183,'TTTo2L2Nu_UL2017': 184,'TT_beff_UL2017': 185,'TVX_UL2017': 186,'TTGJets_UL2017': 187,'TTZToQQ_UL2017': 188,'TTZToLLNuNu_UL2017': 189,'TTWJetsToQQ_UL2017': 190,'TTWJetsToLNu_UL2017': 191,'tZq_ll_4f_UL2017': 192,'VG_UL2017': 193,'ZG_UL2017': 194,'WG_UL2017': 195,'WrongSign_UL2017': 196,'WWto2L2Nu_UL2017': 197,'GluGluToWWToENEN_UL2017': 198,'GluGluToWWToENMN_UL2017': 199,'GluGluToWWToENTN_UL2017': 200,'GluGluToWWToMNEN_UL2017': 201,'GluGluToWWToMNMN_UL2017': 202,'GluGluToWWToMNTN_UL2017': 203,'GluGluToWWToTNEN_UL2017': 204,'GluGluToWWToTNMN_UL2017': 205,'GluGluToWWToTNTN_UL2017': 206,'ST_tW_top_UL2017': 207,'ST_tW_antitop_UL2017': 208,'GluGluHToWWTo2L2Nu_UL2017': 209,'GluGluHToWWToLNuQQ_UL2017': 210,'GluGluHToZZTo4L_UL2017': 211,'GluGluHToTauTau_UL2017': 212,'VBFHToWWTo2L2Nu_UL2017': 213,'VBFHToTauTau_UL2017': 214,'ttHToNonbb_UL2017': 215,'VHToNonbb_UL2017': 216,'Triboson_UL2017': 217,'WWTo2L2Nu_DoubleScattering_UL2017': 218,'WWW_4F_UL2017': 219,'WWZ_4F_UL2017': 220,'WZZ_UL2017': 221,'ZZZ_UL2017': 222,'WWG_UL2017': 223,'WJets_UL2017': 224,'WJetsHT70to100_UL2017': 225,'WJetsHT100to200_UL2017': 226,'WJetsHT200to400_UL2017': 227,'WJetsHT400to600_UL2017': 228,'WJetsHT600to800_UL2017': 229,'WJetsHT800to1200_UL2017': 230,'WJetsHT1200to2500_UL2017': 231,'WJetsHT2500toInf_UL2017': 232,'WZ_UL2017': 233,'DYJetsToLL_UL2017': 234,'DYJetsToLL_FxFx_UL2017': 234,'DYJetsToLL_M10to50_UL2017': 235,'DYJetsToLL_M50_UL2017': 236,'DYJetsToLL_M50_FxFx_UL2017': 236,'DYJetsToLL_M50_UL2017_ext': 236,'WpWpJJ_EWK_UL2017': 237,'WpWpJJ_QCD_UL2017': 238,'VBS_SSWW_SM_UL2017': 239,'VBS_SSWW_LL_SM_UL2017': 240,'VBS_SSWW_TL_SM_UL2017': 241,'VBS_SSWW_TT_SM_UL2017': 242,'VBS_SSWW_cW_UL2017': 243,'VBS_SSWW_cW_SM_UL2017': 244,'VBS_SSWW_cW_BSM_UL2017': 245,'VBS_SSWW_cW_INT_UL2017': 246,'VBS_SSWW_cHW_UL2017': 247,'VBS_SSWW_cHW_SM_UL2017': 248,'VBS_SSWW_cHW_BSM_UL2017': 249,'VBS_SSWW_cHW_INT_UL2017': 250,'VBS_SSWW_cW_cHW_UL2017': 251,'VBS_SSWW_DIM6_UL2017': 252,'VBS_SSWW_DIM6_SM_UL2017': 253,'ZZtoLep_UL2018': 254,'ZZTo2L2Nu_UL2018': 255,'ZZTo4L_UL2018': 256,'GluGluToContinToZZTo4e_UL2018': 257,'GluGluToContinToZZTo2e2mu_UL2018': 258,'GluGluToContinToZZTo2e2tau_UL2018': 259,'GluGluToContinToZZTo2mu2nu_UL2018': 260,'GluGluToContinToZZTo4mu_UL2018': 261,'GluGluToContinToZZTo2mu2tau_UL2018': 262,'GluGluToContinToZZTo2tau2nu_UL2018': 263,'GluGluToContinToZZTo4tau_UL2018': 264,'GluGluToContinToZZTo2e2nu_UL2018': 265,'TT_UL2018': 266,'TT_SemiLep_UL2018': 267,'TT_Had_UL2018': 268,'TTTo2L2Nu_UL2018': 269,'TT_beff_UL2018': 270,'TVX_UL2018': 271,'TTGJets_UL2018': 272,'TTZToQQ_UL2018': 273,'TTZToLLNuNu_UL2018': 274,'TTWJetsToQQ_UL2018': 275,'TTWJetsToLNu_UL2018': 276,'tZq_ll_4f_UL2018': 277,'VG_UL2018': 278,'ZG_UL2018': 279,'WG_UL2018': 280,'WrongSign_UL2018': 281,'WWto2L2Nu_UL2018': 282,'GluGluToWWToENEN_UL2018': 283,'GluGluToWWToENMN_UL2018': 284,'GluGluToWWToENTN_UL2018': 285,'GluGluToWWToMNEN_UL2018': 286,'GluGluToWWToMNMN_UL2018': 287,'GluGluToWWToMNTN_UL2018': 288,'GluGluToWWToTNEN_UL2018': 289,'GluGluToWWToTNMN_UL2018': 290,'GluGluToWWToTNTN_UL2018': 291,'ST_tW_top_UL2018': 292,'ST_tW_antitop_UL2018': 293,'GluGluHToWWTo2L2Nu_UL2018': 294,'GluGluHToWWToLNuQQ_UL2018': 295,'GluGluHToZZTo4L_UL2018': 296,'GluGluHToTauTau_UL2018': 297,'VBFHToWWTo2L2Nu_UL2018': 298,'VBFHToTauTau_UL2018': 299,'ttHToNonbb_UL2018': 300,'VHToNonbb_UL2018': 301,'Triboson_UL2018': 302,'WWTo2L2Nu_DoubleScattering_UL2018': 303,'WWW_4F_UL2018': 304,'WWZ_4F_UL2018': 305,'WZZ_UL2018': 306,'ZZZ_UL2018': 307,'WWG_UL2018': 308,'WJets_UL2018': 309,'WJetsHT70to100_UL2018': 310,'WJetsHT100to200_UL2018': 311,'WJetsHT200to400_UL2018': 312,'WJetsHT400to600_UL2018': 313,'WJetsHT600to800_UL2018': 314,'WJetsHT800to1200_UL2018': 315,'WJetsHT1200to2500_UL2018': 316,'WJetsHT2500toInf_UL2018': 317,'WZ_UL2018': 318,'DYJetsToLL_UL2018': 319,'DYJetsToLL_FxFx_UL2018': 319,'DYJetsToLL_M10to50_UL2018': 320,'DYJetsToLL_M50_UL2018': 321,'DYJetsToLL_M50_FxFx_UL2018': 321,'DYJetsToLL_M50_UL2018_ext': 321,'WpWpJJ_EWK_UL2018': 322,'WpWpJJ_QCD_UL2018': 323,'VBS_SSWW_SM_UL2018': 324,'VBS_SSWW_LL_SM_UL2018': 325,'VBS_SSWW_TL_SM_UL2018': 326,'VBS_SSWW_TT_SM_UL2018': 327,'VBS_SSWW_cW_UL2018': 328,'VBS_SSWW_cW_BSM_UL2018': 329,'VBS_SSWW_cW_SM_UL2018': 330,'VBS_SSWW_cW_INT_UL2018': 331,'VBS_SSWW_cHW_UL2018': 332,'VBS_SSWW_cHW_SM_UL2018': 333,'VBS_SSWW_cHW_BSM_UL2018': 334,'VBS_SSWW_cHW_INT_UL2018': 335,'VBS_SSWW_cW_cHW_UL2018': 336,'VBS_SSWW_DIM6_UL2018': 337,'VBS_SSWW_DIM6_SM_UL2018': 338,'DataMu_UL2016APV': 339,'DataMuB1_UL2016APV': 340,'DataMuB2_UL2016APV': 341,'DataMuC_UL2016APV': 342,'DataMuD_UL2016APV': 343,'DataMuE_UL2016APV': 344,'DataMuF_UL2016APV': 345,'DataMu_UL2016': 346,'DataMuF_UL2016': 347,'DataMuG_UL2016': 348,'DataMuH_UL2016': 349,'DataMu_UL2017': 350,'DataMuB_UL2017': 351,'DataMuC_UL2017': 352,'DataMuD_UL2017': 353,'DataMuE_UL2017': 354,'DataMuF_UL2017': 355,'DataMu_UL2018': 356,'DataMuA_UL2018': 357,'DataMuB_UL2018': 358,'DataMuC_UL2018': 359,'DataMuD_UL2018': 360,'DataEle_UL2016APV': 361,'DataEleB1_UL2016APV': 362,'DataEleB2_UL2016APV': 363,'DataEleC_UL2016APV': 364,'DataEleD_UL2016APV': 365,'DataEleE_UL2016APV': 366,'DataEleF_UL2016APV': 367,'DataEle_UL2016': 368,'DataEleF_UL2016': 369,'DataEleG_UL2016': 370,'DataEleH_UL2016': 371,'DataEle_UL2017': 372,'DataEleB_UL2017': 373,'DataEleC_UL2017': 374,'DataEleD_UL2017': 375,'DataEleE_UL2017': 376,'DataEleF_UL2017': 377,'DataEle_UL2018': 378,'DataEleA_UL2018': 379,'DataEleB_UL2018': 380,'DataEleC_UL2018': 381,'DataEleD_UL2018': 382,'DataHT_UL2016APV': 383,'DataHTB1_UL2016APV': 384,'DataHTB2_UL2016APV': 385,'DataHTC_UL2016APV': 386,'DataHTD_UL2016APV': 387,'DataHTE_UL2016APV': 388,'DataHTF_UL2016APV': 389,'DataHT_UL2016': 390,'DataHTF_UL2016': 391,'DataHTG_UL2016': 392,'DataHTH_UL2016': 393,'DataHT_UL2017': 394,'DataHTB_UL2017': 395,'DataHTC_UL2017': 396,'DataHTD_UL2017': 397,'DataHTE_UL2017': 398,'DataHTF_UL2017': 399,'DataHT_UL2018': 400,'DataHTA_UL2018': 401,'DataHTB_UL2018': 402,'DataHTC_UL2018': 403,'DataHTD_UL2018': 404,'SampleHTFake_UL2016APV': 405,'SampleHTFake_UL2016': 406,'SampleHTFake_UL2017': 407,'SampleHTFake_UL2018': 408,}
-
-aggregated_samples_UL2017 = {
-    'VG':  [ZG_UL2017, WG_UL2017],
-    'TVX': [TTGJets_UL2017, TTZToQQ_UL2017, TTZToLLNuNu_UL2017, TTWJetsToQQ_UL2017, TTWJetsToLNu_UL2017, tZq_ll_4f_UL2017],
-    'Triboson': [WWW_4F_UL2017, WWZ_4F_UL2017, WZZ_UL2017, ZZZ_UL2017, WWG_UL2017],
-    'TTTo2L2Nu': [TTTo2L2Nu_UL2017],
-    'WZ': [WZ_UL2017],
-    'DYJetsToLL_FxFx': [DYJetsToLL_M50_FxFx_UL2017],
-    'WrongSign': [WWto2L2Nu_UL2017, GluGluToWWToENEN_UL2017, GluGluToWWToENMN_UL2017, GluGluToWWToENTN_UL2017, GluGluToWWToMNEN_UL2017, GluGluToWWToMNMN_UL2017, GluGluToWWToMNTN_UL2017, GluGluToWWToTNEN_UL2017,
-                GluGluToWWToTNMN_UL2017,
-                GluGluToWWToTNTN_UL2017, ST_tW_top_UL2017,
-                ST_tW_antitop_UL2017,
-                GluGluHToWWTo2L2Nu_UL2017,
-                GluGluHToZZTo4L_UL2017, GluGluHToTauTau_UL2017, VBFHToWWTo2L2Nu_UL2017, VBFHToTauTau_UL2017, ttHToNonbb_UL2017, VHToNonbb_UL2017
-    ],
-    'ZZtoLep': [ZZTo2L2Nu_UL2017, ZZTo4L_UL2017, GluGluToContinToZZTo2e2nu_UL2017, GluGluToContinToZZTo2e2mu_UL2017, GluGluToContinToZZTo2e2tau_UL2017, GluGluToContinToZZTo2mu2nu_UL2017, GluGluToContinToZZTo2mu2tau_UL2017, GluGluToContinToZZTo4e_UL2017, GluGluToContinToZZTo4mu_UL2017, GluGluToContinToZZTo4tau_UL2017],
-    'VBS_SSWW_SM': [VBS_SSWW_LL_SM_UL2017, VBS_SSWW_TL_SM_UL2017, VBS_SSWW_TT_SM_UL2017],
-}
+from sample_ids import sampleDict
+
+# {aggregate: [samples]}, defined with the samples in samplesUL.json
+aggregated_samples_UL2017 = samplesUL.group("aggregated_samples_UL2017")
 
 aggregated_samples = aggregated_samples_UL2017
 
-# The txt files are "file:///scratch/cms/"...
+# The txt files are "file:///scratch/cms/"..., entries and clusters of every file are
+# kept in chain_index.sqlite (chain_index.py): only new files are opened, empty ones are dropped
 def read_lines_from_file(filename):
-    with open(filename, 'r') as file:
-        return [line.strip() for line in file.readlines()]
+    return read_chain(filename, redirector)
 
 chain = read_lines_from_file('chain.txt')
 chain_gluglu = read_lines_from_file('chain_gluglu.txt')
 chain_WZ = read_lines_from_file('chain_WZ.txt')
 
-if redirector != "":
-    chain = [path.replace("file:///scratch/cms/", redirector) for path in chain]
-    chain_gluglu = [path.replace("file:///scratch/cms/", redirector) for path in chain_gluglu]
-    chain_WZ = [path.replace("file:///scratch/cms/", redirector) for path in chain_WZ]
-
 print(chain[0])
 print(chain_gluglu[0])
 print(chain_WZ[0])
@@ -396,16 +432,25 @@ branchlist = [
     "Tau_leadTkDeltaPhi",
 ]
 
-def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTreeName = "Events",  nPart = nPartitions, useFlag_BadPFMuonDzFilter = True, LHE = True, label = "distrdf" ):
-    if distributed == True:
-        #df = RDataFrame("Events", chain, npartitions=nPart, daskclient=client, monitor_label = label)  #when using root version with monitoring features (/cvmfs/images.dodas.infn.it/registry.hub.docker.com/dodasts/root-in-docker:ubuntu22-kernel-v1-monitoring)
-        df = RDataFrame("Events", chain, npartitions=nPart, daskclient=client)  #when using standard root versions
-
-    else:
-        #df = delayed(RDataFrame)("Events", chain)
-        df = RDataFrame("Events", chain) #to run on all
-        #df = RDataFrame("Events", chain[0])
-
+def snapshot_options():
+    opts = ROOT.RDF.RSnapshotOptions()
+    opts.fLazy = True
+    if outputCompression is not None:
+        opts.fCompressionAlgorithm = outputCompression // 100
+        opts.fCompressionLevel = outputCompression % 100
+    if outputFormat == "RNTuple":
+        if not hasattr(ROOT.RDF, "ESnapshotOutputFormat"):
+            raise RuntimeError("RNTuple Snapshot needs ROOT >= 6.32, this is {}".format(ROOT.gROOT.GetVersion()))
+        opts.fOutputFormat = ROOT.RDF.ESnapshotOutputFormat.kRNTuple
+        if outputPageSize is not None:
+            if hasattr(opts, "fMaxUnzippedPageSize"):
+                opts.fMaxUnzippedPageSize = outputPageSize
+            else:
+                print("ROOT {}: RNTuple page size not configurable, using the default".format(ROOT.gROOT.GetVersion()))
+    return opts
+
+def preselection_graph(df, useFlag_BadPFMuonDzFilter = True):
+    # filters and defines of the preselection, useFlag_BadPFMuonDzFilter = None: per sample (execute_MC_datasets)
     df_year = df.DefinePerSample("Year","GetYear(rdfslot_, rdfsampleinfo_)")
     df_sample = df_year.DefinePerSample("Sample", "GetSample(rdfslot_, rdfsampleinfo_)")
 
@@ -413,9 +458,14 @@ def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTre
         df_METHLTFilter = df_sample.Define("METHLTFilter", "MET_HLT_Filter_UL2017(Year, Flag_goodVertices, Flag_HBHENoiseFilter, Flag_HBHENoiseIsoFilter, Flag_EcalDeadCellTriggerPrimitiveFilter, Flag_BadPFMuonFilter, Flag_globalSuperTightHalo2016Filter, HLT_IsoMu27, HLT_Mu50, HLT_OldMu100, HLT_TkMu100,  HLT_Ele35_WPTight_Gsf, HLT_Ele32_WPTight_Gsf_L1DoubleEG, HLT_Photon200, Flag_ecalBadCalibFilter, Flag_BadPFMuonDzFilter, L1_SingleIsoEG30er2p1, L1_SingleIsoEG32, L1_SingleEG40, Flag_eeBadScFilter)")\
                                 .Filter("METHLTFilter == true", "MET HLT Filter")
         
-    else:
+    elif useFlag_BadPFMuonDzFilter == False:
         df_METHLTFilter = df_sample.Define("METHLTFilter", "MET_HLT_Filter_UL2017_nodz(Year, Flag_goodVertices, Flag_HBHENoiseFilter, Flag_HBHENoiseIsoFilter, Flag_EcalDeadCellTriggerPrimitiveFilter, Flag_BadPFMuonFilter, Flag_globalSuperTightHalo2016Filter, HLT_IsoMu27, HLT_Mu50, HLT_OldMu100, HLT_TkMu100,  HLT_Ele35_WPTight_Gsf, HLT_Ele32_WPTight_Gsf_L1DoubleEG, HLT_Photon200, Flag_ecalBadCalibFilter, L1_SingleIsoEG30er2p1, L1_SingleIsoEG32, L1_SingleEG40, Flag_eeBadScFilter)")\
                                 .Filter("METHLTFilter == true", "MET HLT Filter")
+    else:
+        # chosen per sample from the useDzFilter metadata of the RDatasetSpec
+        df_METHLTFilter = df_sample.DefinePerSample("useDzFilter", 'rdfsampleinfo_.GetI("useDzFilter") == 1')\
+                                .Define("METHLTFilter", "useDzFilter ? MET_HLT_Filter_UL2017(Year, Flag_goodVertices, Flag_HBHENoiseFilter, Flag_HBHENoiseIsoFilter, Flag_EcalDeadCellTriggerPrimitiveFilter, Flag_BadPFMuonFilter, Flag_globalSuperTightHalo2016Filter, HLT_IsoMu27, HLT_Mu50, HLT_OldMu100, HLT_TkMu100,  HLT_Ele35_WPTight_Gsf, HLT_Ele32_WPTight_Gsf_L1DoubleEG, HLT_Photon200, Flag_ecalBadCalibFilter, Flag_BadPFMuonDzFilter, L1_SingleIsoEG30er2p1, L1_SingleIsoEG32, L1_SingleEG40, Flag_eeBadScFilter) : MET_HLT_Filter_UL2017_nodz(Year, Flag_goodVertices, Flag_HBHENoiseFilter, Flag_HBHENoiseIsoFilter, Flag_EcalDeadCellTriggerPrimitiveFilter, Flag_BadPFMuonFilter, Flag_globalSuperTightHalo2016Filter, HLT_IsoMu27, HLT_Mu50, HLT_OldMu100, HLT_TkMu100,  HLT_Ele35_WPTight_Gsf, HLT_Ele32_WPTight_Gsf_L1DoubleEG, HLT_Photon200, Flag_ecalBadCalibFilter, L1_SingleIsoEG30er2p1, L1_SingleIsoEG32, L1_SingleEG40, Flag_eeBadScFilter)")\
+                                .Filter("METHLTFilter == true", "MET HLT Filter")
     #### preselection #####
     df_preselection = df_METHLTFilter.Filter("PV_ndof> 4 && abs(PV_z) < 24 && hypot(PV_x, PV_y)<2", "Good vertex")\
                                     .Define("HT_eventHT", "GetEventHT(Jet_pt, Jet_eta, Jet_phi, Jet_mass)")\
@@ -424,13 +474,13 @@ def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTre
 
     #### lepSF #####
     df_LepSF = df_preselection.Define("ElectronSFs", "ElectronSFs(Electron_pt, Electron_eta, Electron_pdgId, Year)")\
-                            .Define("Electron_effSF", "getFlattenedMatrixColumn(ElectronSFs, 3, 0)")\
-                            .Define("Electron_effSF_errUp", "getFlattenedMatrixColumn(ElectronSFs, 3, 1)")\
-                            .Define("Electron_effSF_errDown", "getFlattenedMatrixColumn(ElectronSFs, 3, 2)")\
+                            .Define("Electron_effSF", "ElectronSFs.nominal")\
+                            .Define("Electron_effSF_errUp", "ElectronSFs.up")\
+                            .Define("Electron_effSF_errDown", "ElectronSFs.down")\
                             .Define("MuonSFs", "MuonSFs(Muon_pt, Muon_eta, Muon_pdgId, Year)")\
-                            .Define("Muon_effSF", "getFlattenedMatrixColumn(MuonSFs, 3, 0)")\
-                            .Define("Muon_effSF_errUp", "getFlattenedMatrixColumn(MuonSFs, 3, 1)")\
-                            .Define("Muon_effSF_errDown", "getFlattenedMatrixColumn(MuonSFs, 3, 2)")
+                            .Define("Muon_effSF", "MuonSFs.nominal")\
+                            .Define("Muon_effSF_errUp", "MuonSFs.up")\
+                            .Define("Muon_effSF_errDown", "MuonSFs.down")
 
     #### puWeight #####
     #df_puWeight = df_mht
@@ -449,16 +499,16 @@ def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTre
 
     #### btagSF ##### preselection part2
     df_btagSF = df_prefCorr.Define("btagSFs",  'btagSF(Jet_pt, Jet_eta, Jet_hadronFlavour, Jet_btagDeepFlavB, Year, \"M\")')\
-                    .Define("Jet_btagSF_deepjet_M", "getMatrixColumn(btagSFs, 0)")\
-                    .Define("Jet_btagSF_deepjet_M_up", "getMatrixColumn(btagSFs, 1)")\
-                    .Define("Jet_btagSF_deepjet_M_down", "getMatrixColumn(btagSFs, 2)")
+                    .Define("Jet_btagSF_deepjet_M", "btagSFs.nominal")\
+                    .Define("Jet_btagSF_deepjet_M_up", "btagSFs.up")\
+                    .Define("Jet_btagSF_deepjet_M_down", "btagSFs.down")
 
 
     #### muonScaleRes ####
-    df_muonScaleRes = df_btagSF.Define("muonCorrectedPTs", "muonScaleRes(Muon_pt, Muon_eta, Muon_phi, Muon_charge, Muon_nTrackerLayers, Muon_genPartIdx, GenPart_pt, Year)")\
-                            .Define("Muon_corrected_pt", "getFlattenedMatrixColumn(muonCorrectedPTs, 3, 0)")\
-                            .Define("Muon_correctedUp_pt", "getFlattenedMatrixColumn(muonCorrectedPTs, 3, 1)")\
-                            .Define("Muon_correctedDown_pt", "getFlattenedMatrixColumn(muonCorrectedPTs, 3, 2)")
+    df_muonScaleRes = df_btagSF.Define("muonCorrectedPTs", "muonScaleRes(Muon_pt, Muon_eta, Muon_phi, Muon_charge, Muon_nTrackerLayers, Muon_genPartIdx, GenPart_pt, run, luminosityBlock, event, Year)")\
+                            .Define("Muon_corrected_pt", "muonCorrectedPTs.nominal")\
+                            .Define("Muon_correctedUp_pt", "muonCorrectedPTs.up")\
+                            .Define("Muon_correctedDown_pt", "muonCorrectedPTs.down")
 
 
     #### metCorrector and fatJetCorrector #### ####
@@ -479,10 +529,26 @@ def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTre
     for n,v in enumerate(mett1smearvariations[1:]):
         if v in variations:
             df_jme = df_jme.Define("MET_T1Smear_pt_{}".format(v), "metsVars.pt({})".format(1+n)).Define("MET_T1Smear_phi_{}".format(v), "metsVars.phi({})".format(1+n))
-    
+
+    return df_jme
+
+def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTreeName = "Events",  nPart = nPartitions, useFlag_BadPFMuonDzFilter = True, LHE = True, label = "distrdf" ):
+    if distributed == True:
+        if nPart is None:
+            chain, nPart = plan_partitions(chain, target_seconds = targetTaskSeconds, min_partitions = sum(w["nthreads"] for w in client.scheduler_info()["workers"].values()))
+            print("{}: {} files in {} partitions".format(label, len(chain), nPart))
+        #df = RDataFrame("Events", chain, npartitions=nPart, daskclient=client, monitor_label = label)  #when using root version with monitoring features (/cvmfs/images.dodas.infn.it/registry.hub.docker.com/dodasts/root-in-docker:ubuntu22-kernel-v1-monitoring), same files as monitorTasks
+        df = RDataFrame("Events", chain, npartitions=nPart, daskclient=client)  #when using standard root versions
+
+    else:
+        #df = delayed(RDataFrame)("Events", chain)
+        df = RDataFrame("Events", chain) #to run on all
+        #df = RDataFrame("Events", chain[0])
+
+    df_jme = preselection_graph(df, useFlag_BadPFMuonDzFilter)
+
     ### book snapshot ####
-    opts = ROOT.RDF.RSnapshotOptions()
-    opts.fLazy = True
+    opts = snapshot_options()
 
     if LHE == False:
         branches = branchlist_[4:]
@@ -496,23 +562,78 @@ def execute_MC(chain, branchlist_, outFilePath = "./preselectionUL.root", outTre
 
     return df_jme_lazy
 
-df_sn = execute_MC(chain, branchlist, outFilePath = "./preselectionUL.root", outTreeName = "Events", label = "main")
-df_sn_gluglu = execute_MC(chain_gluglu, branchlist, outFilePath = "./preselectionUL_GluGlu.root",  outTreeName = "Events", nPart = 5, useFlag_BadPFMuonDzFilter = False, label = "gluglu")
-df_sn_WZ = execute_MC(chain_WZ, branchlist, outFilePath = "./preselectionUL_WZ.root", outTreeName = "Events", nPart = 5,  useFlag_BadPFMuonDzFilter = True, LHE = False, label = "WZ")
+def execute_MC_datasets(datasets, branchlist_, outTreeName = "Events", nPart = nPartitions):
+    # one graph over several datasets: one RSample each in a RDatasetSpec, the choices of execute_MC
+    # (dz filter) come from the sample metadata and each dataset has its own Snapshot.
+    # Datasets with and without the LHE branches cannot share a graph (a default value for the
+    # missing arrays cannot be shipped to the workers), they make one graph each.
+    snapshots = []
+    for LHE in (True, False):
+        group = [d for d in datasets if d["LHE"] == LHE]
+        if group:
+            snapshots += execute_MC_spec(group, branchlist_ if LHE else branchlist_[4:], outTreeName, nPart)
+    return snapshots
+
+def execute_MC_spec(datasets, branches, outTreeName = "Events", nPart = nPartitions):
+    samples = [d["chain"] for d in datasets]
+    if distributed == True and nPart is None:
+        samples, nPart = plan_samples(samples, target_seconds = targetTaskSeconds, min_partitions = sum(w["nthreads"] for w in client.scheduler_info()["workers"].values()))
+        print("{}: {} files in {} partitions".format(", ".join(d["label"] for d in datasets), sum(len(files) for files in samples), nPart))
+
+    spec = ROOT.RDF.Experimental.RDatasetSpec()
+    for n, (d, files) in enumerate(zip(datasets, samples)):
+        meta = ROOT.RDF.Experimental.RMetaData()
+        meta.Add("dataset", n)
+        meta.Add("useDzFilter", 1 if d["useFlag_BadPFMuonDzFilter"] else 0)
+        spec.AddSample(ROOT.RDF.Experimental.RSample(d["label"], "Events", files, meta))
+
+    if distributed == True:
+        df = RDataFrame(spec, npartitions=nPart, daskclient=client)
+    else:
+        df = RDataFrame(spec)
+
+    # Flag_BadPFMuonDzFilter is missing in the older NanoAOD versions, where it is not used (useDzFilter = 0)
+    df = df.DefaultValueFor("Flag_BadPFMuonDzFilter", True).DefinePerSample("Dataset", 'rdfsampleinfo_.GetI("dataset")')
+    df_jme = preselection_graph(df, None)
+
+    ### book snapshots, one per dataset ####
+    opts = snapshot_options()
+
+    snapshots = []
+    for n, d in enumerate(datasets):
+        snapshots.append(df_jme.Filter("Dataset == {}".format(n), d["label"]).Snapshot(outTreeName, d["outFilePath"], branches, opts))
+    return snapshots
+
+datasets = [
+    {"label": "main", "chain": chain, "outFilePath": os.path.join(outputBuffer, "preselectionUL.root"), "useFlag_BadPFMuonDzFilter": True, "LHE": True},
+    {"label": "gluglu", "chain": chain_gluglu, "outFilePath": os.path.join(outputBuffer, "preselectionUL_GluGlu.root"), "useFlag_BadPFMuonDzFilter": False, "LHE": True},
+    {"label": "WZ", "chain": chain_WZ, "outFilePath": os.path.join(outputBuffer, "preselectionUL_WZ.root"), "useFlag_BadPFMuonDzFilter": True, "LHE": False},
+]
+
+if singlePass == True:
+    proxies = execute_MC_datasets(datasets, branchlist)
+else:
+    proxies = [execute_MC(d["chain"], branchlist, outFilePath = d["outFilePath"], outTreeName = "Events", useFlag_BadPFMuonDzFilter = d["useFlag_BadPFMuonDzFilter"], LHE = d["LHE"], label = d["label"]) for d in datasets]
+
 
 if distributed == True:
     RunGraphs = ROOT.RDF.Experimental.Distributed.RunGraphs
 else:
     RunGraphs = ROOT.RDF.RunGraphs
 
-proxies = [
-    df_sn,
-    df_sn_gluglu,
-    df_sn_WZ
-]
+# one file per task in distributed mode: merged in the background into a few large files, on the node that wrote them
+merger = None
+if distributed == True and mergeOutputs == True:
+    merger = OutputMerger(outputBuffer, [os.path.basename(d["outFilePath"])[:-len(".root")] for d in datasets], mergedDestination, mergedTargetBytes, client=client)
+    merger.start()
 
 RunGraphs(proxies)
 
-dfs = [df_.GetValue() for df_ in proxies]
+if merger is not None:
+    # the parts are deleted once merged: no dataframes on the Snapshot outputs, the postselection reads <name>_merged.txt
+    for name, merged in merger.finish().items():
+        print("{}: {} merged files".format(name, len(merged)))
+else:
+    dfs = [df_.GetValue() for df_ in proxies]
 if distributed == True:
     client.close()
@@ -43,6 +43,13 @@ using rvec_f = const RVec<float> &;
 using rvec_i = const RVec<int> &;
 using rvec_b = const RVec<bool> &;
 
+// nominal/up/down values of a per-object quantity, one flat RVec each (struct of arrays)
+struct RVecVariations {
+    RVec<float> nominal;
+    RVec<float> up;
+    RVec<float> down;
+};
+
 const string remote_storage = "https://ttedesch.web.cern.ch/ttedesch/NEWERA/nanoAOD-tools/";
 
 //cout<<"ciao"<<endl;
@@ -152,50 +159,46 @@ float getSecond(rvec_f a){
 //    return year;
 //}
 
-string GetYear(unsigned int slot, const ROOT::RDF::RSampleInfo &id){
-    string year="2017";
-    if (id.Contains("RunIISummer16NanoAODv7")){
-        year = "2016";
-    } else if (id.Contains("RunIIFall17NanoAODv7")){
-        year = "2017";
-    } else if (id.Contains("RunIIAutumn18NanoAODv7")){
-        year = "2018";
-    }
-    return year;
-}
-
-map<string, int> dataset_map = {{"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 25}, {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 26}, {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 18}, {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 19}, {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 20}, {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 21}, {"/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 22}, {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 23}, {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 28}, {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", 50}, {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", 51}, {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", 52}, {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", 53}, {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 54}, {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 15}, {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 64}, {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 67}, {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 29}, {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 30}, {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 31}, {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 32}, {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 33}, {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 34}, {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 35}, {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 36}, {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 37}, {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 38}, {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 40}, {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 42}, {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 43}, {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 44}, {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 45}, {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 46}, {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 47}, {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 1}, {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 2}, {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 11}, {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 4}, {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 5}, {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 6}, {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 8}, {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 3}, {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 7}, {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 10}, {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", 71}, {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", 72}, {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 73}, {"/SingleElectron/Run2016B-ver2_HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 363}, {"/SingleElectron/Run2016C-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 364}, {"/SingleElectron/Run2016D-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 365}, {"/SingleElectron/Run2016E-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 366}, {"/SingleElectron/Run2016F-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 367}, {"/SingleMuon/Run2016B-ver2_HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 341}, {"/SingleMuon/Run2016C-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 342}, {"/SingleMuon/Run2016D-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 343}, {"/SingleMuon/Run2016E-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 344}, {"/SingleMuon/Run2016F-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", 345}, {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 110}, {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 111}, {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 103}, {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 104}, {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 105}, {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 106}, {"/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", 107}, {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 108}, {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 113}, {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", 134}, {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", 135}, {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", 136}, {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", 137}, {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 138}, {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 100}, {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 148}, {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 151}, {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 114}, {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 115}, {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 116}, {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 117}, {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 118}, {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 119}, {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 120}, {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 121}, {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 122}, {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 123}, {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 125}, {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 127}, {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv2-106X_mcRun2_asymptotic_v15-v1/NANOAODSIM", 128}, {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 129}, {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 130}, {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 131}, {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 132}, {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 86}, {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODv9-20UL16JMENano_106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 87}, {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 96}, {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 89}, {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 90}, {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 91}, {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 93}, {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 88}, {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 92}, {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 95}, {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 155}, {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", 156}, {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", 157}, {"/SingleElectron/Run2016F-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", 369}, {"/SingleElectron/Run2016G-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", 370}, {"/SingleElectron/Run2016H-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", 371}, {"/SingleMuon/Run2016F-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", 347}, {"/SingleMuon/Run2016G-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", 348}, {"/SingleMuon/Run2016H-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", 349}, {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 194}, {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 195}, {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 187}, {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 188}, {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 189}, {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 190}, {"/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 191}, {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 192}, {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 197}, {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v2/NANOAODSIM", 219}, {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 220}, {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v2/NANOAODSIM", 221}, {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v2/NANOAODSIM", 222}, {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 223}, {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 184}, {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 233}, {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 236}, {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 198}, {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 199}, {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 200}, {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 201}, {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 202}, {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 203}, {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 204}, {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv2-106X_mc2017_realistic_v8-v1/NANOAODSIM", 205}, {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 206}, {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 207}, {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL17NanoAODv2-106X_mc2017_realistic_v8-v1/NANOAODSIM", 209}, {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 211}, {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 212}, {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 213}, {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 214}, {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 215}, {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 216}, {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 170}, {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 171}, {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 180}, {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 173}, {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 174}, {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 175}, {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 177}, {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 172}, {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 176}, {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 179}, {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 240}, {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 241}, {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", 242}, {"/SingleElectron/Run2017B-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 373}, {"/SingleElectron/Run2017C-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 374}, {"/SingleElectron/Run2017D-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 375}, {"/SingleElectron/Run2017E-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 376}, {"/SingleElectron/Run2017F-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 377}, {"/SingleMuon/Run2017B-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 351}, {"/SingleMuon/Run2017C-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 352}, {"/SingleMuon/Run2017D-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 353}, {"/SingleMuon/Run2017E-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 354}, {"/SingleMuon/Run2017F-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", 355}, {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 279}, {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 280}, {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 272}, {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 273}, {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 274}, {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 275}, {"/TTWJetsToLNu_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 276}, {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", 277}, {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 282}, {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", 304}, {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", 305}, {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", 306}, {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", 307}, {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 308}, {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 269}, {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 318}, {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 321}, {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 283}, {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 284}, {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 285}, {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 286}, {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 287}, {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 288}, {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 289}, {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 290}, {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 291}, {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 292}, {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", 294}, {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 296}, {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 297}, {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 298}, {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 299}, {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 300}, {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 301}, {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 255}, {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 256}, {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 265}, {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 258}, {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 259}, {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 260}, {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 262}, {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 257}, {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", 261}, {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", 264}, {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", 325}, {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", 326}, {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", 327}, {"/EGamma/Run2018A-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", 379}, {"/EGamma/Run2018B-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", 380}, {"/EGamma/Run2018C-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", 381}, {"/EGamma/Run2018D-UL2018_MiniAODv2_NanoAODv9-v3/NANOAOD", 382}, {"/SingleMuon/Run2018A-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", 357}, {"/SingleMuon/Run2018B-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", 358}, {"/SingleMuon/Run2018C-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", 359}, {"/SingleMuon/Run2018D-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", 360}, {"/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", 208}};
-
-string tokenize(string s, string del = " ")
-{
-    int start = 0;
-    int end = s.find(del);
-    int i = 0;
-    int start_ = 0;
-    int end_ = 0;
-    string string1, string2, string3, string4;
-    while (end != -1) {
-        //cout << s.substr(start, end - start) << endl;
-        start = end + del.size();
-        end = s.find(del, start);
-        if (i == 5) string1 = s.substr(start, end - start);
-        else if (i==6) string2 = s.substr(start, end - start);
-        else if (i==7) string3 = s.substr(start, end - start);
-        else if (i==8) string4 = s.substr(start, end - start);
-        //cout<<i<<" "<<s.substr(start, end - start)<<endl;
-        i++;
+// LFN (/store/...) of the file being processed, without the redirector and the tree name
+string GetLFN(const ROOT::RDF::RSampleInfo &id){
+    string s = id.AsString();
+    size_t start = s.find("/store/");
+    if (start == string::npos) start = 0;
+    size_t end = s.rfind(".root");
+    return s.substr(start, end == string::npos ? string::npos : end + 5 - start);
+}
+
+// year and sample id are looked up once per file in sample_table (sample_table_UL.h, make_sample_table.py)
+int GetYear(unsigned int slot, const ROOT::RDF::RSampleInfo &id){
+    if (auto info = FindSampleInfo(sample_table, GetLFN(id))) return info->year;
+    // file not in sample_table_UL.h: guess from the campaign
+    if (id.Contains("UL16NanoAODAPV")) return kUL2016APV;
+    else if (id.Contains("UL16NanoAOD")) return kUL2016;
+    else if (id.Contains("UL18NanoAOD")) return kUL2018;
+    return kUL2017;
+}
+
+// /store/mc/<campaign>/<primary>/<tier>/<conditions>/... -> /<primary>/<campaign>-<conditions>/<tier>
+string GetDatasetName(const string &lfn){
+    vector<string> tokens;
+    size_t start = 0, end;
+    while ((end = lfn.find("/", start)) != string::npos) {
+        tokens.push_back(lfn.substr(start, end - start));
+        start = end + 1;
     }
-    string result;
-    result += string("/") + string2 + string("/") + string1 + string("-") + string4 + string("/") + string3;
-    return result;
+    if (tokens.size() < 7) return "";
+    return "/" + tokens[4] + "/" + tokens[3] + "-" + tokens[6] + "/" + tokens[5];
 }
 
-
 int GetSample(unsigned int slot, const ROOT::RDF::RSampleInfo &id){
-    return dataset_map[tokenize(id.AsString(), "/")];
+    string lfn = GetLFN(id);
+    if (auto info = FindSampleInfo(sample_table, lfn)) return info->id;
+    // file not in sample_table_UL.h: fall back to its DAS name
+    auto ds = FindSampleInfo(dataset_table, GetDatasetName(lfn));
+    return ds ? ds->id : 0;
 }
 
-bool MET_HLT_Filter_UL2017(string Year, Bool_t Flag_goodVertices, Bool_t Flag_HBHENoiseFilter, Bool_t Flag_HBHENoiseIsoFilter, Bool_t Flag_EcalDeadCellTriggerPrimitiveFilter, Bool_t Flag_BadPFMuonFilter, Bool_t Flag_globalSuperTightHalo2016Filter, Bool_t HLT_IsoMu27, Bool_t HLT_Mu50, Bool_t HLT_OldMu100, Bool_t HLT_TkMu100,  Bool_t HLT_Ele35_WPTight_Gsf, Bool_t HLT_Ele32_WPTight_Gsf_L1DoubleEG, Bool_t HLT_Photon200, Bool_t Flag_ecalBadCalibFilter, Bool_t Flag_BadPFMuonDzFilter, Bool_t L1_SingleIsoEG30er2p1, Bool_t L1_SingleIsoEG32, Bool_t L1_SingleEG40, Bool_t Flag_eeBadScFilter){
+bool MET_HLT_Filter_UL2017(int Year, Bool_t Flag_goodVertices, Bool_t Flag_HBHENoiseFilter, Bool_t Flag_HBHENoiseIsoFilter, Bool_t Flag_EcalDeadCellTriggerPrimitiveFilter, Bool_t Flag_BadPFMuonFilter, Bool_t Flag_globalSuperTightHalo2016Filter, Bool_t HLT_IsoMu27, Bool_t HLT_Mu50, Bool_t HLT_OldMu100, Bool_t HLT_TkMu100,  Bool_t HLT_Ele35_WPTight_Gsf, Bool_t HLT_Ele32_WPTight_Gsf_L1DoubleEG, Bool_t HLT_Photon200, Bool_t Flag_ecalBadCalibFilter, Bool_t Flag_BadPFMuonDzFilter, Bool_t L1_SingleIsoEG30er2p1, Bool_t L1_SingleIsoEG32, Bool_t L1_SingleEG40, Bool_t Flag_eeBadScFilter){
     
     bool good_MET = Flag_goodVertices && Flag_globalSuperTightHalo2016Filter && Flag_HBHENoiseFilter && Flag_HBHENoiseIsoFilter && Flag_EcalDeadCellTriggerPrimitiveFilter && Flag_BadPFMuonFilter && Flag_eeBadScFilter && Flag_ecalBadCalibFilter && Flag_BadPFMuonDzFilter;
     
@@ -207,7 +210,7 @@ bool MET_HLT_Filter_UL2017(string Year, Bool_t Flag_goodVertices, Bool_t Flag_HB
     return good_MET && good_HLT;
 }
 
-bool MET_HLT_Filter_UL2017_nodz(string Year, Bool_t Flag_goodVertices, Bool_t Flag_HBHENoiseFilter, Bool_t Flag_HBHENoiseIsoFilter, Bool_t Flag_EcalDeadCellTriggerPrimitiveFilter, Bool_t Flag_BadPFMuonFilter, Bool_t Flag_globalSuperTightHalo2016Filter, Bool_t HLT_IsoMu27, Bool_t HLT_Mu50, Bool_t HLT_OldMu100, Bool_t HLT_TkMu100,  Bool_t HLT_Ele35_WPTight_Gsf, Bool_t HLT_Ele32_WPTight_Gsf_L1DoubleEG, Bool_t HLT_Photon200, Bool_t Flag_ecalBadCalibFilter,  Bool_t L1_SingleIsoEG30er2p1, Bool_t L1_SingleIsoEG32, Bool_t L1_SingleEG40, Bool_t Flag_eeBadScFilter){
+bool MET_HLT_Filter_UL2017_nodz(int Year, Bool_t Flag_goodVertices, Bool_t Flag_HBHENoiseFilter, Bool_t Flag_HBHENoiseIsoFilter, Bool_t Flag_EcalDeadCellTriggerPrimitiveFilter, Bool_t Flag_BadPFMuonFilter, Bool_t Flag_globalSuperTightHalo2016Filter, Bool_t HLT_IsoMu27, Bool_t HLT_Mu50, Bool_t HLT_OldMu100, Bool_t HLT_TkMu100,  Bool_t HLT_Ele35_WPTight_Gsf, Bool_t HLT_Ele32_WPTight_Gsf_L1DoubleEG, Bool_t HLT_Photon200, Bool_t Flag_ecalBadCalibFilter,  Bool_t L1_SingleIsoEG30er2p1, Bool_t L1_SingleIsoEG32, Bool_t L1_SingleEG40, Bool_t Flag_eeBadScFilter){
     
     bool good_MET = Flag_goodVertices && Flag_globalSuperTightHalo2016Filter && Flag_HBHENoiseFilter && Flag_HBHENoiseIsoFilter && Flag_EcalDeadCellTriggerPrimitiveFilter && Flag_BadPFMuonFilter && Flag_eeBadScFilter && Flag_ecalBadCalibFilter;
     
@@ -256,6 +259,7 @@ class WeightCalculatorFromHistogram {
   
   float getWeight(float x, float y=0) const;
   float getWeightErr(float x, float y=0) const;
+  const TH1* getHistogram() const { return histogram_; }
   
  private:
   std::vector<float> loadVals(TH1 *hist, bool norm=true);
@@ -414,7 +418,7 @@ LeptonEfficiencyCorrector:: LeptonEfficiencyCorrector(std::vector<std::string> f
   }
 
   for(int i=0; i<(int)files.size();++i) {
-    TFile *f = TFile::Open(files[i].c_str(),"read");
+    TFile *f = TFile::Open(ReplicaPath(files[i].c_str()),"read");
     if(!f) {
       std::cout << "WARNING! File " << files[i] << " cannot be opened. Skipping this scale factor " << std::endl;
       continue;
@@ -507,7 +511,7 @@ LeptonEfficiencyCorrector worker_el_2017(el_f_2017, el_h_2017);
 //LeptonEfficiencyCorrector worker_el_2018(el_f_2018, el_h_2018);
 
 
-RVec<float> ElectronSFs(rvec_f Electron_pt, rvec_f Electron_eta, rvec_i Electron_pdgId, string Year){
+RVecVariations ElectronSFs(rvec_f Electron_pt, rvec_f Electron_eta, rvec_i Electron_pdgId, int Year){
     
     //LeptonEfficiencyCorrector worker_el;
 
@@ -522,34 +526,29 @@ RVec<float> ElectronSFs(rvec_f Electron_pt, rvec_f Electron_eta, rvec_i Electron
     //    worker_el = worker_el_2018;
     //}
     
-    RVec<float> sf_el(Electron_pt.size());
-    RVec<float> sferr_el(Electron_pt.size());
+    const size_t n = Electron_pt.size();
+    RVecVariations result;
+    result.nominal.resize(n);
+    result.up.resize(n);
+    result.down.resize(n);
     
     /*
     for (size_t j = 0; j < Electron_pt.size(); j++) sf_el[j] =  worker_el.getSF(Electron_pdgId[j], Electron_pt[j], Electron_eta[j]);
     for (size_t j = 0; j < Electron_pt.size(); j++) sferr_el[j] =  worker_el.getSFErr(Electron_pdgId[j], Electron_pt[j], Electron_eta[j]);
     */
-    
-    for (size_t j = 0; j < Electron_pt.size(); j++) sf_el[j] =  worker_el_2017.getSF(Electron_pdgId[j], Electron_pt[j], Electron_eta[j]);
-    for (size_t j = 0; j < Electron_pt.size(); j++) sferr_el[j] =  worker_el_2017.getSFErr(Electron_pdgId[j], Electron_pt[j], Electron_eta[j]);
-    
-    RVec<float> Electron_effSF_errUp(Electron_pt.size());
-    for (size_t j = 0; j < Electron_pt.size(); j++) Electron_effSF_errUp[j] = sferr_el[j] + sf_el[j];
-    
-    RVec<float> Electron_effSF_errDown(Electron_pt.size());
-    for (size_t j = 0; j < Electron_pt.size(); j++) Electron_effSF_errDown[j] = sferr_el[j] - sf_el[j];
-    
-    RVec<float> result;
-    for (int j = 0; j < Electron_pt.size(); j++){
-        result.emplace_back(sf_el[j]);
-        result.emplace_back(Electron_effSF_errUp[j]);
-        result.emplace_back(Electron_effSF_errDown[j]);
+
+    for (size_t j = 0; j < n; j++){
+        float sf = worker_el_2017.getSF(Electron_pdgId[j], Electron_pt[j], Electron_eta[j]);
+        float sferr = worker_el_2017.getSFErr(Electron_pdgId[j], Electron_pt[j], Electron_eta[j]);
+        result.nominal[j] = sf;
+        result.up[j] = sferr + sf;
+        result.down[j] = sferr - sf;
     }
     
     return result;
 }
 
-RVec<float> MuonSFs(rvec_f Muon_pt, rvec_f Muon_eta, rvec_i Muon_pdgId, string Year){
+RVecVariations MuonSFs(rvec_f Muon_pt, rvec_f Muon_eta, rvec_i Muon_pdgId, int Year){
     
     //LeptonEfficiencyCorrector worker_mu;
 
@@ -565,27 +564,23 @@ RVec<float> MuonSFs(rvec_f Muon_pt, rvec_f Muon_eta, rvec_i Muon_pdgId, string Y
     //    worker_mu = worker_mu_2018;
     //}
     
-    RVec<float> sf_mu(Muon_pt.size());
-    RVec<float> sferr_mu(Muon_pt.size()); 
+    const size_t n = Muon_pt.size();
+    RVecVariations result;
+    result.nominal.resize(n);
+    result.up.resize(n);
+    result.down.resize(n);
     
     /*
     for (size_t j = 0; j < Muon_pt.size(); j++) sf_mu[j] =  worker_mu.getSF(Muon_pdgId[j], Muon_pt[j], Muon_eta[j]);
     for (size_t j = 0; j < Muon_pt.size(); j++) sferr_mu[j] =  worker_mu.getSFErr(Muon_pdgId[j], Muon_pt[j], Muon_eta[j]);
     */
-    for (size_t j = 0; j < Muon_pt.size(); j++) sf_mu[j] =  worker_mu_2017.getSF(Muon_pdgId[j], Muon_pt[j], Muon_eta[j]);
-    for (size_t j = 0; j < Muon_pt.size(); j++) sferr_mu[j] =  worker_mu_2017.getSFErr(Muon_pdgId[j], Muon_pt[j], Muon_eta[j]);
-    
-    RVec<float> Muon_effSF_errUp(Muon_pt.size());
-    for (size_t j = 0; j < Muon_pt.size(); j++) Muon_effSF_errUp[j] = sferr_mu[j] + sf_mu[j];
-    
-    RVec<float> Muon_effSF_errDown(Muon_pt.size());
-    for (size_t j = 0; j < Muon_pt.size(); j++) Muon_effSF_errDown[j] = sferr_mu[j] - sf_mu[j];
-    
-    RVec<float> result;
-    for (int j = 0; j < Muon_pt.size(); j++){
-        result.emplace_back(sf_mu[j]);
-        result.emplace_back(Muon_effSF_errUp[j]);
-        result.emplace_back(Muon_effSF_errDown[j]);
+
+    for (size_t j = 0; j < n; j++){
+        float sf = worker_mu_2017.getSF(Muon_pdgId[j], Muon_pt[j], Muon_eta[j]);
+        float sferr = worker_mu_2017.getSFErr(Muon_pdgId[j], Muon_pt[j], Muon_eta[j]);
+        result.nominal[j] = sf;
+        result.up[j] = sferr + sf;
+        result.down[j] = sferr - sf;
     }
     
     return result;
@@ -598,6 +593,58 @@ void set_null_directory(TH2F *histo){
     histo->SetDirectory(NULL);
 }
 
+// Histogram frozen into plain arrays at initialization: the event loop does no TH1 virtual calls and
+// never touches the (remote) file the histogram was read from. Same global bin numbering as TH1,
+// under/overflow included, and FindBin gives the same bin as TAxis::FindBin.
+struct BinnedLUT {
+    struct Axis {
+        int n = 0;
+        double min = 0.;
+        double max = 0.;
+        std::vector<double> edges;  // filled only for variable-width bins
+
+        Axis() {}
+        Axis(const TAxis *axis) : n(axis->GetNbins()), min(axis->GetXmin()), max(axis->GetXmax()) {
+            const TArrayD *bins = axis->GetXbins();
+            if (bins->GetSize() > 0) edges.assign(bins->GetArray(), bins->GetArray() + bins->GetSize());
+        }
+
+        int FindBin(double v) const {
+            if (v < min) return 0;
+            if (!(v < max)) return n + 1;
+            if (edges.empty()) return 1 + int(n * (v - min) / (max - min));
+            // branch-free binary search for the last edge <= v
+            const double *base = edges.data();
+            size_t len = edges.size();
+            while (len > 1) {
+                size_t half = len / 2;
+                base = (base[half] <= v) ? base + half : base;
+                len -= half;
+            }
+            return 1 + int(base - edges.data());
+        }
+    };
+
+    Axis x;
+    Axis y;
+    std::vector<double> content;  // indexed by global bin
+    std::vector<double> error;
+
+    BinnedLUT() {}
+    BinnedLUT(const TH1 *histo) : x(histo->GetXaxis()), y(histo->GetYaxis()) {
+        const int ncells = histo->GetNcells();
+        content.resize(ncells);
+        error.resize(ncells);
+        for (int i = 0; i < ncells; i++) {
+            content[i] = histo->GetBinContent(i);
+            error[i] = histo->GetBinError(i);
+        }
+    }
+
+    int FindBin(double vx) const { return x.FindBin(vx); }
+    int FindBin(double vx, double vy) const { return x.FindBin(vx) + (x.n + 2) * y.FindBin(vy); }
+};
+
 /*
 TFile *pufile_data2016 = TFile::Open(TString(remote_storage) + TString(path_pu) + TString("PileupData_GoldenJSON_Full2016.root"));
 TH1 *histo_target_2016 = (TH1*)pufile_data2016->Get("pileup");
@@ -607,11 +654,11 @@ TFile *pufile_mc2016 = TFile::Open(TString(remote_storage) + TString(path_pu) +
 TH1 *histo_2016 = (TH1*)pufile_mc2016->Get("pu_mc");
 */
 
-TFile *pufile_data2017 = TFile::Open(TString(remote_storage) + TString(path_pu) + TString("PileupHistogram-goldenJSON-13tev-2017-99bins_withVar.root"));
+TFile *pufile_data2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString(path_pu) + TString("PileupHistogram-goldenJSON-13tev-2017-99bins_withVar.root")));
 TH1 *histo_target_2017 = (TH1*)pufile_data2017->Get("pileup");
 TH1 *histo_target_2017_plus = (TH1*)pufile_data2017->Get("pileup_plus");
 TH1 *histo_target_2017_minus = (TH1*)pufile_data2017->Get("pileup_minus");
-TFile *pufile_mc2017 = TFile::Open(TString(remote_storage) + TString(path_pu) + TString("mcPileup2017.root"));
+TFile *pufile_mc2017 = TFile::Open(ReplicaPath(TString(remote_storage) + TString(path_pu) + TString("mcPileup2017.root")));
 TH1 *histo_2017 = (TH1*)pufile_mc2017->Get("pu_mc");
 
 /*
@@ -668,14 +715,21 @@ WeightCalculatorFromHistogram worker_2017(histo_2017, histo_target_2017, true, t
 WeightCalculatorFromHistogram worker_2017_plus(histo_2017, histo_target_2017_plus, true, true, false);
 WeightCalculatorFromHistogram worker_2017_minus(histo_2017, histo_target_2017_minus, true, true, false);
 
-RVec<float> puWeight(string Year, int Pileup_nTrueInt){
+// weights (nominal, plus, minus) frozen at init, same lookup as WeightCalculatorFromHistogram::getWeight
+const int pu_nbins_2017 = histo_2017->GetNbinsX();
+const BinnedLUT pu_weights_2017[3] = {BinnedLUT(worker_2017.getHistogram()), BinnedLUT(worker_2017_plus.getHistogram()), BinnedLUT(worker_2017_minus.getHistogram())};
+
+inline float getPuWeight(const BinnedLUT & weights, float x){
+    int bin = std::max(1, std::min(weights.x.n, weights.FindBin(x)));
+    return weights.content[bin];
+}
+
+RVec<float> puWeight(int Year, int Pileup_nTrueInt){
     RVec<float> result(3);
-    if(Pileup_nTrueInt < histo_2017->GetNbinsX()) result[0] = worker_2017.getWeight(Pileup_nTrueInt);
-    else result[0] = 1;
-    if(Pileup_nTrueInt < histo_2017->GetNbinsX()) result[1] = worker_2017_plus.getWeight(Pileup_nTrueInt);
-    else result[1] = 1;
-    if(Pileup_nTrueInt < histo_2017->GetNbinsX()) result[2] = worker_2017_minus.getWeight(Pileup_nTrueInt);
-    else result[2] = 1;
+    for (int i = 0; i < 3; i++){
+        if(Pileup_nTrueInt < pu_nbins_2017) result[i] = getPuWeight(pu_weights_2017[i], Pileup_nTrueInt);
+        else result[i] = 1;
+    }
     return result;    
 }
 
@@ -688,19 +742,31 @@ string path_pf =  "data/prefire_maps/";
 //TH2F * L1prefiring_jetptvseta_2017BtoF = (TH2F *) L1PrefiringMaps->Get("L1prefiring_jetptvseta_2017BtoF");
 //TH2F * L1prefiring_photonptvseta_2017BtoF = (TH2F *) L1PrefiringMaps->Get("L1prefiring_photonptvseta_2017BtoF");
 
-TFile *L1PrefiringMaps = TFile::Open(TString(remote_storage) + TString(path_pf) + TString("L1PrefiringMaps.root"));
+TFile *L1PrefiringMaps = TFile::Open(ReplicaPath(TString(remote_storage) + TString(path_pf) + TString("L1PrefiringMaps.root")));
 TH2F * L1prefiring_jetptvseta_2017BtoF = (TH2F *) L1PrefiringMaps->Get("L1prefiring_jetptvseta_UL2017BtoF");
 TH2F * L1prefiring_photonptvseta_2017BtoF = (TH2F *) L1PrefiringMaps->Get("L1prefiring_photonptvseta_UL2017BtoF");
 
 //TH2F * L1prefiring_jetptvseta_UL2017BtoF = (TH2F *) L1PrefiringMaps->Get("L1prefiring_jetptvseta_UL2017BtoF");
 //TH2F * L1prefiring_photonptvseta_UL2017BtoF = (TH2F *) L1PrefiringMaps->Get("L1prefiring_photonptvseta_UL2017BtoF");
 
-float GetPrefireProbability(TH2F *Map, float eta, float pt, float maxpt, int variation){
+const BinnedLUT L1prefiring_jetptvseta_2017BtoF_lut(L1prefiring_jetptvseta_2017BtoF);
+const BinnedLUT L1prefiring_photonptvseta_2017BtoF_lut(L1prefiring_photonptvseta_2017BtoF);
+
+// all the pileup and prefiring inputs are frozen in the tables above: close the remote files
+bool close_pu_prefiring_files(){
+    for (TFile *f : {pufile_data2017, pufile_mc2017, L1PrefiringMaps}) f->Close();
+    histo_target_2017 = histo_target_2017_plus = histo_target_2017_minus = histo_2017 = nullptr;
+    L1prefiring_jetptvseta_2017BtoF = L1prefiring_photonptvseta_2017BtoF = nullptr;
+    return true;
+}
+bool pu_prefiring_files_closed = close_pu_prefiring_files();
+
+float GetPrefireProbability(const BinnedLUT & Map, float eta, float pt, float maxpt, int variation){
         float x = maxpt - 0.01;
-        int bin = Map->FindBin(eta, min(pt, x));
-        float pref_prob = Map->GetBinContent(bin);
+        int bin = Map.FindBin(eta, min(pt, x));
+        float pref_prob = Map.content[bin];
 
-        float stat = Map->GetBinError(bin);  //bin statistical uncertainty
+        float stat = Map.error[bin];  //bin statistical uncertainty
         float syst = 0.2 * pref_prob;  //20% of prefire rate
 
         float r = sqrt(stat * stat + syst * syst);
@@ -724,7 +790,7 @@ float EGvalue(rvec_f Photon_pt, rvec_f Photon_eta, rvec_i Photon_jetIdx, rvec_i
         float PhotonMinEta = 2.0;
         float PhotonMaxEta = 3.0;
 
-        TH2F *photon_map = L1prefiring_photonptvseta_2017BtoF;
+        const BinnedLUT & photon_map = L1prefiring_photonptvseta_2017BtoF_lut;
 
         for(int i = 0; i < Photon_pt.size(); i++){
             if (Photon_jetIdx[i] == jid){
@@ -758,7 +824,7 @@ RVec<float> PrefCorr(rvec_f Photon_pt, rvec_f Photon_eta, rvec_i Photon_jetIdx,
     float PhotonMaxPt = 500;
     float PhotonMinEta = 2.0;
     float PhotonMaxEta = 3.0;
-    TH2F *jet_map =  L1prefiring_jetptvseta_2017BtoF;
+    const BinnedLUT & jet_map = L1prefiring_jetptvseta_2017BtoF_lut;
 
     float prefw = 1.0;
 
@@ -806,13 +872,26 @@ def mk_safe(fct, *args):
 //RoccoR roccor_2018UL("RoccoR2018UL.txt");
 RoccoR roccor("RoccoR2017UL.txt");
 
-std::random_device rd;
-std::mt19937 gen(rd());
-std::uniform_real_distribution<> dis(0, 1);//uniform distribution between 0 and 1
+// Counter-based random numbers for the Rochester smearing: u is a pure function of (run, luminosityBlock, event, muon index),
+// so there is no shared generator state between slots (thread safe) and the output does not depend on the partitioning.
+const uint64_t roccor_seed = 0x526f63636f52ULL;
 
+inline uint64_t splitmix64(uint64_t x){
+    x += 0x9E3779B97F4A7C15ULL;
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EBULL;
+    return x ^ (x >> 31);
+}
 
-RVec<float> muonScaleRes(rvec_f Muon_pt, rvec_f Muon_eta, rvec_f Muon_phi, rvec_i Muon_charge, rvec_i Muon_nTrackerLayers, rvec_i Muon_genPartIdx, rvec_f GenPart_pt, string era){
-    RVec<float> result;
+inline double counterUniform(unsigned int run, unsigned int luminosityBlock, unsigned long long event, unsigned int index){
+    uint64_t x = splitmix64(roccor_seed ^ ((uint64_t(run) << 32) | luminosityBlock));
+    x = splitmix64(x ^ event);
+    x = splitmix64(x ^ index);
+    return ((x >> 11) + 0.5) / 9007199254740992.0; //53 bits, strictly between 0 and 1
+}
+
+
+RVecVariations muonScaleRes(rvec_f Muon_pt, rvec_f Muon_eta, rvec_f Muon_phi, rvec_i Muon_charge, rvec_i Muon_nTrackerLayers, rvec_i Muon_genPartIdx, rvec_f GenPart_pt, unsigned int run, unsigned int luminosityBlock, unsigned long long event, int era){
     RVec<float> pt_corr, pt_err;
     //RoccoR roccor;
     
@@ -835,7 +914,7 @@ RVec<float> muonScaleRes(rvec_f Muon_pt, rvec_f Muon_eta, rvec_f Muon_phi, rvec_
                 pt_err.emplace_back(Muon_pt[j] * roccor.kSpreadMCerror(Muon_charge[j], Muon_pt[j], Muon_eta[j], Muon_phi[j], GenPart_pt[genIdx]));
             }
             else{
-                float u1 = dis(gen);
+                float u1 = counterUniform(run, luminosityBlock, event, j);
                 //pt_corr.emplace_back(Muon_pt[j] * mk_safe(roccor.kSmearMC, Muon_charge[j], Muon_pt[j], Muon_eta[j], Muon_phi[j], Muon_nTrackerLayers[j], u1));
                 pt_corr.emplace_back(Muon_pt[j] * roccor.kSmearMC(Muon_charge[j], Muon_pt[j], Muon_eta[j], Muon_phi[j], Muon_nTrackerLayers[j], u1));
                 //pt_err.emplace_back(Muon_pt[j] * mk_safe(roccor.kSmearMCerror, Muon_charge[j], Muon_pt[j], Muon_eta[j], Muon_phi[j], Muon_nTrackerLayers[j], u1));
@@ -852,17 +931,15 @@ RVec<float> muonScaleRes(rvec_f Muon_pt, rvec_f Muon_eta, rvec_f Muon_phi, rvec_
         }
     }
     
-    RVec<float> pt_corr_up, pt_corr_down;
-    
-    for (int j = 0; j < Muon_pt.size(); j++){
-        pt_corr_up.emplace_back(max(pt_corr[j] + pt_err[j], float(0.0)));
-        pt_corr_down.emplace_back(max(pt_corr[j] - pt_err[j], float(0.0)));
-    }
-    
-    for (int j = 0; j < Muon_pt.size(); j++){
-        result.emplace_back(pt_corr[j]);
-        result.emplace_back(pt_corr_up[j]);
-        result.emplace_back(pt_corr_down[j]);
+    const size_t n = Muon_pt.size();
+    RVecVariations result;
+    result.nominal.resize(n);
+    result.up.resize(n);
+    result.down.resize(n);
+    for (size_t j = 0; j < n; j++){
+        result.nominal[j] = pt_corr[j];
+        result.up[j] = max(pt_corr[j] + pt_err[j], float(0.0));
+        result.down[j] = max(pt_corr[j] - pt_err[j], float(0.0));
     }
     
     return result;
@@ -1847,6 +1924,195 @@ BTagCalibrationReader reader_1_UL2017(BTagEntry::OP_MEDIUM,"central",v_systs);
 //BTagCalibrationReader reader_2_UL2018(BTagEntry::OP_TIGHT,"central",v_systs); 
 
 
+/**
+ * BTagBatchEvaluator
+ *
+ * Same results as BTagCalibrationReader::eval_auto_bounds for "central", "up"
+ * and "down", but evaluated together in one pass over whole jet collections.
+ * The eta and pt bins of each flavour are frozen at initialization into sorted
+ * arrays (binary search instead of the linear scan), and the three systematics
+ * share the bin lookup. Flavours whose bins are not a clean grid, and jets
+ * sitting exactly on an eta bin edge, are delegated to the reader.
+ *
+ ************************************************************/
+
+class BTagBatchEvaluator
+{
+public:
+  BTagBatchEvaluator(const BTagCalibration & c,
+                     BTagEntry::OperatingPoint op,
+                     const std::vector<std::string> & measurementTypes,  // index: jetFlavor
+                     const BTagCalibrationReader & reader);
+
+  RVecVariations eval(const RVec<int> & jf, rvec_f eta, rvec_f pt) const;
+
+private:
+  struct EtaBin {
+    float etaMin;
+    float etaMax;
+    float ptLow;                  // min_max_pt inside this eta bin
+    float ptHigh;
+    std::vector<float> ptMin;     // pt bins, sorted by ptMax
+    std::vector<float> ptMax;
+    std::vector<int> func[3];     // index in funcs_, for central, up, down
+  };
+
+  struct FlavorTable {
+    bool grid = false;            // false: use the reader
+    bool useAbsEta = true;
+    float etaLow = 0.;            // min_max_eta
+    float etaHigh = 0.;
+    std::vector<EtaBin> etaBins;
+  };
+
+  void evalOne(int jf, float eta, float pt, float & sf, float & sf_up, float & sf_down) const;
+
+  FlavorTable tables_[3];
+  std::vector<TF1> funcs_;
+  const BTagCalibrationReader & reader_;
+};
+
+BTagBatchEvaluator::BTagBatchEvaluator(const BTagCalibration & c,
+                                       BTagEntry::OperatingPoint op,
+                                       const std::vector<std::string> & measurementTypes,
+                                       const BTagCalibrationReader & reader):
+  reader_(reader)
+{
+  const std::string systs[3] = {"central", "up", "down"};
+
+  for (int jf = 0; jf < 3; ++jf) {
+    FlavorTable & t = tables_[jf];
+    std::vector<const BTagEntry*> entries[3];
+    for (int s = 0; s < 3; ++s) {
+      for (const auto & be : c.getEntries(BTagEntry::Parameters(op, measurementTypes[jf], systs[s]))) {
+        if (be.params.jetFlavor == jf) entries[s].push_back(&be);
+      }
+    }
+
+    // eta bins and their pt bins, in order of appearance (same first-match order as the reader)
+    for (const BTagEntry* be : entries[0]) {
+      const auto & p = be->params;
+      if (p.etaMin < 0) t.useAbsEta = false;
+      t.etaLow = t.etaLow < p.etaMin ? t.etaLow : p.etaMin;
+      t.etaHigh = t.etaHigh > p.etaMax ? t.etaHigh : p.etaMax;
+
+      auto bin = std::find_if(t.etaBins.begin(), t.etaBins.end(), [&p](const EtaBin & b){ return b.etaMin == p.etaMin && b.etaMax == p.etaMax; });
+      if (bin == t.etaBins.end()) {
+        t.etaBins.push_back(EtaBin{p.etaMin, p.etaMax, p.ptMin, p.ptMax});
+        bin = t.etaBins.end() - 1;
+      }
+      bin->ptLow = bin->ptLow < p.ptMin ? bin->ptLow : p.ptMin;
+      bin->ptHigh = bin->ptHigh > p.ptMax ? bin->ptHigh : p.ptMax;
+      auto pos = std::upper_bound(bin->ptMax.begin(), bin->ptMax.end(), p.ptMax) - bin->ptMax.begin();
+      bin->ptMin.insert(bin->ptMin.begin() + pos, p.ptMin);
+      bin->ptMax.insert(bin->ptMax.begin() + pos, p.ptMax);
+
+      // up and down must come with exactly the same binning
+      int idx[3];
+      for (int s = 0; s < 3; ++s) {
+        auto match = std::find_if(entries[s].begin(), entries[s].end(), [&p](const BTagEntry* e){
+          return e->params.etaMin == p.etaMin && e->params.etaMax == p.etaMax && e->params.ptMin == p.ptMin && e->params.ptMax == p.ptMax;
+        });
+        if (match == entries[s].end()) {
+          idx[s] = -1;
+          continue;
+        }
+        funcs_.push_back(TF1("", (*match)->formula.c_str(), p.ptMin, p.ptMax));
+        idx[s] = funcs_.size() - 1;
+      }
+      for (int s = 0; s < 3; ++s) bin->func[s].insert(bin->func[s].begin() + pos, idx[s]);
+    }
+    if (t.etaLow < 0) t.etaLow = -t.etaHigh;
+
+    // a grid needs non-overlapping eta bins, non-overlapping pt bins and all the systematics
+    t.grid = !t.etaBins.empty() && entries[1].size() == entries[0].size() && entries[2].size() == entries[0].size();
+    for (size_t i = 0; i < t.etaBins.size() && t.grid; ++i) {
+      const EtaBin & b = t.etaBins[i];
+      for (size_t j = 0; j < t.etaBins.size(); ++j) {
+        if (i != j && b.etaMin < t.etaBins[j].etaMax && t.etaBins[j].etaMin < b.etaMax) t.grid = false;
+      }
+      for (size_t k = 0; k < b.ptMax.size(); ++k) {
+        if (k > 0 && b.ptMin[k] < b.ptMax[k-1]) t.grid = false;
+        for (int s = 0; s < 3; ++s) {
+          if (b.func[s][k] < 0) t.grid = false;
+        }
+      }
+    }
+  }
+}
+
+void BTagBatchEvaluator::evalOne(int jf, float eta, float pt, float & sf, float & sf_up, float & sf_down) const
+{
+  const FlavorTable & t = tables_[jf];
+  const BTagEntry::JetFlavor flav = static_cast<BTagEntry::JetFlavor>(jf);
+
+  if (t.useAbsEta && eta < 0) eta = -eta;
+  if (eta <= t.etaLow || eta > t.etaHigh) {
+    sf = sf_up = sf_down = 1.;
+    return;
+  }
+
+  const EtaBin * bin = nullptr;
+  bool on_edge = false;
+  if (t.grid) {
+    for (const EtaBin & b : t.etaBins) {
+      if (eta == b.etaMin || eta == b.etaMax) on_edge = true;
+      else if (b.etaMin < eta && eta < b.etaMax) bin = &b;
+    }
+  }
+  if (bin == nullptr || on_edge) {
+    sf = reader_.eval_auto_bounds("central", flav, eta, pt);
+    sf_up = reader_.eval_auto_bounds("up", flav, eta, pt);
+    sf_down = reader_.eval_auto_bounds("down", flav, eta, pt);
+    return;
+  }
+
+  float pt_for_eval = pt;
+  bool is_out_of_bounds = false;
+  if (pt <= bin->ptLow) {
+    pt_for_eval = bin->ptLow + .0001;
+    is_out_of_bounds = true;
+  } else if (pt > bin->ptHigh) {
+    pt_for_eval = bin->ptHigh - .0001;
+    is_out_of_bounds = true;
+  }
+
+  // first pt bin with ptMin < pt <= ptMax, 0 if there is none (as BTagCalibrationReader::eval)
+  const size_t k = std::lower_bound(bin->ptMax.begin(), bin->ptMax.end(), pt_for_eval) - bin->ptMax.begin();
+  if (k == bin->ptMax.size() || !(bin->ptMin[k] < pt_for_eval)) {
+    sf = sf_up = sf_down = 0.;
+    return;
+  }
+
+  double central = funcs_[bin->func[0][k]].Eval(pt_for_eval);
+  double up = funcs_[bin->func[1][k]].Eval(pt_for_eval);
+  double down = funcs_[bin->func[2][k]].Eval(pt_for_eval);
+  if (is_out_of_bounds) {
+    // double uncertainty on out-of-bounds
+    up = central + 2*(up - central);
+    down = central + 2*(down - central);
+  }
+  sf = central;
+  sf_up = up;
+  sf_down = down;
+}
+
+RVecVariations BTagBatchEvaluator::eval(const RVec<int> & jf, rvec_f eta, rvec_f pt) const
+{
+  const size_t n = pt.size();
+  RVecVariations result;
+  result.nominal.resize(n);
+  result.up.resize(n);
+  result.down.resize(n);
+  for (size_t i = 0; i < n; ++i) {
+    evalOne(jf[i], eta[i], pt[i], result.nominal[i], result.up[i], result.down[i]);
+  }
+  return result;
+}
+
+BTagBatchEvaluator btag_batch_UL2017(calibration_UL2017, BTagEntry::OP_MEDIUM, {"comb", "comb", "incl"}, reader_1_UL2017);
+
+
 /*
     
 reader_0_UL2016APV.load(calibration_UL2016APV, 0, "comb"); //0 is flavor_btv
@@ -2006,7 +2272,7 @@ if isMC:
 
 RVec<float> ones(int n){
     RVec<float> result;
-    for(int i; i<n; i++){
+    for(int i = 0; i<n; i++){
         result.emplace_back(1.);
     }
     return result;
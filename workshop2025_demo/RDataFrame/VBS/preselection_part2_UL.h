@@ -140,131 +140,33 @@ RVec<RVec<float>> btagSF(string sample, string WP, rvec_f Jet_pt, rvec_f Jet_eta
 }
 */
 
-RVec<RVec<float>> btagSF(rvec_f Jet_pt, rvec_f Jet_eta, rvec_i Jet_hadronFlavour, rvec_f Jet_btagDeepFlavB, string era, string wp){
-    RVec<RVec<float>> result;
+RVecVariations btagSF(rvec_f Jet_pt, rvec_f Jet_eta, rvec_i Jet_hadronFlavour, rvec_f Jet_btagDeepFlavB, int era, string wp){
     float max_abs_eta = 2.4;
-    string discr;
-    //reader_1_2017.load(calibration_2017, BTagEntry::FLAV_UDSG, "comb");
-    //if (algo == "csvv2") discr = "btagCSVV2";
-    //else if (algo == "deepcsv") discr = "btagDeepB";
-    //else if (algo == "cmva") discr = "btagCMVA";
-    //else if (algo == "deepjet") discr = "btagDeepFlavB";
-    //else cout<<"ERROR: Invalid algorithm "<< algo<<endl;
-    
-    //BTagCalibrationReader reader;
-   
-    /*
-    if (era == "Legacy2016"){
-        if (wp == "L") reader = reader_0_Legacy2016;
-        else if (wp == "M") reader = reader_1_Legacy2016;
-        else reader = reader_2_Legacy2016;
-    }
-    if (era == "2017"){
-        if (wp == "L") reader = reader_0_2017;
-        else if (wp == "M") reader = reader_1_2017;
-        else reader = reader_2_2017;
-    }
+    float epsilon = 1.e-3;
+    const size_t nJet = Jet_pt.size();
     
-    else if (era == "2018"){
-        if (wp == "L") reader = reader_0_2018;
-        else if (wp == "M") reader = reader_1_2018;
-        else reader = reader_2_2018;
+    // era/wp: only the UL2017 medium WP reader is loaded (see reader_1_UL2017)
+    RVec<int> jf(nJet);
+    RVec<float> eta(nJet);
+    for(size_t i = 0; i<nJet; i++){
+        int flavor_btv_int = getFlavorBTV(Jet_hadronFlavour[i]);
+        if(flavor_btv_int == 0) jf[i] = BTagEntry::FLAV_B;
+        else if(flavor_btv_int == 1) jf[i] = BTagEntry::FLAV_C;
+        else jf[i] = BTagEntry::FLAV_UDSG;
+        
+        eta[i] = Jet_eta[i];
+        if (eta[i] <= -max_abs_eta) eta[i] = -max_abs_eta + epsilon;
+        if (eta[i] >= +max_abs_eta) eta[i] = +max_abs_eta - epsilon;
     }
-    */
-    //if (era == "UL2016APV"){
-    //    if (wp == "L") reader = reader_0_UL2016APV;
-    //    else if (wp == "M") reader = reader_1_UL2016APV;
-    //    else reader = reader_2_UL2016APV;
-    //}
-    //else if (era == "UL2016"){
-    //    if (wp == "L") reader = reader_0_UL2016;
-    //    else if (wp == "M") reader = reader_1_UL2016;
-    //    else reader = reader_2_UL2016;
-    //}
-    
-    //if(false) int a = 0;
-    //else if (era == "UL2017"){
-    //    if (wp == "L") reader = reader_0_UL2017;
-    //    else if (wp == "M") reader = reader_1_UL2017;
-    //    else reader = reader_2_UL2017;
-    //}
-    
-    
-    //else {
-    //    if (wp == "L") reader = reader_0_UL2018;
-    //    else if (wp == "M") reader = reader_1_UL2018;
-    //    else reader = reader_2_UL2018;
-    //}
-    
     
+    // central, up and down in a single pass
+    RVecVariations result = btag_batch_UL2017.eval(jf, eta, Jet_pt);
     
-    for(int i = 0; i<Jet_pt.size(); i++){
-        RVec<float> sfs(3);
-        float pt = Jet_pt[i];
-        float eta = Jet_eta[i];
-        int flavor_btv_int = getFlavorBTV(Jet_hadronFlavour[i]);
-        float sf, sf_up, sf_down;
-        
-        float discr = Jet_btagDeepFlavB[i];
-        
-        float epsilon = 1.e-3;
-        
-        if (eta <= -max_abs_eta) eta = -max_abs_eta + epsilon;
-        if (eta >= +max_abs_eta) eta = +max_abs_eta - epsilon;
-        
-        /* TEMPORARY REPLACED BY HARDCODED reader
-        if(flavor_btv_int == 0){
-            sf = reader.eval_auto_bounds("central", BTagEntry::FLAV_B, eta, pt);
-            sf_up = reader.eval_auto_bounds("up", BTagEntry::FLAV_B, eta, pt);
-            sf_down = reader.eval_auto_bounds("down", BTagEntry::FLAV_B, eta, pt);
-        }
-        else if(flavor_btv_int == 1){
-            sf = reader.eval_auto_bounds("central", BTagEntry::FLAV_C, eta, pt);
-            sf_up = reader.eval_auto_bounds("up", BTagEntry::FLAV_C, eta, pt);
-            sf_down = reader.eval_auto_bounds("down", BTagEntry::FLAV_C, eta, pt);
-        }
-        else {
-            sf = reader.eval_auto_bounds("central", BTagEntry::FLAV_UDSG, eta, pt);
-            sf_up = reader.eval_auto_bounds("up", BTagEntry::FLAV_UDSG, eta, pt);
-            sf_down = reader.eval_auto_bounds("down", BTagEntry::FLAV_UDSG, eta, pt);
-            //cout<<"sf is "<<sf<<endl;
-            //cout<<"sf_up is "<<sf_up<<endl;
-            //cout<<"sf_down is "<<sf_down<<endl;
-        }
-        */
-        
-        if(flavor_btv_int == 0){
-            sf = reader_1_UL2017.eval_auto_bounds("central", BTagEntry::FLAV_B, eta, pt);
-            sf_up = reader_1_UL2017.eval_auto_bounds("up", BTagEntry::FLAV_B, eta, pt);
-            sf_down = reader_1_UL2017.eval_auto_bounds("down", BTagEntry::FLAV_B, eta, pt);
-        }
-        else if(flavor_btv_int == 1){
-            sf = reader_1_UL2017.eval_auto_bounds("central", BTagEntry::FLAV_C, eta, pt);
-            sf_up = reader_1_UL2017.eval_auto_bounds("up", BTagEntry::FLAV_C, eta, pt);
-            sf_down = reader_1_UL2017.eval_auto_bounds("down", BTagEntry::FLAV_C, eta, pt);
-        }
-        else {
-            sf = reader_1_UL2017.eval_auto_bounds("central", BTagEntry::FLAV_UDSG, eta, pt);
-            sf_up = reader_1_UL2017.eval_auto_bounds("up", BTagEntry::FLAV_UDSG, eta, pt);
-            sf_down = reader_1_UL2017.eval_auto_bounds("down", BTagEntry::FLAV_UDSG, eta, pt);
-            //cout<<"sf is "<<sf<<endl;
-            //cout<<"sf_up is "<<sf_up<<endl;
-            //cout<<"sf_down is "<<sf_down<<endl;
-        }
-        
-        
-        
-        // check if SF is OK
-        if (sf < 0.01) sf = 1.;
-        if (sf_up < 0.01) sf_up = 1.;
-        if (sf_down < 0.01) sf_down = 1.;
-        
-        sfs[0] = sf;
-        sfs[1] = sf_up;
-        sfs[2] = sf_down;
-        
-        
-        result.emplace_back(sfs);
+    // check if SF is OK
+    for(size_t i = 0; i<nJet; i++){
+        if (result.nominal[i] < 0.01) result.nominal[i] = 1.;
+        if (result.up[i] < 0.01) result.up[i] = 1.;
+        if (result.down[i] < 0.01) result.down[i] = 1.;
     }
     return result;
 }
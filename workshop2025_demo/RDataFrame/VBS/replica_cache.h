@@ -0,0 +1,59 @@
+/// Local replicas of the remote ROOT files that preselection_UL.h and
+/// postselection_UL.h open when they are declared.
+///
+/// calibration_cache.prefetch() downloads each file once per node into the
+/// node-local cache, checks its sha256 and lists it in replicas.txt
+/// ("url path size" per line). ReplicaPath(url) gives the local replica when
+/// it is listed and still has the recorded size, and the url itself otherwise,
+/// so that TFile::Open goes to the remote server only on a miss.
+///
+/// The cache directory is $VBS_CALIB_CACHE (set by prefetch), by default
+/// $TMPDIR/vbs_calib_cache as in calibration_cache.py.
+
+#ifndef REPLICA_CACHE_H
+#define REPLICA_CACHE_H
+
+#include <cstdlib>
+#include <fstream>
+#include <iostream>
+#include <map>
+#include <string>
+#include <sys/stat.h>
+
+#include "TString.h"
+
+struct Replica {
+    std::string path;
+    long long size;
+};
+
+inline std::string ReplicaCacheDir(){
+    const char *dir = std::getenv("VBS_CALIB_CACHE");
+    if (dir && *dir) return dir;
+    const char *tmp = std::getenv("TMPDIR");
+    return std::string(tmp && *tmp ? tmp : "/tmp") + "/vbs_calib_cache";
+}
+
+// url -> replica, read once per process
+inline const std::map<std::string, Replica> &ReplicaIndex(){
+    static const std::map<std::string, Replica> index = []{
+        std::map<std::string, Replica> replicas;
+        std::ifstream in(ReplicaCacheDir() + "/replicas.txt");
+        std::string url, path;
+        long long size;
+        while (in >> url >> path >> size) replicas[url] = {path, size};
+        return replicas;
+    }();
+    return index;
+}
+
+inline TString ReplicaPath(const TString &url){
+    auto it = ReplicaIndex().find(url.Data());
+    struct stat st;
+    if (it != ReplicaIndex().end() && stat(it->second.path.c_str(), &st) == 0 && st.st_size == it->second.size)
+        return TString(it->second.path);
+    std::cout << "replica cache: no local replica of " << url << ", opening it remotely" << std::endl;
+    return url;
+}
+
+#endif
@@ -0,0 +1,1642 @@
+// Generated by make_sample_table.py from samplesUL.json, sample_ids.py and the chain files: do not edit.
+
+#ifndef SAMPLE_TABLE_H
+#define SAMPLE_TABLE_H
+
+#include <algorithm>
+#include <array>
+#include <string_view>
+
+enum DataYear { kUL2016APV, kUL2016, kUL2017, kUL2018 };
+
+struct SampleInfo {
+    int id;
+    int year;
+};
+
+struct SampleEntry {
+    std::string_view name;
+    SampleInfo info;
+};
+
+// LFN of the input file -> (sample id, year), sorted by LFN
+constexpr std::array<SampleEntry, 1274> sample_table = {{
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/100000/B492371C-3CCE-ED4E-8548-2F2407A7B736.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/100000/F6D926EB-6254-034D-93B1-4E3D1CC308CE.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/230000/F6E86560-6190-0141-9AA4-4AB8EDF9DA63.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/2430000/5D4D7E3E-CA48-DF47-AD41-9BE349AA20DD.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/2430000/B95B550D-EA7F-0A43-972A-50EA4D361C2E.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/250000/5EE2FEDD-CCEA-A046-9D68-63BC21D3D59E.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/250000/BEE36B95-B3EE-924C-9454-C35A7CD70CE8.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/2500000/DB1D6EB3-7E68-6B47-BCDB-6363F2E0B224.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/2510000/E3497E0A-F244-C548-8782-2022EE8E21CD.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/40000/54C5186E-5F16-574B-9758-6FEA0D0CD98B.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/40000/68988449-F695-7A4C-A4BB-D127050A31C3.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/70000/D4B18EC7-51AA-AF40-9ED4-65808281B050.root", {209, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/120000/6175E253-6F5C-4E49-A61F-5D2872FC741E.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/0C740398-E6D5-2046-9C8F-768E6C9ACD90.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/2DA18470-DCA2-3F4B-825B-507F4200194B.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/47FC8084-1BA4-E347-A5FE-46B086E77899.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/AA186D04-E584-794E-8787-F6AD60CB1E72.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/ABA8AAB6-89A8-2A4D-B574-82CB4162656E.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/AFE15B39-1757-7243-BAEF-07B1CF01C9B2.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/B35D4BB4-AE91-F241-9FB4-3A45B7710838.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/BD04225F-FD44-524E-AAD8-7710D7D57015.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/E3A37609-143B-BC42-8BD2-D7D276F24CBA.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv2/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v8-v1/270000/FA2C4395-B8A9-B740-8806-9DE87D80F724.root", {205, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/04426F83-BF53-0440-B2D1-F2DD9AB96EB8.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/04620FA2-DB18-7F4A-B30C-BAFD1C5B673D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/0E54830E-2E98-5B43-874B-FCDE66351CDF.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/550821BC-9241-C547-8B14-3CE3B6C8BF60.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/5F06FC72-8F5B-FD4D-8D5D-18F63BED482E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/7892F7D7-54C8-6943-B824-92157E0DB0CD.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/87BAA9E4-7B59-284B-BE9C-8986F4E14D3D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/BBD83B5C-8A0B-CF46-B108-EF6D3C2A7850.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/F45DB428-55CC-EC4A-AE2B-F192CC6D65A8.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/02E0D402-DACB-D540-8F7B-CF0F04E09CD2.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/32EF33FE-8806-F542-8CA5-4A9BB77DAF48.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/381BAF7B-4A75-7B40-93B9-21CC5AC3B756.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/3B4F377C-8A0F-844A-B483-54FD2C5F1946.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/49521C53-0399-0043-941D-B2C4E47558AE.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/517A6DF9-D724-3E45-945C-1DD329933557.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/539BEE5E-5514-E340-9DD1-9DD28AE79F6C.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/5961319A-8C50-7347-9E03-204C3E95BA31.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/66A974D8-AA6C-C24F-897E-5E967773C2F3.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/70E780C1-3CEA-AC4A-9FED-49EE96D2470D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/7E60510B-A343-BD41-B095-35455316E1D2.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/863424FE-1AA4-CC49-AA09-8727929F06FA.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/8F0FD893-10EF-C34D-9005-17562FDA8E4C.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/920C6269-2688-3845-924F-F877781275E0.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/94FB39DD-5743-4546-8CF2-4A1689883040.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/A295E63F-D6E2-B744-9A83-ACE9D7DF5791.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/AB2701A7-0EA4-B144-929E-AD93458DDFAE.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/BDADE4E7-EC3B-964E-9B79-2E5B8E3AFCC5.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/C8EC1E99-60E9-DB48-8139-15CA045204F7.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/D3C0981D-8D35-324D-BA69-4D7D1E07C7A4.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/D6715D34-F890-4442-AF54-FB4586F4DBF3.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/E4A25109-8776-4A45-817A-AD5CD49B3D3E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/E5307A24-2AFA-B640-AFFA-0EDAA73F5CED.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/E98F5605-A9F5-BE47-A163-85DD6B3F2A2C.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/F0845405-F3A8-5D4D-B2E7-DA24130051E1.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/00AF4569-818D-5E4A-8374-10662A741825.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/03F89206-5224-344F-A259-DC71446DB0A9.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/314CDF57-FA98-1841-8837-6CDC7E7743D2.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/32531AE0-73DD-3A4E-9C99-6BC3253CA1B6.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/38A03264-D0FC-9843-BE2A-EF1D99F24E27.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/434D5226-13ED-E447-AEED-DAAE86A7B6CB.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/4B464789-6665-514C-90BA-DCB684E83061.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/5D2B9E41-904F-DC4A-9E13-D40FF84D674E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/5DAE6248-941E-524E-838F-3B945D145B68.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/873C98E1-A6FE-D246-B341-87F112212A80.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/90124D31-0EA2-9D45-85D3-DDBFCBC37DCD.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/ADD5AC33-B742-2E40-ADB1-73715F966BF9.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/AECFA5C5-0D4E-9541-94D4-D8F50E4338B5.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/D34547F2-A5F0-BF40-9B00-BE824242E449.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/DA66A5E5-CC06-434D-B1B1-B5A14A5B8C09.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/DAEB275F-ACC5-0F4A-A1BD-70C952C73269.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/EC8F03BE-67EB-9C43-B754-94B122E86D48.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/F26D08DF-7FDC-D34C-82F7-6D0661977572.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/F2E968AF-E6C7-8D4F-8689-0E71F55FE457.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/FDE1C172-542B-3244-8611-978D53C5542D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/FFB4AAD9-42CF-3548-ACDF-3BE807E73F29.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/050D6673-5813-8B49-88C0-E279EE37CA3A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/06626381-A2F9-9E42-85B7-7A4B229C3FF2.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/0C167A65-1707-7340-B0DB-3945E5EA72A8.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/0CAE64F4-8E58-5340-B279-B1FBBE458F9F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/1A87E7CF-4EDC-EC43-97F2-3F201F096A87.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/1E7C6069-AE91-4542-A2C0-DEDCDF800C66.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/1E870294-C582-0042-9BE2-E98995CE8383.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/297789DC-A039-B041-A7B6-9FCA46472D5E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/29D43804-8B60-B747-A5AF-07C33C20F29E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/2C002675-1603-1E48-BA33-E000A1555324.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/3D48F474-AC58-864F-A7FB-1C62ED896BFB.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/48A18746-4B91-174B-B2D5-7561CA79CE67.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/5384C570-88F6-2E47-80A7-4833044B55B0.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/56BB694B-BB9E-BC4C-B704-741A8839DC75.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/582CF964-820F-FF42-8947-3E68AD4F1B31.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/59DC4017-A34B-D242-A62A-4E670B61998D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/6148F44E-1A42-DC42-AD7B-99AB125CDC35.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/69F54731-C5A0-E74A-A91B-873702F853E7.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/6E6E9327-A13A-D94B-A79A-4347359E84E0.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/6F55C1E9-36C4-314E-863B-BACD3F795A09.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/71F61F8F-A922-DC4E-8B1D-40ED60F7892A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/7B761AA4-3A4A-EB47-9062-A531713FF0E6.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/91FA4143-F0B0-D344-8C2E-37221039E8E7.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/A5463C37-9B66-7B49-9E33-36DC45ABF027.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/AB5CD16F-3C56-D149-ACFC-213973C3434B.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/AFD67B4A-0F31-894C-BC85-D7E1BD25B1FC.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B05B3C94-9C3F-F24D-8F56-54743A60E8CB.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B2CE2326-886D-C149-B1AF-C3EBAD9A769F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B500C94C-7C24-A84C-8A09-88A66C1A68DE.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B925E90D-E64C-FE4A-A07B-6B0A66732C77.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B9F9289A-D29D-764C-9243-212797427257.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/BD2FFC3D-773F-1A4D-82E1-2899A4F9D8FD.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/C0DC0C98-33A4-F249-BDD7-4BE7C0AEB52A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/CA3985AE-4A6A-0D48-B7BE-5C81DF78D92B.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/D1D90D58-772D-9945-B353-DAE1DEBCB6C3.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/D73AE7B2-CC1E-4B43-8C37-E6F5F8990ECC.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/DF3AF53A-8026-DA42-B7D6-3D919411261F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/DF79E942-F1FF-DF47-A1AD-3CC331DD1846.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E19C4540-8EB5-2D49-9BD6-6FD42790AF4C.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E236EBE9-C311-4C47-9FA6-93BE2980B178.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E3789D6C-1F03-8D42-A333-0C3E742F1522.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E873C19A-5254-DF4C-9DC0-52E031DD3E6F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E9FC6963-FBB7-744C-9ECC-AC345A91F29F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/EEDF88BB-0335-D545-92AF-07CEC3601159.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/F8795808-70DD-FF4D-AA9E-F9D661B83EE9.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/F994A69A-9C27-F745-98C0-2FEDFBF0DCF0.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/FB86C880-B542-934C-A1C7-5DF195B8B9DF.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/FDA970D7-F674-F74C-BDFE-2537A04B4B4A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/FE19CB46-7BF5-564C-B0EA-6ACB06AAD336.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/11FC2008-7DE3-B744-9EE7-99FAF72BCE0E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/246DDA74-222B-924B-B062-513AD7278251.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/3075605D-4E2E-8543-9853-73EC686C972B.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/3BDBBC96-3DA3-3E4B-975A-A357B2E9CD44.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/3FC32D56-46B8-AE4A-9D63-B5D0AA3CFE87.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/61986C01-0100-2347-A65E-D745E99D07E6.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/8267F687-7160-2E4F-A564-F754180DCA12.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/871E052F-F381-3648-8236-BDC76B062DDC.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/8CF5CD85-B1F8-394C-AA52-8F384FD32DE4.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/970E1290-7DA0-E84C-93A1-962287D8EC05.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/AC80F858-FFDD-2C4F-8732-EA1F7034A4D2.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/C92FAF88-36EE-8044-989E-B6CFB361748A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/CC7F6F07-EC43-4C48-8610-6AB1DAB9FFE0.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/D2FE8CDC-02C7-5F4C-B2EC-D41EE3867A93.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/EE079C18-06E6-0344-8CB0-3313E7130194.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/01B07ACC-8118-0743-B4A1-83235AD2431A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/04D497A3-80FC-3948-9F38-AA159D523CF4.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/04F8CD5A-0773-7F49-8C0E-959FDDD54B7B.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/07A7F36F-1CAE-3B4A-BF47-ED912CCDF038.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/096F4B8B-55D6-1F42-95F9-13D19F5FAD69.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/0F9C692E-9182-ED4F-9B35-2D02A42682C0.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/13FE8278-FE1C-B143-8AB9-C54183A48687.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/31BD1A74-E6A7-BB4B-BA1A-C14F809BC88E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/44CC0DF7-C054-5645-BE28-35CAD41A5F2D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/457D2E3E-9FDA-2A4C-AED5-861659E82218.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/49A9D050-9753-EC41-B7C0-4D2B6654CDC1.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/504FCFD7-9553-554B-BACA-D707697BFF0A.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/5A6ED790-93FE-9449-9F7B-EE2C76339264.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/5BC4EE52-B009-2748-AC13-5DBE14627026.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/68CFAF1F-E31C-274C-A36C-DDA92D650CD5.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/73A86BC9-4846-954E-BA22-E390BAE3B1A5.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/78EA133D-0228-964E-BCC1-9F83CFFD0721.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/7DEEF20C-C9F2-C24D-98BF-D3AF4109E308.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/7F41690A-B767-554D-BAE8-3B71EF75A29B.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/90F5260A-4B28-D749-B073-85FB6997C9D2.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/9EC36739-14A5-394C-A212-109090DB00FD.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/A0D4D196-1A9F-C245-A0E4-D1C4825F696B.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/A390A729-ADAD-8240-9F52-D2A5631C0FDA.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/A7F3B258-7C3C-1042-AE27-7F6B04C6DD6D.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/A9A2E9FD-B4D1-B943-8B1E-4FC31B3A3CED.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/AC35A459-3422-C844-A975-CFADDA86904E.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/B38ACB2E-5305-734A-9F33-81306E6A3BBA.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/B4D63BBB-6F2C-D64B-9CD3-0B9F0E8D7554.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/B8D1E7D3-3CA5-0744-9C6F-8A701B339D27.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/BF373CD8-5B93-B64F-8157-0DA3B754AB8F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/D166A220-EC49-AF42-A758-EE0C1E0E7010.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/DDC2DA70-117D-074B-9417-4F560CC0504F.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/F6D06486-1C27-0944-9BDE-05AE436F8763.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/F8750513-3783-9143-BB9E-766AB1045A29.root", {236, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/03B03897-0491-3940-B3D3-731336D23453.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/291EB0DC-B605-1F4E-9036-BF43D6795A78.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/2FC18936-D237-D04B-8D89-1B4E0B0E3B33.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/6E6E967E-40B2-384F-8718-06227CB156DC.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/8EF3D268-56D5-DE42-BF2B-F0CC9D65F335.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/96328260-2AA9-4C4D-9902-120A167FAC7A.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/D1709631-6941-514E-A7AB-52A2E7253764.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/08116A9E-43D6-294F-B6B3-A66E1575F472.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/0EFCA1F9-2F37-B14F-B815-9626A61E55DF.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/13BAB9FF-01EB-F34A-825D-0392257D3644.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/1A0C43A2-D155-3A4F-8AFA-C039B1E8A906.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/1F7CD5C6-549A-4B4F-9753-0504C6C41357.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/2092BC07-3573-C747-AA67-AB5E5ABED634.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/57F77E8C-C931-734C-9D0A-BACB4FB4BDBE.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/62354E45-525C-CC42-80AD-8D7624033345.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/6F9D9E1D-8B9C-8C44-A4CB-3497EBA79D2B.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/7466ECF1-3A11-2E41-AA54-A6160983EC01.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/77E03479-DE10-A143-9A24-40BAD87625BC.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/815A8EDB-0410-DB4E-BFB5-FE599CDF512C.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/85477652-C6B3-794A-87FB-92F238CB6E7B.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/B53B5FDE-49AD-0A48-BE4C-160AFE34732F.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/B7ED35A1-7733-D943-923D-D1B57CFA9682.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D2CC566A-BA0E-2046-9FC2-E1A78E76C5BC.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/E1F9DB33-301B-C149-ABAB-8F034839F7BD.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/E4294E0F-523B-744C-A652-09260F33AA87.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/E985B4DF-695B-6D45-A77A-7E7184F34A5A.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/106A4294-D873-1C4F-96DB-6D011D29B583.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/18155C30-B4D8-524C-BBFB-4D315A311AC9.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1FDD0332-37F4-3B4B-AC52-7B4B811BC5F0.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/27AF1D76-F9F7-2A46-8681-61BB294F5436.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/310EA4A3-E354-2C4B-837B-07DD2A447AD2.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/330018DE-B736-A04E-8E29-705EC5D1D545.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/65D52A24-1347-2B42-A77D-55353C139B2C.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/6CDB513F-6595-3D4A-87E8-648966253274.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/77BCE432-5DE7-7049-A417-F52B8011AE88.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/833724A2-EC92-AA4D-9748-02B50BB2B51B.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/8F7603B0-6DC8-A546-8EB3-5961CE879590.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/9BF9A6C8-33C3-8A4D-895C-DBB24E015821.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/AC2208DD-B5D3-D448-95A8-855CF0CB90A4.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/F27861FC-50D1-3F44-A03D-591A5E8B6E74.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/5191FC54-A986-3241-94A9-00984BABE274.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/641704AF-67C8-4544-9331-D82D1AED149C.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/98A3B3FE-F389-8049-A5E5-29E591D1143E.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/CAF24D33-E1B8-694F-B77D-5CC5203749B3.root", {212, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/4743B911-1EA3-7E46-959B-93F466ED622F.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/DE3F93DE-DAF6-DD4A-AC3B-13ACE92EAD68.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/336F0076-347C-AC40-B1B4-E31E14323B81.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/100D0E96-C700-5244-874F-38DB4B410228.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/28512C40-9C25-864A-98E9-4746C0471E63.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/2BAB6B06-FFE2-DC4F-A57F-3A33B3326A30.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/453FC70D-8164-1B4B-A756-81E7432C1D61.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5C1E0BC2-F153-E946-9B61-470E8AF85C58.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/9DB74D60-0434-A04C-B430-173D6D6538C3.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/DB3B1648-246F-314E-9DD8-FACEA0AE62F6.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/FD91C4F0-7DE3-4947-817D-3EA957A0BC50.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/6021CDF7-AE6F-464D-81E2-AB75ABC4809D.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/77B90DAA-35B9-004E-9C49-52E516FB15D6.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/C01084F4-328D-0146-B71E-B167AB6A7E86.root", {211, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/1755CC95-AB30-BF4A-9897-96B416A08537.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/33E7FCAF-88CE-B548-BDF6-395630C7A57E.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/3F4CE589-76EA-1249-AD73-1ABE01CB68C0.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/5CCB604D-BDF9-8142-AF51-56B4B645739E.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/81DBFA31-D39A-AE48-9040-EAB9E88BB5B0.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/8CD75F07-FD6A-1544-9E6C-78B812D3E7FC.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/9FA473E5-66E3-6942-B4B3-DE38C1DC40AD.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/A3746BD6-EA27-8946-A384-31B731DB87A0.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/D39CC891-B559-9645-A6E5-AB9E44112C8A.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/EFFBA4A2-ABBE-1141-9A5F-E166BCBE27D1.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/F7A3D15E-37CF-BB4D-807F-BE6D781E9ECB.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/FAE134F4-4E7D-2B43-8760-5052A1381F03.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/E04F23B8-3DA1-7747-BC0C-D11CE8A69301.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2500000/15240934-33B0-2048-8EA5-073BDF972D75.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5E8B04A7-0E66-734F-ABAC-B3DD46678CFB.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/6377DF69-3CC9-FB4C-9F75-6CBD9F5A24B8.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/D704225A-6110-2C45-BEA0-BADFD7DE38C1.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/2E1C33A6-A37E-A640-BBF7-D959BCDE9C5B.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/6F37B06C-70BA-C242-9B22-4C6913C4AEFE.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/811A33D8-153C-1548-BAD7-A4FB0C370D80.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/97E600ED-9E88-2044-B38A-18CF85798D19.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/FBD72194-582E-EC4F-9001-F0DFDB6AB192.root", {173, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/61C7E1BF-8E49-5A4C-80B5-64BC2D397F51.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/A2E491F3-5078-E243-B0A5-31F2AD8D52DC.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/09EB1760-BDB5-9C42-99B9-F358BBB4DE85.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/299EC19D-9E1D-8A45-8DBE-E6345A96DBF5.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/571BD14D-F939-2A4A-B5DC-493000BD139B.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/C35F1DAB-B2BB-6047-B289-84DB75191D0F.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/E011F676-2813-AC4A-96D0-A1868AEADA62.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/E35DBFBD-8AC1-1547-983C-D76E2E94EA4A.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/ECBA787F-5005-A94A-A09C-9C26FA616AD2.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/AD8F78F4-8699-CF4D-A6F0-F4FAB6C58C87.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/C9B93335-03BC-BB45-9170-5676A573AECA.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/EFC40D45-3EB1-3745-8122-3EFCD8ADD503.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/F7CC0C85-B9E1-E54F-9DA7-7D873499B17E.root", {180, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/4732F4BD-AFC2-CE4B-A13E-77DC397A50AB.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/649AF00C-7530-F046-975B-F01D1F70067E.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/86A2BE85-8569-334D-AB39-89105828B3B5.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/87EB3DDE-2A05-2440-883A-55387FFC488C.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/AE998E81-0718-A040-A4B8-9887A2E2D10A.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/CA74349B-2F74-3A4D-99A8-D98913968013.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/FB1B5A36-A713-4742-8064-D19ACAF84354.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/11110631-DBB3-CC45-BB8B-17BCC7099B77.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/822663B9-D133-EC45-8BBE-7C3BE634A828.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/82F15FFE-BB5D-E442-A596-A2C790E32B1F.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/225B7734-82C9-CC4A-ADFD-63F23461D708.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/B4BF7C1C-5252-C340-9FFF-8E9556E30A7C.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/0B5BE703-662C-7941-9930-339D0925DB42.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/2572070D-281A-5B4C-A7ED-99DF8E1CF22E.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/56F5B68D-8C5B-D54E-8C1A-A9E2340AD40E.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/5FE1823D-F24C-AC4B-9473-67D6BBE3F542.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/701A10AD-FC1D-E145-A402-D0209482A5A6.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/84C29546-5A48-E742-BE78-B707363D94F1.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/DC548C72-2FB4-A947-8508-4363EB03186E.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/E5EA42A7-F455-2D47-B322-17E50CC77E9D.root", {174, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/E6E8AB11-0984-3943-B2FB-193F7C8D1463.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/8E7726F4-DB38-3B4D-B2D4-C629B69BF0F7.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/7FFAD3C0-901A-D243-B90D-95A3C3E9A6F8.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/7BB3FA1A-A5C2-A34A-8750-9D88D65B228F.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/2248D97B-D6A0-5E45-B7B4-ABECF32D604F.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/695D6A22-0ED6-954D-8332-CFC963DE2813.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/7BA58950-8685-2B4A-8828-2ED29A3AFB32.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/91A08928-151C-2849-830E-B90E73821817.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/95259533-0805-E74C-AFAC-FB64F20C786D.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/B283DC62-4BEA-CE4D-80BD-81766FD23F47.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/F8FF0850-7575-9940-A2B6-F625515367DE.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/0DA676C9-0491-804B-98E5-4B614A67640A.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/5CABCD01-9AB8-C142-8DE3-E7D638BA04B7.root", {175, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/394C17C0-C36E-C545-9B0A-D8613684453F.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/445F90F1-5AD0-5240-A572-3BF87A786985.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/476852D8-80C2-0149-8FF0-AB766B02EA23.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/656FF8E2-F897-4F47-B195-BE5C87F7EF06.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/704CB5C7-C18C-394F-9BC2-47481AEFD120.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/7CEB9C5E-F4AE-1244-B27C-7A41C0CE348A.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/DE82A6F4-9067-6B4C-8016-363BE5AA799D.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/E7C1D2EA-6DBE-994F-B35D-68904B8D186B.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/D632A9CA-2236-3340-B576-A29EE6340F73.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1537B96D-F2EA-3C48-8DD9-EB99D6ECD0F9.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1AFB7EC4-EC90-F94E-A994-B40A8BE55065.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/240DEFC6-1E70-CE44-AD3E-D6858573DAD9.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/407A1088-EF75-B44E-AC20-6B904757D8B6.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/507FFC34-41E6-8F41-85AF-AE44E568D826.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/AC1F82F0-8A24-5B4A-B43D-884F15461C1D.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/C9FD54C9-D1D3-A14A-B65C-9F0706E1483A.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/E970DFAF-A369-7544-B637-A533EA9FABA2.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/0EB502B4-A21B-594B-B889-2563A159CAB6.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/AF0E3EE4-9B19-E44F-9977-9B0603ADE6B0.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/B58A8ACC-2DA6-CC46-8DEB-61278B43E92C.root", {177, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/63E0F24B-F2E3-3F48-AB0C-AB1EFD65733B.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1345A492-981C-A84B-A014-59E9479C15B7.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/16C6517A-F684-FB46-885F-A6CCD919DCED.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1D1DA61A-5E1A-EF4A-AE6E-1C16EA60BC7D.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1DFE7264-C406-2C4A-BE5C-0C49968D92C5.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1F031326-1942-C84A-8CB5-299A8A1BCA85.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/32A5F024-7722-B242-89D9-E3E4A3E88665.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/3E2B1416-FEF6-BE45-A6E6-5BFEE18003D1.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/4492EC22-A5E0-D748-AA8A-A3537C7733D7.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5C2009DF-20CE-814A-8BFF-2FE01683C39E.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/676BE2D9-A100-4443-BBA6-F520218B4DA0.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/70BD6969-87A9-8B47-A990-8F0B79E33BFA.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/7751B8D1-97BE-9E46-BE19-61630766E3C8.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/853857B4-04A2-804F-A308-0530268E5C63.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/86F2F21D-B208-9E40-B279-38D890F3D8A0.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/910BBD02-5305-3147-B14D-51AE9C9FB471.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/934400D6-E51B-6A48-827A-09497014278C.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/A1A08310-83C9-9941-ADE3-6BADA79C0B2A.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/A60E3AD2-BC92-8340-81E4-ED5083596BC7.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/AE7A586E-6F68-DE46-B99F-396BA8980234.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/CDE34B48-E379-AC47-A2E0-8BF4A874EABC.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/D5693A59-0203-B543-8788-D10F37498919.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/DF9C7861-92F4-D34D-ACFA-F422E5658AA1.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/ED87A025-4F70-4D44-815C-44946CAAA036.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/FE4E490F-2EEE-0A4C-A014-27E14A0C66E2.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/8F029904-6E02-7149-9431-31F51B65B167.root", {172, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/07AA19D1-D36B-3B4C-B0F4-451D363FF2B5.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/10ED7405-79D3-C343-9ECB-E7455ABFCCBC.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/3D8DFAD5-9267-614F-A613-6832CA462687.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/50ADAA65-4836-7046-8095-0A1EEADE3D44.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/5C0B4AAC-6C96-DF49-92A1-BDE4B3624F25.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/A3114BEE-ED43-BE4E-B5A5-22F0F67BAF11.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/B2E9FA8C-1C0E-B04F-89E1-4A8EA03E4D6A.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/BC9C07E6-4B82-7241-92F5-67B5618C7480.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/C4C2F2D9-5C58-4143-B4D1-64EDA34579C0.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/CD561BAF-47C3-9C41-AE29-97B8748B4BFB.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/EA94F4F9-C3D0-7045-8CD5-A12256835014.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/EB355387-CBEF-F140-9492-B261F60DF3F1.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/F4FFFB1A-7EEF-EB45-9FCA-0FE2DC7043B4.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/FD733812-C773-F346-93B5-025C98D64042.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/1D8C040F-87B1-9649-BAAE-3102318C9519.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/631077CE-9B9C-E54A-86D7-C31B32AB105F.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/A81DBF66-BDA5-A543-8A7D-0D1E192A3CD2.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/D22EFF71-B0E8-1E4A-B8A5-CF48F207B187.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2500000/1F8494A8-02D0-894E-B737-D2A48F147F75.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/255BE010-0BC3-214F-9B53-04FC71233639.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5770B142-06DD-E64B-A83A-11A184315C15.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/814AAB2A-EE80-334C-9275-4B45DA2034E3.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/87A6CF5D-97A5-2B4C-8243-AFFB8218573C.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/89BDFDE5-A21F-824E-9530-97998CA6EA67.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/8D115B0B-4D5F-9744-B75F-D8ADCF7E2B27.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/9BC9C0AE-2505-9A45-8541-D67546C76E2E.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/A2F668D4-5E04-764D-AE3E-F75B72A1C52C.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/A44E3B80-DC8D-7A45-AE9A-4936811A2420.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/BB44F72C-CB08-6A45-8BB4-0285A349E713.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/D638A030-4282-B74C-8EED-FD65735E5F64.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/FE194A2C-47D1-064F-9F02-7EA370D70DF6.root", {176, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/D9A6584B-4363-E34C-98E0-9FFC347FA11D.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/CE50B76A-6CCB-E046-9EB1-1B70F12AFD6A.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/22B2DFAC-646A-D74F-9DF7-2E839BD4ADB8.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/555F9B5B-4E95-8B48-963D-B32DF5A1A1FF.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/F93ED00C-C5EE-C146-8465-0B2ABEA29761.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/19CBD56E-DBA5-2D47-92B1-5D1E29B7B7D2.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/0C15D7CD-0114-4548-9D6C-3569A60A321F.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/3ABFC25E-DC5A-694F-8B0A-D9CD9C78193D.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/8394F0A5-C07C-1F40-AB08-783579845213.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/23D56BF3-DD5A-EA4F-9424-2738847CA9F6.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/4945370B-2BBB-5B4B-BB65-E0178E5F09CE.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5C513920-3413-014F-8FDE-0139E4339641.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/61B37744-CDF7-024E-A8AD-3C342E037028.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/8FFED2EC-1800-B34A-8966-A2D180FD3126.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/94A439FC-D842-2046-B259-77DA492B52F7.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/4F8A11FA-6CA7-3C49-A570-6B3CC4D121F0.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/9D5314E8-CBE0-234A-8A17-882C8AE998B7.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/A6249CA4-E516-C44A-B25E-5F23E856729C.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/69155872-91DA-324A-A0B1-869AA1BF6BD0.root", {179, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/D8EC0B64-1134-EC4E-8FC4-F40BD0B73FB1.root", {198, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D10D37AE-9C29-EA4B-A6E9-4D4D11259F9F.root", {198, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/527DF090-9323-1848-B807-643313DEC898.root", {198, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/56A4C672-ED48-DF49-8407-593132DB81D0.root", {198, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/E29B1C36-2D62-824A-9F10-455648F71E4C.root", {198, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/EC5D8698-797E-FA4C-8F93-84427726F6A3.root", {198, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/2BDBADDF-C51D-6144-B867-B6DE25E27BDD.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/45DED8C4-427F-6946-AEC6-41493094FE95.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/4989D216-4A85-3D4D-BEDD-5824D384550C.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/49C04D72-3452-B043-B2EE-16C09E014AB0.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/4EDBF6A5-7E40-1D42-A312-BB744AFB2B63.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/70877CCF-7089-E84B-A8DD-D4DB2AE03DA3.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/B97A9306-B719-A14D-8534-077AF6532FE6.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/C08A56A6-9E79-9748-A5F8-FA07E0CCD7F1.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D88A8DD7-E2BB-0848-AFA4-AF1F05BB0E44.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/DA4C0F7D-44C5-5840-B93D-84AA4C0DE7A0.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/EB8E1C6C-2C16-2C48-8CF5-9275AD28F498.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/F2B386DF-3899-7A4B-831A-32D3C0F3677D.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/FB10318D-A019-DE45-819F-79A972F94724.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/FD53A9D4-BA12-A645-BB6E-1E0CA6F089AA.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/A67D5AC6-7C7D-E94C-BC3A-3B8AC7908DFB.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/16FD34C1-D4B1-E745-A07A-370DE69851E7.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/D775D0BA-33A1-734A-ADE5-9493B5581373.root", {199, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/4096F772-D4B0-1248-94ED-238558A51FF5.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/76BB2F07-A89F-A842-89AC-423F883551FF.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/439D6C22-BFDB-8D49-905E-791EC266558C.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/DBC798DA-9C58-344D-83E0-789FC1DF73DA.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/E712C6FA-C44D-0C45-8453-63DAEA9B42A8.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/11647BBF-A0DC-FB47-962E-3DD21755AD8C.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1D6F8904-B186-6948-9F79-7389107F4FEA.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/7EC80274-A70B-0546-A98A-0096536547E8.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/99FD14CA-5172-C44E-85CF-FA06568160D2.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/BBEFC6D6-6FD1-6942-9A89-33DF8668C995.root", {200, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/B6336E49-7327-F74C-B230-6857542F0DBB.root", {201, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/7C1F4A59-57F0-2A4B-82A4-2A51BE21E6C4.root", {201, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/0FC80627-BB57-004F-BB4B-66504FD786DE.root", {201, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/973A601D-5A1A-6747-B5DF-86F5AE45FFFB.root", {201, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/B9E0DE47-E2B0-A649-A1E2-0505C818C257.root", {201, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/6BBBFABE-085E-4143-B9F4-BCDD71BD669B.root", {201, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/10C6758A-D9D0-124C-B2F6-AF271C89159C.root", {202, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/38711469-8DC7-014A-8EE6-945A8E7F4482.root", {202, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/20E3460B-31D3-6D44-8D84-F238368FB405.root", {202, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/E9E6D9B8-E2E3-E548-BD4C-9781285AC7CC.root", {202, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/1D189988-4A33-3749-A360-4A6C01BE8D66.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/38771652-87F7-4B48-A3F1-8635335FA291.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/6C7F9948-EC60-E244-80C9-282393F5D189.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/8F3A752B-6CFF-A540-801E-EC740047C966.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D801006A-031E-0641-96FB-29644AF1ADB0.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/DF051928-983E-7842-B736-6F8136917B7C.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/018AF50F-AF59-E840-BEBF-66E51FA73ED0.root", {203, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/AFF8A5E6-1E1F-E744-9A97-5522D8B7646F.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D4DD4B54-AF1A-1A45-A4BF-6AB914A4665E.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/DFB096B5-5F17-BD44-AC3F-077F87D0E07E.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/B486572A-ABED-F642-8912-F0A51880785D.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/BE76BC54-F6F7-A047-9899-196712D20F80.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/C14D927D-DBE9-0C42-BCFB-1F772652761B.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/CEC63E66-B899-314A-AEB1-B77DFAC88C51.root", {204, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/260000/28C96C35-408C-BC4F-9943-417C10816321.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/260000/3E626FCE-E2A8-8D44-9A4A-5A3EEAEF1069.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/260000/7B68B13B-74E7-D44F-8309-E9290A6D756B.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/260000/FCA89849-03CE-0849-A498-10CDF936DC68.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/0E546839-4770-404F-B725-53430E58F0CF.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/4F34E4B4-700F-C04F-AED1-77BB5803FFA7.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/7C05B487-7A1D-8441-B3E3-5FBC381032B6.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/7DDE522B-6CAA-CF48-BD7F-AD767E91673D.root", {206, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/D84A00DB-D484-BE49-8418-EA6E8CBA5F75.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/FAF0A41A-1D49-E340-B460-B6E866630F58.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/065B0093-B288-964A-8901-86268E1B2DFF.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/166A36F5-D67A-F747-85C9-143FC6D12FA0.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/3440D60C-DC40-FF43-8F32-02BFB3A01981.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/56E93938-A09E-DE47-8919-2C56F243FDBC.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/57F98D9A-F529-004C-8B7F-A0DC2EBCC45F.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/73025D45-77E0-FB48-BE8A-C24AB0B92C7F.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/88A545EC-C453-494C-9B37-765C29BEEF9B.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/A5A192CF-C210-4B46-85EB-D7120B90C3FD.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/BDA89CD0-3022-8340-BA31-B7F3452199BA.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/E7F98B42-40FA-DE4C-8DFD-CE1147072FE4.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/0FECB999-38FB-A94F-B590-D20479D6EC14.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/1AA7F5C5-87FE-5748-B1A8-3D78E271B225.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/219C95E5-6AAB-4C48-8068-F2A8311BA2B3.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/2FE8CCFB-B860-A04D-BE1B-8B82CA283149.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/4ABEF3B8-7699-EA4C-9155-FFCE151E5F67.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/54478021-AE4C-1841-9B50-19CB98D82E5C.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/571CBB3B-6D52-B946-B216-61E81EE36750.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/69B13F9A-046A-344F-B172-3A78579068A2.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/72CD5EAB-BF0E-6244-A526-75DD07F354FB.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/845AC358-D709-FD41-BBF1-926616AD91C6.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/8C236086-429E-6949-9896-4999BD974E4B.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/91F0CF42-7ED7-AD48-8F0F-623E5176B03A.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/93C0A95C-6968-A04B-A168-4181541821E4.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/95F4F49F-360A-F546-9E90-99E50787CFF7.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/B5EA526F-1B08-4D47-A9C4-C370D2A382F1.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/C132292A-8908-0345-A910-23F93E4BEF7E.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/C37D6230-DDDA-D84A-B5EE-08287E485893.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/C4094C2F-578E-2640-98E8-D379B737DA92.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/CD35530F-E555-014B-9CA0-EF1A6DEEF695.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/CEC73CA8-5086-914D-9EDF-DE34BC5CF12E.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/EDC6FA95-CDFD-CD49-942F-14434F37530A.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/F6A3C604-A3F6-5D48-A30B-512A0E326551.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/623E0E20-3FB0-0D43-9670-FF98EE76DE01.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/7E490C06-791A-4B4E-8B3F-C3E45A75CFB0.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/AECE8725-7B26-4742-8608-920BFCD63CDD.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B12522EA-B6DF-2E47-A982-0B2BF0CDCFFD.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/DC45F91A-E8B5-A642-AE98-266304AE3BAA.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E7937421-FC4D-1F4B-AFFB-0DD0D8D0164C.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2500000/05F9FE1F-B3CE-AC48-9080-71F971F3CAE2.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/7CD8B5A8-5A0A-1F46-96F6-A6C783F9B6A5.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/8312F13C-797C-4944-8816-992A11D898B0.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/ACB9376C-E645-1A4C-BEBF-727FA5396267.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/C76E099F-2A32-C342-93C3-271D35B0B4B9.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/D363BFF8-6983-A14C-B7E2-4C4A4913FF7C.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/E9079B6A-F15C-D243-B55A-A7A53986CF31.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/6B0EBFD1-277B-0F4C-8172-F13A1B9AFDD9.root", {208, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/011D26CF-2D96-C54E-8A38-CC62C350647B.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/0336B713-44BA-E848-9838-6A1562E52063.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/0CD19986-6110-6849-BB05-F1451DA62BCC.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/11B4841A-5776-C540-8C65-905D245AB0B8.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/2C73B473-AB9D-D04D-A743-C74B6291DF80.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/3A19F4F4-621F-7849-86E1-0B4A8D51096E.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/51EBC7FE-B324-D941-801F-5CB557CB22C0.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/5997C711-EF0F-A04F-893B-213DEE470A8F.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/605FAAD9-0284-F041-BEAF-C0E6DD4E695E.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/80F240C5-2959-544E-B505-ABFA4B395F2A.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/8D63EC7E-ADB5-8945-9450-75B61E44A8E5.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/978A2F59-06C4-8E48-9400-4C2A6DBC1344.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/A3C33CDE-9D8A-4446-B0ED-83916C48A297.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/B60C0C53-C054-F742-8AD8-08D6EFA6EEF9.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/B69CD938-2E06-6647-998A-3DD8AA6D325D.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/B6B86247-AD62-D845-A195-2EACDBA841E3.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/BE35E7D4-5A19-E041-8142-D8EC088E07FF.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/DB387C81-6CD0-C148-963E-06046084FDCA.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/DEEB1A7B-AB14-A44E-A24C-CFABC15DEF16.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/E4E8D026-64E6-7248-BF2B-30EC1C922975.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/EDD2213B-88EC-2446-ABE4-661C0051FECD.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/F0F09851-4D8E-9444-93C4-BFBFD15F49D8.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/F6C99417-DF0C-2F4E-9813-ACB10A012B6A.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/FDA9CDA1-09E9-814D-A39B-29204F8EA2E5.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/D2E4C772-2671-3D45-A0AF-F3C9C55F6BE7.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/1D1A8F72-4151-4D45-BBE2-262581D26E5B.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/AB6FE2BD-B047-9349-B6CD-2D7AA4F6322D.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/C56758C8-B604-3F4C-B6EC-D6424661972F.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/386951CB-5D9B-DC43-890A-82D1C1EE20D7.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/4042259E-84CA-A84B-B469-5C4B5CF45B4A.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/5AFD6D78-D320-3146-9C22-19C3EF0F1459.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/7D5CF017-2A7E-6F40-B696-34D05C66DACD.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/987F0A91-C42D-6F4A-A837-99FC8194A71C.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/B0719D53-40FF-6E47-9285-22D5559F386F.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/BEE1B05E-35F5-D24B-9484-233CC43FD43C.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/DF48C42D-FCF3-FF4C-B09F-C5693276A766.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/F81350CD-A737-884F-9ED6-530DE62718D3.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/FCA5823C-11DF-DE4F-BCAB-F80CBCB1AA98.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/FEB373D0-3FEA-564C-981A-D29F95C0F7E9.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/375FDAF8-92F6-8046-9159-5040055F7708.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/9BC260F8-1109-3C48-A3A3-2E1F050049A2.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/F6D507AE-DD16-1047-BB4F-59EEDACEC444.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/FBBA7E43-712F-3447-9BCA-E4D88064CB30.root", {207, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/4841B901-E9A5-2A49-B774-447C39D8D8B5.root", {187, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/984C5CE3-BCE3-8F46-BAE0-DE0CA71796AF.root", {187, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/E7FED13F-BD56-2C4E-BD5E-87E2193BA090.root", {187, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/4645F539-F7CA-564A-A949-E2D78D5A496D.root", {187, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/50DB6B2E-5279-E642-A0BF-F57BF4D7F70E.root", {187, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/A2204F43-75E3-C947-99CA-7865DA0977DA.root", {187, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/011F120E-2342-D046-A22B-88307336493B.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/03C84A48-9047-764A-941E-258A77585277.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/07F196D4-5C39-CC42-9F56-B19566C4C411.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/10C33CC0-846D-134B-99EA-F7E4200E9A48.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/131109F0-D9F3-0A43-975E-265BC1CFE6FF.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/1504C6FC-9533-FA40-87E8-55B10C3F3E07.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/1DF4A2CB-D908-2648-9F63-C3DC37707E93.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/1E310FF3-C511-8E47-8522-5E0DEF793954.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/1E5B137F-0C15-9047-BE08-FCA99C0C6B5C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/212E5563-8FA2-7947-8E4B-257BA97EE645.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/256AAE58-DDF4-C44E-B33A-ABFC84CF8EE7.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/2697A553-4F09-9842-B942-37B9A8624343.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/28AE318E-A365-9F4E-BF55-4F72B3B6FDCC.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/292B87E5-487C-5E4D-95F2-3A9DEAF9F91D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/2A429AF2-DE56-5E4D-A393-69B8C9DFD6CA.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/2D5262FE-F3BA-F142-9045-BCCE65DA5D10.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/2D764A69-C69D-BB41-8FDE-D85BA88A9055.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/2F927F33-BC10-B240-8BC9-3F05C92979C5.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/30022763-68EB-314F-99EB-7ABCA2156173.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/35576172-00C8-5D42-977A-D53B4847DD4A.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/35BE64F1-F2DE-5341-A512-577D39C45F42.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/3851571D-5761-6544-8AD9-5E0BF62EE3EB.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/39FAA3C8-01C8-0247-B4EF-849957BBF4D8.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/3D9CF396-C486-E54D-8896-3614F421C0A6.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/3DBA0953-8993-294C-867B-6515EE28E334.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/3DE27AC4-666E-814E-81E4-FAEA41E27A70.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/3FBB724F-E747-3D41-84F6-21224B62F3F7.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/4451B50C-1D09-6947-9003-1D7DA0F6E3AE.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/47450C94-04DF-7048-A46E-E77DEFE35A0A.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/47C6CCFD-2B70-994C-97D4-3EB9FEBC4C4E.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/4C1E172E-DA11-8C4E-B59D-0B3A46A8956B.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/54CB3418-666A-C746-BBB3-BB06AD1C534B.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/56691C32-EA20-7D48-81DF-0C36CAFFC63D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/5C9A5D97-453B-0945-A6ED-98EC455C7DA9.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/60250C73-6FA0-8246-8085-33EF0DEB619D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/60F46F09-86AE-B541-8A5A-DEB0A29A8D50.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/69AEE8E9-76E4-C54C-BE33-ED74471E6143.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/6C0AAC46-7607-1F4E-8F69-7632068C6F23.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/6F596986-55FA-3B4D-A59E-F1784C86E33A.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/72DE1A8F-B8E6-9C4E-A073-02C6036C7B00.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/74AEE4CE-B242-4242-9AD9-382EEEFB223C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/74C36AED-4CB9-1A4D-A9E6-90278C68131C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/782CD4C5-3F01-B546-9842-F69ED2682A7F.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/7B674270-A585-FB4E-ABF6-94B43FBA932C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/85C9F160-4573-7E44-8594-5D156977A2B1.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/866362EF-FC12-0A43-93DF-D49E7B00BCA8.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/914C49F6-D620-5E4C-A475-E38B575356D5.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/92E5F8D5-1215-9845-85CC-5FB42AEF99E5.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/9703D08F-140C-0644-827C-8A65C7BC077D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/99037A80-6006-C744-8F01-941D83B5DD7D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/9E3F7ECD-2D23-E74D-86E0-05F8B0A4FB8E.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/9F807EE9-0568-9B4C-9422-170B9731CF77.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/A5836D7B-01E0-624B-BC77-D75A402B903F.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/A5FD3B0B-1E75-A245-9A3E-EECECEDDA65E.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/A66739DA-6D17-0B41-AD65-90A82446A4E5.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/AC1E7C96-1E0D-F447-912B-50BD8D549516.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/AC24CEB2-EFA5-8047-89E3-A60570FCF48D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/AF3EC52D-5109-A94D-876A-AFCC224E3944.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/AF4437CF-30C8-884A-907F-C38B9FAE821E.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/B3536766-FD4C-284B-AACB-31AE79E644B7.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/B6274E15-4850-2042-8479-FEFC64C8832D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/B83ADE54-44E2-2341-B389-423E33B952F1.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/BECA664B-8911-5746-B733-DC1E0C020E9D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/BF8FF5C6-5FDC-534E-8BF5-12ABEDFCA3CA.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/C3D3A402-E71C-C84D-AD85-4881BD795D09.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/C6E08DC1-4848-7641-BD3F-9A43BFF2D243.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/C79BBB5A-2D85-2343-824D-5319B4672839.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/C8783F40-85E4-8A48-91E3-2C5AA8FE5213.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/C9E789DD-BB0B-0344-84C0-FDA560DD2E94.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/CB838D6F-6B19-B148-9854-84D42DDC522D.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/CBB4B9A0-B1A8-0B41-A665-72EA25FF743C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/CC3157D7-4718-BC4A-A661-2FF1AA1A0872.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/D054A7BC-F56B-3449-AC90-13A424AEB278.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/D2300F07-5B3D-684A-B35D-E18AC9D754FB.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/D5B7B72B-A0CF-DE43-8678-821B4747A966.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/D7549169-B4BF-F647-BD04-C5909B36E5B6.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/D90D8C3C-C9BA-E649-B040-23E044CF83B6.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/D9E7ED91-573E-7448-A31D-D7EB86D237D8.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/DB0C948B-3FED-384D-AF48-B4275AEA6EC2.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/DCD5F8E3-01F9-A64F-82A3-20C8D6BBA5A2.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/DEEDAACC-97D6-3B44-8D71-D6E5F30A03A5.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E20B15CA-EE5D-9140-A72D-66A3E861F364.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E3B4030D-5D60-034B-ABE1-447CEA9E5765.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E4F824A3-3F8C-564F-9AF4-6556DF7D3CC9.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E51E35AD-594B-404F-9BE4-AB42DE6EAF35.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E587EB20-E717-0448-A9FF-229F12353B8C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E7185D42-E19B-4743-B5D2-2D2A008AB656.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E98F6599-75C7-3341-9ECE-9A9A423FF662.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/E9F4B62D-CD54-DF41-B0AE-AFA44FD81068.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/ED27C35F-833B-5B40-816A-E635ECFD455C.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/EDDF6235-96DD-0D4D-92CF-7137CE93A78E.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/EE4C3954-7374-C846-A1D3-4DA821D46F97.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/EFBBD9DF-1B6A-C54A-9CA5-704B819BB6A8.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/F27016A8-FFC4-2E48-85AE-06AE0E6A0DFF.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/F4B3D0FC-D68D-5B46-BF21-1F895746C910.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/F689F2EB-6A85-CE46-9AB0-BF87D586AFFD.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/F8026124-C3C3-424A-A0A2-0888756AED09.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/FCB1FFA3-61A2-E54B-94F0-C04B0992FFEB.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2510000/FE36F1D8-BED8-A14D-BB5E-D3FFB842EFE8.root", {184, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/9A168D3C-99C6-B74D-848C-D2879ACA54BE.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2530000/184C4126-3B70-8043-847D-3A58A24E26BB.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2530000/82A5484A-E99F-8046-AE17-E72B2A806644.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/3CE83DD0-DE34-D145-A180-BE4BCC456CD0.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/4B9AA973-EF09-8748-A22D-14052FD77255.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5426A55A-F174-6940-9DC4-6B9622F79C98.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/B5577E05-6D9D-C247-B852-FA0073F0E23D.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/B806B06A-4C85-F34D-8439-942B67EF423C.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/0EEF5DEB-8F04-074B-BFD6-773861157711.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/2F9D2285-A3A2-CB46-B89D-7709D0F75BD0.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/301999AB-11CA-364D-935E-666C490FDFBC.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/6077E505-7185-F84F-8B2D-15101B792F29.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/97DA28C9-F25F-3341-80D5-E92F63426F42.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/B8D29D60-5AE7-D04B-8759-68899E929129.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/C3DCE86F-E6C2-4C45-8CD3-6F959C22E06F.root", {191, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/CDEA39C5-121C-4B4D-95BE-5C8FC23A4160.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/E436F613-0728-B849-AA5E-305E7AF8C8F1.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/04F3A919-7482-1449-8029-298A17FA6683.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/34D5487F-2E02-4143-93EB-95C48A8B6B7A.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/60268B57-C299-234C-B7FB-31E78ACE4C28.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/745B6CFB-C3C7-694A-BA79-B76A694FA311.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/87EC9B84-B4F2-674B-8C83-6E7E58DCA943.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/95FDB26E-0612-5741-8998-2ECBB4D30EEA.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/0DE14393-7560-F240-AB21-6355D50D1696.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/C34371C2-6EC0-9A4B-BAB1-331614415C7A.root", {190, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/2211F245-79C0-3B40-9B65-5A0C19F68883.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/78E7BEE6-445C-164C-A54B-A34D205635FD.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/C5C76FAC-4534-BE44-B514-95171D9C8A2D.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/F38E5225-C643-EC4A-BFED-05E20246EABA.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/FDA75866-C35A-F84A-A299-4C2A9A4EAAD9.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/0518A981-CA2C-314F-B956-BFA6FCCAB7DC.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/983F0E7A-3C67-A041-A6F8-1B67784B6906.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/FB558D59-CBC6-5E4C-8F3A-6FB7E6B3DB42.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/16E356B8-0319-AE42-965F-A8765921007F.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1C9D6ACC-3E4D-DC41-A707-0572EE40F685.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1CE9F813-4DBC-CC4C-BE74-4D061973B0E3.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/2FE01020-A935-0E4F-9FB6-F276869C1AAE.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/5620B128-7C10-E84F-96B0-829C95AFE505.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/60A113FE-3B3A-1F43-AAA2-6413B237A1E0.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/6196CEFF-3B16-764D-AB7E-ACDE26477BBE.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/C4A43A25-895C-D94E-8577-2F457D231949.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/283771B9-BDD6-F74E-8D96-447E7163E69A.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/878C748D-D8CB-C849-B0CC-D9F0EC19F806.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/F7B7403F-0E3E-664D-8B2C-69C36C9D280B.root", {189, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/27BC075C-28BB-7B46-989B-6C465E2AA249.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/34719DFB-31D9-9C4B-9FDC-CE1B9EABD2F4.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/360B0FE0-BAD9-644B-B804-BA18DCF981BA.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/4F21B123-F2DB-1F4B-9C63-47254A710330.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/57BD695A-CEEB-2447-9196-35081BB3D610.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/60F87652-2DC3-EA42-B92B-423D242A7196.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/62CE9996-6222-3D46-ACD2-939C9BF31882.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/696A4731-B7D1-6C44-8666-CBE665AAA261.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/860AF7BD-B383-9E42-A938-7258A1046976.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/96162AAF-3DE4-2C44-A3B6-90E68652AC53.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/9F07F75D-D930-784F-873E-3374E3E87435.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/B5231037-5486-2F42-BC4E-B17585CF7A0F.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/B79EDC6C-9563-1545-951B-77ED75A70462.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/C94FED1C-063E-574B-A09B-E5BAFD81A833.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/CE2A9ABE-1717-4845-B199-EE46BF8242C6.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/03A9A680-0702-B941-8B78-48B8FA0E2B73.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/23844E6E-B91A-3A43-A9B6-7E05B9A6D892.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/E6A7BB1D-6032-664C-ABAD-F0D57CA441CC.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/1CFC4E85-168D-C840-8E50-CC2EA056B4BF.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/236CFA3F-DC86-294C-A0DF-9D548CDD179F.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/46C1E1CA-8F0C-A54F-8F87-891804C05E8C.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/51ABC382-B77B-CA40-9CA1-D92B707A106A.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/7B785AC3-B7F9-6C4C-B893-1186D6FBE614.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/B130B12A-746B-5642-B7C9-4591A8B2CCD0.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D672F5D8-A75A-EB47-9A4D-AB2D314A8DF3.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/DDA70F8F-6F35-094B-86CF-6A458B20A819.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/EB17E04B-0DCF-E04B-897F-63AEEA6982C9.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/4028685B-A551-7D4C-8771-5318E763C725.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/4896BDE7-DB56-B941-88C0-408C4B0F34D1.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/4A4CBFB1-047E-BE47-948F-A04D16D29547.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/51769F98-B3C8-AD4B-9A90-19DE6EC2DB0D.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/6B3C411A-F478-A04B-BB19-BEF9E8C8E490.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/FC41929C-E626-1A46-BA40-934FA9AD4340.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/28BBB480-B33E-9B48-9CA4-B32735087C82.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/D6B66DF7-40AD-3C48-8B9E-AB21AA378388.root", {188, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/4060613A-BDC2-F641-8F60-7F29ABC90F6F.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/04AE0546-F593-C64A-AE46-451752994689.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/42E0F82E-95B2-6041-992E-C5643E5EEC28.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/4B3DB2CB-7229-B441-8A1C-E13D1A10C4F5.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/E67424C2-8209-B342-8142-DDF5AED26F9E.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/E8CA0DA6-614D-3640-93D9-ADB24AD49373.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/3563545B-9FA0-A042-A03D-623A15450107.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/37F3F276-3E8E-E749-A08A-F5B10CC25203.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/42CD06D0-094C-404C-AFDF-12726BA002D4.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/5FFB2F15-8C73-E443-95C1-B3578312D5E8.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/6CBA1178-E270-0747-8AB9-8B265BB0BB08.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/AA55FB09-F4F3-B448-9ABD-E604473C72B3.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1C5E21DA-2226-8D4D-83E3-B1E8160B03C6.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/22ECDE14-967F-E942-8459-CFABE8F90249.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/2E94FC66-9249-BD4A-9117-9475820C5EB3.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/73713551-E7DE-A245-8FE9-1DCAD51A6434.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/8A6DBB64-24A0-DD42-B348-81BFAD0A8694.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/9ADFC7A7-EF1E-BB41-A45D-8B47A18BD0FC.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/A6E4CE54-696A-BE4D-8AF9-C168067EFE52.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/C9931BC3-3803-C348-82EA-ABA0BD7AFBC4.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/E0C86669-EBCD-CC4B-822C-1DACEF481DA5.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/E166EBAE-01BA-5E4D-AB7A-B35847C07C6F.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/FC7B1BA1-A479-0F47-9310-DD86DBB57B56.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/44B3768E-36B5-CF4A-8C79-C714D49207D5.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/493C6789-879F-6741-8BC4-05B8152F0F2A.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/8932D38C-C9ED-0649-9777-7BA62FBA2E6B.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/BE20F0ED-3FFD-C448-AC80-10A456CC3757.root", {214, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/F7B00EDB-CD25-ED4C-BB6B-A512EF23A094.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/0F4A362F-1787-4F46-8840-CE54928EF83A.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/2B369534-4DDE-C54F-9E1D-7D56634C4D8D.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/2DE5544F-5FBA-3A40-8B15-D90AC2349896.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/479BCDA7-9C25-4C4D-AC43-1BC1BE17CFFA.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/4D6F2190-131A-744D-B10F-0B341BD87D4D.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/5832EFE6-15C5-1A49-AC82-5A0E1399DED7.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/793B648E-B05E-BA40-9EA7-009F7BE3E3E9.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/AD4D258C-177C-D44F-9C81-8486690BA896.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/BDF38A0B-7DFF-5E47-BC8A-EA8FB85B4CE3.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/BF70529A-7C6D-8A48-B2B9-959E3348ABDF.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/DB7B10AD-B3D0-D545-A2A4-067A7C9D76BC.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/5899B45A-7733-CA48-B07F-392CBA00EF57.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/3FABD1C7-561B-BB46-AF6C-44DE2FBDC750.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/68A5183B-0925-1F49-8AF4-D2AD57FC9AE5.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/6A7B85CC-37B3-1847-B443-ED731F7A9768.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/BAA89E71-AA33-0C42-8FD3-1A8E08C3A911.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/E0BA8082-0194-4445-B193-5279A7C64E29.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/EC880988-0D5D-6F4D-8495-B110FF908133.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/822D3078-AEA9-D346-9C1C-722BCD1D3F05.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/002D8E22-0131-E84D-9E1B-F71AE8DB28C7.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/055663C2-E8BB-4F48-BD98-ECFFA4B77297.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/0C90E7EC-3D66-0247-BF55-8D62E2388D9F.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/15B73779-FB44-F746-B5D8-D6F2ACC83581.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/2AAC8E4F-A1D2-A347-B785-D88F3468DFE4.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/45F343EB-98DC-0248-9D87-D853F628D36C.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/5D9BDA30-63DF-CC4C-B46F-8DD3C6E5CCDE.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/6437BFCC-627A-3E44-981C-C0550FE7C323.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/64A1E426-F5E3-7E4D-85D9-B2A1C2D74C58.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/758EF54C-9F5C-3446-82B8-B0A8BB452423.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/BB2B7FF2-E5FB-1B43-837F-F39F5D7D5F89.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/C4A65058-65A3-594A-812F-353E1D90B9CE.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/D60BA098-FD19-9C4C-AC2A-CA0F02051495.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/DCEFA57D-AC60-3148-B38D-9C999E3CF328.root", {213, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/1EE92CC3-1EC9-784E-B6D3-23B7507ABBC1.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/7F0EA4F8-6119-3D4E-9040-2A13E324F032.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/D9AF16E1-999E-D448-BD84-080FFAD0FB49.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/10C15B47-1B2C-EC42-95FD-64322E48C7D3.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/30B07F68-7711-B84A-81B2-7EA9037B9AE1.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/427FE8C8-DF80-3F46-8157-06B8E70B1C6D.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/43CB2E88-8B79-E34B-BE4B-986FF4EB5702.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/4E940E10-7E36-CE48-8B70-9B8396961BFD.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/507BB61F-F43B-BF46-B1B8-8D6A488EDFD1.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/5F49841B-51F1-A945-B881-4193719DAD5E.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/9D76C6A1-10ED-C041-82B1-3250EFC8F369.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/AAAFA88F-636A-5E49-A491-F47A7245DD60.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/AC351B93-EDBA-FC48-B9CC-8C97BF092DE2.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/BFB47DA3-1C46-5440-8AA3-EE20C6931D14.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/C083B9FC-7103-5641-8E13-FAFC6C8CB74E.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/C642313C-3007-A648-9749-83BEEF9DFF22.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/C7D49C96-ED3B-ED4A-B0CC-70EB50B0723F.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/D0F420C7-B319-844D-AC76-1C9311150752.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/D78EB002-A856-E545-88D1-E083E32DB2DA.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/E39BF448-2D2A-7044-9F1C-2470B559D519.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/EEFC2092-1A65-9B47-8BA5-624EE24B0B8E.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/FB6A4069-8E36-AC49-9440-E0CEC4A5469A.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/1BE3C2B7-C4DA-C947-A4E1-C8A6C3EC64EA.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/32650A8A-11BB-374D-AF13-5D3EF7BEDEEF.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/52099A32-C44B-F34A-A603-20E9F776E9D5.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/54C4F19A-8A7E-D749-8453-98CB2006D934.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/57CCFE5B-6DCF-174A-A168-813896D1BAEB.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/74CA2D1D-4BFA-524F-8C44-067744227C13.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/8C30B47A-395D-9F43-B4F8-05EA91E1BFCF.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/94EEEE2E-8BAD-0041-8181-F39BCCAACC05.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/9E9B503D-C040-B14A-8869-DE31CC7DCBDD.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/A12332A6-4D16-9F4B-BAA8-DC482B2E8EA8.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/B6AB94E8-3BBF-4648-ABD5-3BC00ED6CAFE.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/CBB23F41-FCB5-964A-B56F-F599B918DED4.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/50000/E0BD330F-4B7C-DF47-9EBB-10AE3AE2424F.root", {240, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2520000/2664962D-88EA-814B-9180-A1CF8DFFE93E.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2520000/349BF8F3-CF81-3040-92CB-50FA231AEE6E.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/21F384EF-032E-794D-AEB7-59D265893F59.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/378DA3CC-3EAC-1942-A1D4-2B99BF7DA874.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/5BA8E4FB-D66C-0848-88E6-E661707CC4A5.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/63227FAD-7079-E745-BFBB-224D85417E83.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/6F0466AA-7B5F-944D-9E49-434887B3AB7C.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/7BD73FE5-5DF6-4346-BD80-B6AC8E4774EC.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/943B1F0A-F158-7645-BFE2-D607AA963A1F.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/A5D312E0-FB9C-F142-931F-513471F8D9CF.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/BB083D06-41B2-9949-B59E-1FDE695E9EED.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/BD66CBE9-D798-9545-9CFB-38D5A33EB588.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/C75AC082-7031-FB44-80FE-E00C0172BD7D.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/F3E96A74-A98E-CA44-9BFF-62C4486A888E.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/50000/12FB2CC6-407F-6E4E-98FE-C5E9323045CC.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/50000/13A3EBBC-050E-BF4C-910B-0E53F1B8F9EB.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/50000/62639F0C-B181-2B42-BB1A-C835C251B86C.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/50000/865516A3-BE8C-D045-B6EE-E8EE07EA4CE5.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/50000/A80D78BD-2B13-EC4C-AC87-8C2353E4F559.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/50000/E6DD9B0A-EFDD-ED48-A962-F42619D5634F.root", {241, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/18D73379-5567-BC44-8A79-1E8053536AA7.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/1AFA7DAC-1B91-FA4C-AA8D-81038CF6727D.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/382CE579-F9D9-0E49-89BC-D595463CDB99.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/41A58BBB-1A1D-C147-AA9C-4CF4992A8CD9.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/4B9EC946-A394-9645-86ED-0A27E6DD8898.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/4F326572-3632-F94C-8405-FEEC3C820D5F.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/5E8A13F7-02F1-4544-BCAB-07F1E972D581.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/80946AF5-DB67-634C-9F3B-B6ACCDAB4A96.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/863067C3-443A-B34E-8AEA-CE57F32F4015.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/878502BA-3B8A-9D43-B6E8-B104B6345A9B.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/8A8AFFF5-EDEF-D741-A3DF-D4E45AD8941B.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/99DDBA17-C827-114E-AC0C-FF3E0C46AF75.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/A17C7438-E690-6E4A-B55E-7651FCE162A7.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/B3B84971-557E-3943-8B51-4979F867A265.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/B815AF26-22D9-8049-A667-82FA9896D442.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/E9C17B59-31E3-9646-8D91-ED21B93DF186.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/FE56F619-0D04-9840-AFFE-111464FB2927.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2520000/6CE43FE4-54D9-884E-B434-854445BCB9B0.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2520000/75B4F8F2-EF8F-F74B-9CBD-4AF7AF00223A.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/0BF25621-B5EE-9745-A37E-4747B3B22418.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/6672CEB3-7C99-D14A-B4C0-6E81BC538347.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/8B08CA8C-EA6C-EB48-9BF9-E9677EDE45F2.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/40000/FBFBB78C-376F-B14B-9C3F-03A25807B4D3.root", {242, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/156D3DA9-A58D-234C-ACA7-377CA85FE1FD.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/34BEAC49-D2C5-BF4D-9339-33CFBDE287DD.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/4B249912-40DC-C249-98BE-633E8DA2D79F.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/53EF9A70-72D3-C64A-9AE1-218D92A999C2.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/554213C7-79D7-3145-8810-0D6D0308CF5D.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/85D341B5-EE75-D84B-AD76-5AEA9D431067.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/9E06CF93-0814-2B40-B663-73086016DCD2.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/B2AF77AB-EB8F-694B-B071-59B81F8F5741.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/BDED3EC4-0E82-0B42-9D30-882978E89D9B.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/C22DEF9A-BEA0-094E-8C6C-76472AC81B81.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/DBEA857E-D640-634A-AC97-D2C8EA198BEA.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2520000/EAC42D0D-1C4F-4341-B87A-A91224CB475C.root", {216, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/386EE588-1D98-A041-8868-AF96D60FD643.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/5ECB95A1-0912-2847-B167-ECD5D576F4BF.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/1DD91DE3-6543-6E4D-9F07-F33CFA8547C6.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/041EB6E3-5D22-2E49-943A-7F1D5C2720D8.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/0AA28444-751E-824A-99FB-09E076775A92.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/12F8AD55-08D1-3141-9C20-8D1EF66DB182.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/13A51CE0-DA03-3441-9A53-00A80E441E6F.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/142DACF9-E170-8941-88FE-D99A570FED48.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/15E0B611-21C3-5B49-877E-C25B1F7B4365.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/2E98E05A-9263-B24E-9782-EC7137A1FE3F.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/315F1253-6BD0-304D-B0D4-01E4AF9D9826.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/3F9DB696-6DE3-5549-A79B-461E1A414D10.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/43150FD1-532C-7444-8CB4-2039E722BD0B.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/459DC070-053A-9A40-80E6-607FE3B02473.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/497EA61D-70FE-E545-B305-38953A24F88D.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/5D54AD69-1B3B-5740-AD2A-56FAAEDEF3A2.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/6ACEFB24-0A45-2243-998C-17FCEB25C8EA.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/768B4C66-4932-644F-8BF9-3479DFFC42E7.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/826F6B22-2536-C74C-B7D4-2DD4DC65A5F4.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/84070A5A-7357-6849-A152-267F48E4C762.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/8620691B-C0B7-1140-B9E8-00AC6FBDB0CC.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/8C4BFD65-08EA-BC44-B61A-BA06C8B332C9.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/A1A4DB12-BED2-EB44-9C4E-E60747BA14A9.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/B4F1091B-C765-674A-8214-960606F68E90.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/B7C47425-7FC8-724F-A45D-CFB67CC31B7B.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/BBAB1210-A802-AB47-9697-96875B60FAB9.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/BC7F06EE-C2A5-FD43-8B48-67E0CF8D73F1.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/D64409E8-A714-1A4F-B79B-1319A2B539F7.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/DD45A519-45B1-A84F-88EA-3B2BC8760630.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/DE7C3BAD-B137-524E-B429-C1DFE81601DA.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/EC02831F-11F3-9F41-8732-4A48F095B068.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/F2704B93-12AC-5E4B-A940-E6EBCBD51A5B.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/F331683C-B9A8-B648-A907-D94147BD63F3.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/F421AAF5-A596-7149-AF4C-84C998394C31.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1439A717-3864-604C-8F10-FDEF587BA501.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/22618539-A045-F642-98CC-DDBBD882D386.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/2CBB726B-C28F-894E-8DAA-F3A2148E14AF.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/6C02F0FA-049B-7B44-8C7D-1A2CAE03E114.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/7BC5E2F3-6499-C342-966C-32C88FF56A4D.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/854C5196-B92E-E44D-957E-1D344C705732.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/95130CD5-34E7-A145-871D-BB31BC8166BE.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/C099CCCC-248B-974E-AADD-D75BB239379C.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/D0CEDED9-A7C9-C444-9AF2-89D37CD69257.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/EAD0AB4E-CA3B-524B-A1CA-014397E16161.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/F160EAEE-0030-114E-AA25-1ACF41AD4FCC.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/FEE260B2-AECD-BF42-8C17-A960C80732C5.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/0771D432-5648-3549-AC30-033E52BCA573.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/823259CA-714B-5149-A207-041E00FD0BA7.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/846EEC8B-3D7F-3743-A5FE-89A25D223A92.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/9AF8D085-9347-9B4E-AF09-A65622096F10.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/A8682D17-5BBF-8847-94BD-534415DF01A2.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/AB305883-C1EE-4648-BD9F-F2927509583C.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/B36E90C8-305E-E244-8B7B-66C056C56DB4.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/CA6601BB-88A9-7E45-A711-83FB292B85CB.root", {195, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWG_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/6F156C84-2F2F-0049-B1DA-C9A32272003D.root", {223, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWG_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/975FFBA3-F2BD-CD48-A592-81392E7CB58B.root", {223, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/AA7C31AF-F89A-C743-B065-D61DA93C1534.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/B7B5C9BA-955A-104B-BA9C-D9A48B24AE2F.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/110000/FE218F8D-140F-3845-BA1B-B7DE4979D2C3.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/274BE2C3-0EA6-6F4D-8B21-08C42FC1C4B4.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/3644F01A-06BC-A548-8F58-F0FB4B0CF1F8.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/4F16C798-8967-C949-969B-9F54FBD7537E.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/769C0EF8-6982-914E-8571-47EF7E476C28.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/87652495-6DB7-B143-9E66-30357FB098A5.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/A83B265F-E6D1-9A44-856D-895D3D7007E0.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/CE0939FD-82D4-2646-8AE3-95342F365E33.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/130000/F6777C5C-E416-4344-AA38-46A16FB8AEE8.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/64E7F032-046D-3E4C-907A-FC4CAA390F77.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/873AC76A-AEDF-9746-9EF5-2234045D6440.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/46D9A592-8F62-6E4B-8F63-EF6648F0AA34.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/DA317208-1CF8-1A49-B688-B47D25911289.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/B01484E4-4E5E-8347-8CB3-FF4FA951356F.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/B4A82885-34F5-C243-BB8C-83BDB28443EA.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/01E53054-2A32-1B4C-A6BD-2D35C78A0CC6.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/1A437CD1-411C-7643-B79E-E02FFA1747CB.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/2AE21BB6-74DD-1842-8678-8987853765EA.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/3F1CA95D-072D-BD4B-BBCC-3BAEB7B29C86.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/4DAF4938-FDE8-7444-BD35-FE3FBFB8EFC1.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/58F6E29F-BD96-094B-B39E-F1E6C81AA0E5.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5B94474D-EAC3-3148-99B8-CE2DA6C6B0D1.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/5E698B95-0FCC-CB49-81B2-6AAE5F2CCA48.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/622AEB95-BDD0-BC41-AFFF-7770EEA67283.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/653FA787-C843-3E46-AD04-68194826653A.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/669D57FE-E473-B54C-8A39-06E9DDBF6646.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/9156A8D3-328A-A044-B16F-DE0B936793A8.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/9B0627C2-D0E5-0B40-B40C-5E2BC33F934E.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/B41E1A69-8E31-D54A-9446-3C88F5490F82.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/DA427C7F-4B1C-FA49-80A6-223D51AAF53C.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/E577BAFE-5724-2340-A8C4-DF29CAC34458.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/E93A02F9-C857-FC44-B63E-E28DA4DA7FE6.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/FBFCBD58-2E3D-B542-8435-66404C6B3008.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/260000/FD647975-0939-1A45-9864-E379D9614C27.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/079137A4-E8C3-0343-B0D3-C269EF974102.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/443DE54C-FA53-3446-8365-91BE9DD79D9D.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/4D1897D8-80C4-AD48-97E7-45C216F14DC0.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/80895318-F43B-B741-AE56-28D632DA3DD7.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/80FE7CAA-9A51-6C44-91E8-0760817CCB37.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/A8682A6D-A402-7047-B1A5-1C176B22CDB2.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/C42A787C-1DEA-714D-8C7F-293D6797EB1A.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/CBF904D8-B189-7044-A8FF-F8E2B807DED6.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/D8CA6723-FACD-304F-9074-88B95F176E0F.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/270000/E1A25F01-338D-2F4E-951B-F8B9FAD37FCD.root", {197, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/100000/C30E9EE8-8D5D-944E-B2E5-44A373C7312F.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/110000/97794F82-CECC-0043-903B-869149406FEA.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/4100B117-F60F-994A-965A-13A50259045E.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/5FBE8DC9-251A-E148-B8C6-D64E717A14FF.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/A4D58423-AA68-4E45-9BF6-2E95D5C98DE0.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/BBDE41CB-BD5C-4848-951E-F6772A1E62BD.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/0B755DC9-333C-A04E-94DF-5ED2EEA5E85A.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/9EB09E0B-F4A8-654B-9456-13D4952B7D42.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/B6863606-6B5C-0049-AA0B-D6F86D4A52B3.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/A22896D0-BF45-7444-BBA6-4D9E10B35F9E.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/E3C70316-5C11-DA4B-B0AD-B20AAE097207.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/029CCFC6-1A25-394E-B91D-4CD41BC1F44B.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/0C6C9E4F-8EA2-1348-BB6D-5D316BC8F039.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/164805F7-657B-F549-A02A-8DA70960E011.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/1EEFCDC8-DF46-4446-9C4D-BED49DBD9551.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/21674785-5322-5C46-9CD0-EEAA529D44E4.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/2289581A-D4E6-6B48-A246-90D64BB9D667.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/4191B67A-A204-E543-95E9-31345FC44BCB.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/4982CF8F-4C49-CF4B-ACE0-A86CE6CB767F.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/530285BD-DEE2-0E45-BB33-EF94827F4DA8.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/58E586EF-C00F-714C-8FE6-A26B39798D80.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/62B26061-64E6-DF4D-A1DA-38589C8A4796.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/6B0CDD47-EE6D-D240-8C01-847C5A1A56F7.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/6F469CFD-7A13-0146-B2CA-31C46FBE8E64.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/749AABFD-0EEC-AD44-AE82-313D156A1B92.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/7F99640C-382E-724E-AE03-B1A84B6B411F.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/84C3989B-8DFA-3043-B291-846DDD15882C.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/858AECE6-7CE8-F544-B02D-8E9CAC1C3311.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/9ACB3FED-FDBD-8341-9542-33E49EDF3E78.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/9DEA4AEB-07FD-2249-921E-6C0C01058436.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/9EF3CF8A-5923-B149-BB7C-E8CECB9041F4.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/A5893A32-57F2-C446-814B-75F5F3C56CF4.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/C0920A2D-589F-A745-BA73-76968E4DC74D.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/C278AD0A-D14D-4343-834E-27A3F5AA34F8.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/C47E21E8-AB0F-1949-94CA-1542E1F45289.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/CF676176-8D64-FC4E-B659-799457323F1D.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/D3EFE97E-B07D-C342-A301-383E1738EF59.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/D4A59F96-6770-6A43-A2EA-62946827D088.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/D4EC158F-01B7-9540-94B5-B6019EC046A5.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/E44C6A88-74E9-B149-A705-AE3D993FB0B2.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/EF7220E2-F654-7741-A0C4-895BD20BD657.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/F6E99BC1-0600-0049-B215-BF64BFF142B5.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/70000/FBBDA1CD-426B-BD49-8491-7349C79210C4.root", {219, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/CBE06030-A2A2-234A-85A1-729818F5202D.root", {220, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/1C1221D0-39E7-E148-81E4-9DA3C8906B99.root", {220, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/3BE737F8-FC8F-6D48-A80E-B4389EEFC057.root", {220, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/941320CA-8168-9B46-AB80-3ED0C9425386.root", {220, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/B9EBF4AF-E95D-8149-9AC0-A110D4B8986F.root", {220, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/110000/20582413-730E-C747-9101-99CD490210CA.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/110000/7CE5BDC2-1665-774E-8557-C4E926D5B59D.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/58265EBD-4269-6247-9F3F-480F81F81396.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/5C707385-DF07-A642-B4AF-EEE798A5D0EC.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/E96DE026-0DF9-7543-8AD6-E127C836C954.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/230000/EDD64F71-385C-2E42-9A1F-53CC26580A21.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/B387999A-656F-D948-91E6-5ADCC694B9F0.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/250000/7344AF6C-D092-B343-BA25-19C4EBD0286D.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/190AF2E7-7FB4-3E40-B9E9-082FC3161EDB.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/27C7CB3E-BC76-4D4C-BB47-E205F3D8F5CD.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/39A0C3B2-19AB-5245-9B76-46F8CD37E105.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/45DF818D-C403-0A41-A6E6-D774EA0DE918.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/5AD1A4E1-C3DE-0945-A962-17B926B1D540.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/260000/F2110FC6-5242-CA4E-97B8-A1C36178B43A.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/0584F384-2581-2B4C-94BC-766E2638B227.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/0C26AC52-D578-1544-BAEB-371E21927EF3.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/14894D2C-2E44-9748-9204-321C48717154.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/3EE06280-7162-3549-BA21-E401CAF9D95C.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/67D93184-A371-AA47-AB4C-7A5E1C27B81F.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/8E8D97DF-7BEA-7747-A340-575A59618A88.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/D17538CF-9B6A-2047-933A-187ADE74C4BF.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/D89496D8-2E9B-164B-BEB8-0EFC3B14E0FC.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/270000/E68B2EB9-ADF1-A74C-88AE-5273752CED8B.root", {221, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/3032CE7C-FDDE-7243-8B89-13AD7549A797.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/936C5557-15D6-B74C-9260-582B71C8B1C3.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/120000/E4F05A6C-CBDD-254C-ABBD-38B7A5E81EB3.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/4563AB48-B968-8E40-A2B6-CC2267F666FD.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/34A260AF-5CF4-5648-BF9F-B84B7A5F2859.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/57183F7B-DFD4-2F4A-8D0E-30146B8180B3.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/2324A46E-D508-F64E-A349-47B2C32F9DF9.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/57CF3855-EDA0-D74A-95AF-BE11A0C5CC47.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/6AE90AAD-6FF4-9045-A6D2-C49FC51EE04F.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/77F8F67B-C473-C24E-9457-CAA86B73C08F.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/8B3F8D35-772E-8A4A-A5DC-1C210FE634B9.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/A474C122-CA95-614C-9B59-9B59E4434863.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/BB9C5117-3695-A84C-AE4A-B50DF2A5A493.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/C7D7623B-2820-3B4E-AEA4-7062EC204912.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/D7187C96-49C4-FE47-A9D1-919C7155E553.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/EF9CBF4E-A9FC-ED44-B5FF-EA26470BD4A0.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/5CDC101C-4B0C-D248-B7DE-D3A4603F2D67.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/A454D9FC-0C9F-6143-9992-4A52ED757887.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/A8308F60-1073-D742-B102-713C001C89AB.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/WZ_TuneCP5_13TeV-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/AA222480-64FA-2140-B920-4606F5772B4C.root", {233, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/249DA2C1-115B-9546-B8C9-78D620B7ACA4.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/7700C455-3989-3B43-91DB-DCBADB14C838.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/57885E8D-70A3-BE48-B918-8388437D8563.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/977F3D3B-0156-C149-886A-8408581F2F63.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/BF14FEB9-83CD-514C-8FD8-DC5FCE39F252.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/C6942419-7F05-FF41-989A-BB9363DA15B7.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/EA14BC33-1B62-524C-BFD7-8F19E2BC47F9.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/F903A5CF-F5A5-7D4D-B776-98A324F065D7.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/39F6DA59-A48D-CF4A-B225-E1C4EFD5E5CC.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/D455DE6E-1115-304C-A784-B481D03F450D.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/09FAB3F9-3E54-6B42-8C15-33F9B5A5E950.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/10745781-43AF-4347-811F-FE4B85E6FB53.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/12891521-02F1-C249-AF7C-8E7DD2D0A9D8.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/1DC711B0-D8BE-EB40-A095-6879A3C19BC8.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/229074B9-D200-394E-8EB8-045E5141075E.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/2E8B440E-8FDF-6246-A2DB-E6A07CC01BDB.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/3E5F8401-8354-1B4D-AF76-D6C9525A22B8.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/4672A07B-6806-5242-988E-3344B42129C4.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/4AACAF2E-25DF-6440-82F1-4624B5A39D5D.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/50783454-3CFE-8F44-BC87-89215AE254CF.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/5A4F28C9-C890-DD47-9104-AE667C1623E1.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/5F909D22-97FB-8C40-985C-35A9009BB61C.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/6148F8CD-4AAA-AC4C-B8FF-E53F9E13AE6A.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/65362C09-D1BD-5941-9D0F-DAC6C0C3AFCB.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/666EFD98-3010-5D4C-8087-ADD8F7ED81C2.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/6904AECA-AD7D-3745-853D-664BB4A75F57.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/7C15BFA4-8622-8D4E-95C2-B63824A7EC9B.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/7D6C12D9-8D1E-0B4D-B132-31327750F887.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/91172188-BADA-AA47-AB71-D10A7F487B57.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/9BF1979D-A17B-4E4C-8926-181C3AF2044A.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/9E8D16F0-7606-A84D-B0A2-D322047D05D8.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/9EF544CA-28AD-254D-B2E5-584C4B12386F.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/A305BA52-6078-4B41-9039-72458F037D31.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/A3CF9858-352A-E44C-8802-52F36D169A7F.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/A83A503E-789C-8A44-900F-EA69A99F3DAE.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/AF4D5462-30E8-EA43-AA8A-A1EADA9796BC.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/AFAC9477-FCC6-0745-BBD4-B7970B05412D.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/BE224CC8-F2C8-414A-A396-2A6DC3294018.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/C22727A0-6AEA-8646-856E-DD308118DF11.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/CF4DC1B7-51E6-0442-8C7F-33ECB8101A6C.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/D09A8F57-54A8-9040-87C1-C27EFF6D8957.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/D4F04666-7CEE-B24C-BC55-D2A7637F9AC6.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/D563062E-8BBA-3845-9851-EEDC90402935.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/EA57A9D4-BB7D-364E-9AE5-C7C6CC0E6E4E.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/F249C2FC-1620-EB4E-A3EE-14D93C58D171.root", {194, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/050F1050-43D1-BB42-BBCE-B516115F387D.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/0634E316-F24B-B243-BFA6-AF7909166A43.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/0E35CF92-93E6-E14A-94D2-95EBDE96F7DE.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/1584E915-E25E-C841-A71C-16CE3963599E.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/28DC2544-621E-704D-8D7A-2B05083CE4EE.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/2D1C6FA7-5524-064C-ADA5-DE9C092AFA26.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/308525B6-A515-CD4A-B262-B1943D2C8AAC.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/342BF3A3-4685-A445-82DD-8246DE0D0126.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/36923199-0277-2D42-8FD2-DB46F3BCC3F3.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/3F75A3BB-673E-EE4B-A866-F5F493BAD3D6.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/498F5750-7798-9C40-B24F-F52CDFFF9661.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/574A5F6B-C63E-744A-A5C6-2C7160DA6005.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/697DE46E-9D19-0346-BBFD-83E8688F9A79.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/754E1107-0AA0-6844-8D04-0C992684E01F.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/835DEF60-9258-144D-B8A0-AC6DAF45610C.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/AB6A2F56-4955-8743-81F0-E594357C051C.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/B1F3DA67-1E51-564E-9957-4FF34BBCB6AA.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/CDE33C9B-6C7E-9349-AB98-8EB705907D8B.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/CFB4A779-170E-7F48-A464-6548EFA8A1A9.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/E1712629-FC0A-A249-8B4C-1FD867A9FBC8.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/E2B5A2C0-B955-EA4A-9AD5-3A1D2801C674.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/E4FC8A1D-5421-564F-A5E5-BF8A8D2EC7EA.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/F2261DE9-CF9A-7948-AC83-A14A8199CA01.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/FBB510BB-4616-9F48-B104-FFB543A146E9.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/FCF7ADE3-A4AB-9647-B99C-0745C7AC9158.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/FD25A08C-566F-8B47-AD45-DA7592C832F2.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/FE831F20-6CBA-E74A-855C-7B8517C085BE.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/FF458991-B893-0C4A-AAC4-8C1E8C850C2F.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/FF70816B-E45B-F74C-A102-5C4084126B81.root", {170, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/002AF54C-A6FB-A44E-8560-9CFAC72DC5D1.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/00E10DFF-2634-6E41-82AF-AA79E4837A28.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/06830DC3-6D42-9A46-81E1-0600941554A3.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/0CF8A506-E425-204C-B155-445A754D8660.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/0ECD9C9D-7DD1-D840-AECD-F8DF632AA98D.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/0F2A8543-EB2A-384A-A8BA-E4CA35A8838F.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/0FB7B394-9411-784D-A054-EC20C89A98E7.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/17833AC6-F41E-D44F-BCEA-EFE25A6F75F3.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/18A248CC-35DF-3D4E-8B09-DF00E7670479.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/22B70BD7-8030-6946-80A9-C70E54CEDF6D.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/285577CE-54C2-9748-BF77-D9A59EA12AFA.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/2B086DC7-978A-3848-B411-D5B27654AE65.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/2D559DA2-8C1C-7648-BC8D-5909187C48CB.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/39D0E979-06F8-FB43-9F8A-823EDA40C31C.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/59F56BCD-74F4-8744-AA60-C0BD0D717722.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/6B2E4596-26AA-974A-B5BA-F55471FFF62C.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/6E6AA5E9-3EA6-3E47-8A6B-C0E3F2DA138F.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/900A15AD-F7F6-B24E-94FA-F9DD029E86A1.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/A5B5E7EF-02D4-F849-A4CD-E0CB7ECECA39.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/AB463B8B-E5A2-3E43-9067-4CFDDA8415D9.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/B77DC2C3-DAD5-5A44-9EFC-A1BE41A46753.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/C09EAEA5-6A91-B147-ABB3-2FC84C4C6F3A.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/C3612CC4-8B5F-774B-8C54-4F356EEDBB24.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/C756AD7F-2697-1F4A-B09B-EF5469CA238F.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/CBBD3444-097B-6B49-B09D-A5C5AED7ECCC.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/D3E17527-2393-314D-98AA-BB0A9F791858.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/DFBAFEDF-6D17-3644-963F-CB669A8B9626.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/DFF1824A-D536-7C48-95FC-9ED11E68F8B7.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/E37C080E-31C8-8D41-A880-81A113066DD5.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/E57BDF5E-709F-9F42-B94A-76CE7995D3EB.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/E9A0E05C-D990-1C4D-9C81-02846BF8FA7D.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/EBEFB40D-614A-3349-BFBD-E8C0F4CBF273.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/100000/F5840465-F6DA-E64F-AF92-42D84F364838.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/24AF0749-C34E-714C-B46D-0D1097C75DE3.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/41283859-3645-2743-8BB5-1BF53D664D58.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/4AF9DA72-1635-5843-A00E-E203D7D43FC6.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/5EABF831-0E3F-0F47-92EC-A567D9D844C7.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/2430000/D71D62B7-71C0-434F-BDA3-2F5885AE9D0F.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/250000/687802BF-D363-E14D-B7C0-A74CFE0BC6AC.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/250000/7DA9A212-E2A1-154F-B973-7A498022CCDA.root", {171, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/2A9754F4-09AC-3B40-BB84-E98E5FC68D5F.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/3BEB8F94-6178-2C40-847A-D181B1749C56.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/47E77053-E20A-5B44-B974-38317C36DFF8.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/C5AD6D4A-5961-424C-82A0-C7B4D76DA0D5.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/E49013CF-2893-7D48-B959-82DEDBC87FBA.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/EDFB6640-74F0-3246-9917-232656DD577D.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/F4633AF7-3868-2840-9F80-120A8B6C8426.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2430000/F4D2E251-FD19-004F-BB92-0F4345F26208.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/250000/9A319B7F-1F83-9241-9848-310C55627901.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/250000/CDC844E5-D2C5-D24F-8BE4-A2E7680FA3D3.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/250000/F5193C88-8B59-A743-99C2-41443ECE69B6.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/250000/FDC06419-7E43-E842-A0D3-48A0F94E9805.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/009049EA-67CB-E947-A388-16C08DD215A2.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/34C043B0-FEF5-B846-A723-5CB5BD12BE55.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/35E3F925-CAEF-A14E-AD8C-AF616504F3D6.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/443B6178-D20F-464B-82AD-56417CEFDF90.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/8025F55C-6926-C74D-8591-3D67B4D1870A.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/96244DDF-DCB2-3946-9981-C7ABEA8A230B.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/9D15BE15-F386-0F45-A994-F072CE83A56B.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/A583A106-9AFA-B544-BA5B-4237A5D12ABD.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/B5174E3E-9374-D548-970D-0B81A74CB6A7.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/C7FF3ADB-7393-D044-BD7D-096B5DE22A13.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/D9895016-6D30-5C47-B1F6-07CDF38AA68C.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/EC29514F-3FFA-2E46-A8FA-AEB2006566CC.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/F3F7E7CF-E3FC-8949-ADBC-A63153EA3AC7.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/F9075CEF-3129-B244-B701-CA40091D0FCF.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2500000/FC99EFAF-C32C-DD4C-8F8A-1440B7901875.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2510000/6089A38C-7912-3641-AB51-2C28A1F813EC.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2510000/63C288F9-CAED-DF47-B2BB-1E745CA97FE6.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2510000/B33FAB7C-9244-D246-AD72-8C62121C3171.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9_ext1-v2/2510000/BDB12AB9-9C6D-C94A-ABA4-CA830F83CE77.root", {222, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/130000/C8F09A2D-A515-A243-A4E7-C71726EA1714.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/31D0A4FB-4AD9-774A-82E7-5C00DC8CCB91.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/75A8EA12-95BC-4848-BB6E-D1E347BC2750.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/998E17BC-A2F9-F54C-B9A5-BC5209289E1B.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/270000/99F6CA79-CA53-FC45-810F-D0C1CDBEEEC2.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/1FD30052-F2C4-F641-A385-CD4045C5EF69.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/561AC64C-2D57-EF4C-B6A4-7804766544F9.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/708B7CC3-30A4-FA47-B6ED-3CCC018F5AE5.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/AECF07BB-886E-8F47-823D-458E2EBA6FFD.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/B8F2CB7B-450E-F242-8F3C-7655DB1DC0C5.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/280000/F1A0BF26-0EEF-344F-B0F9-9A655DB39075.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v1/70000/3EBC2AAD-6991-6846-A34F-5DF05FD2F64F.root", {192, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/100000/89E8691C-A390-C74F-A065-70EF7E3B8F77.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/17528B2D-E13D-7F42-85D1-371958D912FA.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/4E4EEF44-564B-4246-BA8F-3C7AF9EE8ABA.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/ACEF4872-235E-0C46-B45C-4C43D5248FAC.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/230000/F1F4975E-EF71-8B46-B072-0A37F512DB1F.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/051D8AD2-4E75-EA4C-9DCB-638CFDAFA9CB.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/4189B7DA-CF3E-1147-BDA7-99B0C2E2A7AA.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/45789BA9-868D-DA4E-B67F-369C1803B36C.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/46F3DF77-4FBA-9C45-A07D-5BE4621C239A.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/6A751749-B4FE-1748-B586-3B0CC2A1889B.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/7060F6E7-8E46-A240-956E-9B1A763E6E0E.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/740088D6-92A0-AB40-9173-5BECC9AAE13B.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/9985524A-17E6-D743-A3A3-0C20C69E37F2.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/B96978CD-0BBD-7441-AACE-54678CCAFA3F.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/C70E05B0-06BE-AC4F-B46F-55DC318FB588.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/E94CB372-36D2-A049-AB4D-4F8C2C8C7226.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/EB6163B1-27E5-3641-AA54-6EE3B72D6802.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2430000/FE0C4793-BA7E-2247-80B9-8D6E6283B4F5.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/069EACE9-6D02-3A48-9760-B6CACD719D9E.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/074E4F0F-2F6A-0945-A86D-443515E143F2.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/144C2A22-4356-2F40-B289-830BC73EE316.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/44D3C63D-393A-2F49-A1A4-87E77DCE4FD2.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/489FAB8E-6BFE-124C-97D9-A99A6F8FF531.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/52BEB80C-51F4-C047-A342-0D0C75BAE481.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/5DFFB598-1A84-2A40-8168-730F377E1CDD.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/6D11F82B-DE3F-9543-8C5D-6078077903B5.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/84B9629E-BACD-2747-B4F8-8464351549FC.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/9DD376D2-3B16-F245-BF02-A942559CD28B.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/C05DF48A-D27E-1542-8032-58CD37A1A36B.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/250000/DE8C4692-5C76-8949-8BC9-48B0C48D5112.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/2510000/B9963DB5-D8B7-F64A-90CA-D9E43AD8B635.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/53D654FC-7FE4-E144-ADB5-5223DC6F733C.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/800389FE-D4C4-A44C-9A75-A88E35009E58.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/DB23E09C-E535-744C-9A18-630AFDBF3A7B.root", {215, kUL2017}},
+    {"/store/mc/RunIISummer20UL17NanoAODv9/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/NANOAODSIM/106X_mc2017_realistic_v9-v2/40000/FA83242B-35DF-CB44-A00B-2CB8DB511AD1.root", {215, kUL2017}},
+}};
+
+// DAS name of the dataset -> (sample id, year), sorted by name
+constexpr std::array<SampleEntry, 331> dataset_table = {{
+    {"/DYJetsToLL_M-10to50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {66, kUL2016APV}},
+    {"/DYJetsToLL_M-10to50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {150, kUL2016}},
+    {"/DYJetsToLL_M-10to50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {235, kUL2017}},
+    {"/DYJetsToLL_M-10to50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {320, kUL2018}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {67, kUL2016APV}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {151, kUL2016}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-20UL16JMENano_Pilot_106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {151, kUL2016}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {236, kUL2017}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {321, kUL2018}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {67, kUL2016APV}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-20UL16APVJMENano_106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {67, kUL2016APV}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-FlatPU0to75_20UL16JMENano_106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {151, kUL2016}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {236, kUL2017}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v1/NANOAODSIM", {236, kUL2017}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {321, kUL2018}},
+    {"/DYJetsToLL_M-50_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v1/NANOAODSIM", {321, kUL2018}},
+    {"/EGamma/Run2018A-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", {379, kUL2018}},
+    {"/EGamma/Run2018A-UL2018_MiniAODv2_NanoAODv9_GT36-v1/NANOAOD", {379, kUL2018}},
+    {"/EGamma/Run2018B-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", {380, kUL2018}},
+    {"/EGamma/Run2018C-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", {381, kUL2018}},
+    {"/EGamma/Run2018D-UL2018_MiniAODv2_NanoAODv9-v3/NANOAOD", {382, kUL2018}},
+    {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {43, kUL2016APV}},
+    {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv2-106X_mcRun2_asymptotic_v15-v1/NANOAODSIM", {128, kUL2016}},
+    {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {212, kUL2017}},
+    {"/GluGluHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {297, kUL2018}},
+    {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {40, kUL2016APV}},
+    {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {125, kUL2016}},
+    {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL17NanoAODv2-106X_mc2017_realistic_v8-v1/NANOAODSIM", {209, kUL2017}},
+    {"/GluGluHToWWTo2L2Nu_M125_TuneCP5_PSw_13TeV-powheg2-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", {294, kUL2018}},
+    {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {42, kUL2016APV}},
+    {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {127, kUL2016}},
+    {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {211, kUL2017}},
+    {"/GluGluHToZZTo4L_M125_TuneCP5_13TeV_powheg2_JHUGenV7011_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {296, kUL2018}},
+    {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {4, kUL2016APV}},
+    {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {89, kUL2016}},
+    {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {173, kUL2017}},
+    {"/GluGluToContinToZZTo2e2mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {258, kUL2018}},
+    {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {11, kUL2016APV}},
+    {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {96, kUL2016}},
+    {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {180, kUL2017}},
+    {"/GluGluToContinToZZTo2e2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {265, kUL2018}},
+    {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {5, kUL2016APV}},
+    {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {90, kUL2016}},
+    {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {174, kUL2017}},
+    {"/GluGluToContinToZZTo2e2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {259, kUL2018}},
+    {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {6, kUL2016APV}},
+    {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {91, kUL2016}},
+    {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {175, kUL2017}},
+    {"/GluGluToContinToZZTo2mu2nu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {260, kUL2018}},
+    {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {8, kUL2016APV}},
+    {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {93, kUL2016}},
+    {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {177, kUL2017}},
+    {"/GluGluToContinToZZTo2mu2tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {262, kUL2018}},
+    {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {3, kUL2016APV}},
+    {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {88, kUL2016}},
+    {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {172, kUL2017}},
+    {"/GluGluToContinToZZTo4e_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {257, kUL2018}},
+    {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {7, kUL2016APV}},
+    {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {92, kUL2016}},
+    {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {176, kUL2017}},
+    {"/GluGluToContinToZZTo4mu_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", {261, kUL2018}},
+    {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {10, kUL2016APV}},
+    {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {95, kUL2016}},
+    {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {179, kUL2017}},
+    {"/GluGluToContinToZZTo4tau_TuneCP5_13TeV-mcfm701-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {264, kUL2018}},
+    {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {29, kUL2016APV}},
+    {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {114, kUL2016}},
+    {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {198, kUL2017}},
+    {"/GluGluToWWToENEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {283, kUL2018}},
+    {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {30, kUL2016APV}},
+    {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {115, kUL2016}},
+    {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {199, kUL2017}},
+    {"/GluGluToWWToENMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {284, kUL2018}},
+    {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {31, kUL2016APV}},
+    {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {116, kUL2016}},
+    {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {200, kUL2017}},
+    {"/GluGluToWWToENTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {285, kUL2018}},
+    {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {32, kUL2016APV}},
+    {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {117, kUL2016}},
+    {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {201, kUL2017}},
+    {"/GluGluToWWToMNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {286, kUL2018}},
+    {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {33, kUL2016APV}},
+    {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {118, kUL2016}},
+    {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {202, kUL2017}},
+    {"/GluGluToWWToMNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {287, kUL2018}},
+    {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {34, kUL2016APV}},
+    {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {119, kUL2016}},
+    {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {203, kUL2017}},
+    {"/GluGluToWWToMNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {288, kUL2018}},
+    {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {35, kUL2016APV}},
+    {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {120, kUL2016}},
+    {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {204, kUL2017}},
+    {"/GluGluToWWToTNEN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {289, kUL2018}},
+    {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {36, kUL2016APV}},
+    {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {121, kUL2016}},
+    {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv2-106X_mc2017_realistic_v8-v1/NANOAODSIM", {205, kUL2017}},
+    {"/GluGluToWWToTNMN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {290, kUL2018}},
+    {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {37, kUL2016APV}},
+    {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {122, kUL2016}},
+    {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {206, kUL2017}},
+    {"/GluGluToWWToTNTN_TuneCP5_13TeV_MCFM701_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {291, kUL2018}},
+    {"/JetHT/Run2016B-ver1_HIPM_UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {384, kUL2016APV}},
+    {"/JetHT/Run2016B-ver2_HIPM_UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {385, kUL2016APV}},
+    {"/JetHT/Run2016C-HIPM_UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {386, kUL2016APV}},
+    {"/JetHT/Run2016D-HIPM_UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {387, kUL2016APV}},
+    {"/JetHT/Run2016E-HIPM_UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {388, kUL2016APV}},
+    {"/JetHT/Run2016F-HIPM_UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {389, kUL2016APV}},
+    {"/JetHT/Run2016F-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {391, kUL2016}},
+    {"/JetHT/Run2016G-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {392, kUL2016}},
+    {"/JetHT/Run2016H-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {393, kUL2016}},
+    {"/JetHT/Run2017B-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {395, kUL2017}},
+    {"/JetHT/Run2017C-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {396, kUL2017}},
+    {"/JetHT/Run2017D-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {397, kUL2017}},
+    {"/JetHT/Run2017E-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {398, kUL2017}},
+    {"/JetHT/Run2017F-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {399, kUL2017}},
+    {"/JetHT/Run2018A-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", {401, kUL2018}},
+    {"/JetHT/Run2018B-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", {402, kUL2018}},
+    {"/JetHT/Run2018C-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", {403, kUL2018}},
+    {"/JetHT/Run2018D-UL2018_MiniAODv1_NanoAODv2-v1/NANOAOD", {404, kUL2018}},
+    {"/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {39, kUL2016APV}},
+    {"/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {124, kUL2016}},
+    {"/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {208, kUL2017}},
+    {"/ST_tW_antitop_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {293, kUL2018}},
+    {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {38, kUL2016APV}},
+    {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {123, kUL2016}},
+    {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {207, kUL2017}},
+    {"/ST_tW_top_5f_inclusiveDecays_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {292, kUL2018}},
+    {"/SingleElectron/Run2016B-ver1_HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {362, kUL2016APV}},
+    {"/SingleElectron/Run2016B-ver2_HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {363, kUL2016APV}},
+    {"/SingleElectron/Run2016C-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {364, kUL2016APV}},
+    {"/SingleElectron/Run2016D-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {365, kUL2016APV}},
+    {"/SingleElectron/Run2016E-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {366, kUL2016APV}},
+    {"/SingleElectron/Run2016F-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {367, kUL2016APV}},
+    {"/SingleElectron/Run2016F-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {369, kUL2016}},
+    {"/SingleElectron/Run2016G-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {370, kUL2016}},
+    {"/SingleElectron/Run2016H-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {371, kUL2016}},
+    {"/SingleElectron/Run2017B-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {373, kUL2017}},
+    {"/SingleElectron/Run2017C-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {374, kUL2017}},
+    {"/SingleElectron/Run2017D-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {375, kUL2017}},
+    {"/SingleElectron/Run2017E-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {376, kUL2017}},
+    {"/SingleElectron/Run2017F-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {377, kUL2017}},
+    {"/SingleMuon/Run2016B-ver1_HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {340, kUL2016APV}},
+    {"/SingleMuon/Run2016B-ver2_HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {341, kUL2016APV}},
+    {"/SingleMuon/Run2016C-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {342, kUL2016APV}},
+    {"/SingleMuon/Run2016D-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {343, kUL2016APV}},
+    {"/SingleMuon/Run2016E-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {344, kUL2016APV}},
+    {"/SingleMuon/Run2016F-HIPM_UL2016_MiniAODv2_NanoAODv9-v2/NANOAOD", {345, kUL2016APV}},
+    {"/SingleMuon/Run2016F-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {347, kUL2016}},
+    {"/SingleMuon/Run2016G-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {348, kUL2016}},
+    {"/SingleMuon/Run2016H-UL2016_MiniAODv2_NanoAODv9-v1/NANOAOD", {349, kUL2016}},
+    {"/SingleMuon/Run2017B-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {351, kUL2017}},
+    {"/SingleMuon/Run2017C-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {352, kUL2017}},
+    {"/SingleMuon/Run2017D-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {353, kUL2017}},
+    {"/SingleMuon/Run2017E-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {354, kUL2017}},
+    {"/SingleMuon/Run2017F-UL2017_MiniAODv2_NanoAODv9-v1/NANOAOD", {355, kUL2017}},
+    {"/SingleMuon/Run2018A-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", {357, kUL2018}},
+    {"/SingleMuon/Run2018A-UL2018_MiniAODv2_NanoAODv9_GT36-v1/NANOAOD", {357, kUL2018}},
+    {"/SingleMuon/Run2018B-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", {358, kUL2018}},
+    {"/SingleMuon/Run2018B-UL2018_MiniAODv2_NanoAODv9_GT36-v1/NANOAOD", {358, kUL2018}},
+    {"/SingleMuon/Run2018C-UL2018_MiniAODv2_NanoAODv9-v2/NANOAOD", {359, kUL2018}},
+    {"/SingleMuon/Run2018C-UL2018_MiniAODv2_NanoAODv9_GT36-v1/NANOAOD", {359, kUL2018}},
+    {"/SingleMuon/Run2018D-UL2018_MiniAODv2_NanoAODv9-v1/NANOAOD", {360, kUL2018}},
+    {"/SingleMuon/Run2018D-UL2018_MiniAODv2_NanoAODv9_GT36-v1/NANOAOD", {360, kUL2018}},
+    {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {18, kUL2016APV}},
+    {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {103, kUL2016}},
+    {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {187, kUL2017}},
+    {"/TTGJets_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {272, kUL2018}},
+    {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {15, kUL2016APV}},
+    {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {100, kUL2016}},
+    {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {184, kUL2017}},
+    {"/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {269, kUL2018}},
+    {"/TTToHadronic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {14, kUL2016APV}},
+    {"/TTToHadronic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {99, kUL2016}},
+    {"/TTToHadronic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {183, kUL2017}},
+    {"/TTToHadronic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {268, kUL2018}},
+    {"/TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {13, kUL2016APV}},
+    {"/TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-20UL16JMENano_106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {98, kUL2016}},
+    {"/TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-20UL17JMENano_106X_mc2017_realistic_v9-v1/NANOAODSIM", {182, kUL2017}},
+    {"/TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-20UL18JMENano_106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {267, kUL2018}},
+    {"/TTWJetsToLNu_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {276, kUL2018}},
+    {"/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {22, kUL2016APV}},
+    {"/TTWJetsToLNu_TuneCP5down_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {191, kUL2017}},
+    {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {21, kUL2016APV}},
+    {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {106, kUL2016}},
+    {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {190, kUL2017}},
+    {"/TTWJetsToQQ_TuneCP5_13TeV-amcatnloFXFX-madspin-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {275, kUL2018}},
+    {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {20, kUL2016APV}},
+    {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {105, kUL2016}},
+    {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {189, kUL2017}},
+    {"/TTZToLLNuNu_M-10_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {274, kUL2018}},
+    {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {19, kUL2016APV}},
+    {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {104, kUL2016}},
+    {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {188, kUL2017}},
+    {"/TTZToQQ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {273, kUL2018}},
+    {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {45, kUL2016APV}},
+    {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {130, kUL2016}},
+    {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {214, kUL2017}},
+    {"/VBFHToTauTau_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {299, kUL2018}},
+    {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {44, kUL2016APV}},
+    {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {129, kUL2016}},
+    {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {213, kUL2017}},
+    {"/VBFHToWWTo2L2Nu_M-125_TuneCP5_13TeV-powheg-jhugen727-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {298, kUL2018}},
+    {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {71, kUL2016APV}},
+    {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {155, kUL2016}},
+    {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {240, kUL2017}},
+    {"/VBS_SSWW_LL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {325, kUL2018}},
+    {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {72, kUL2016APV}},
+    {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {156, kUL2016}},
+    {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {241, kUL2017}},
+    {"/VBS_SSWW_TL_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", {326, kUL2018}},
+    {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {73, kUL2016APV}},
+    {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {157, kUL2016}},
+    {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {242, kUL2017}},
+    {"/VBS_SSWW_TT_polarization_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", {327, kUL2018}},
+    {"/VBS_SSWW_cHW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {80, kUL2016APV}},
+    {"/VBS_SSWW_cHW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {164, kUL2016}},
+    {"/VBS_SSWW_cHW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {249, kUL2017}},
+    {"/VBS_SSWW_cHW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {334, kUL2018}},
+    {"/VBS_SSWW_cHW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {81, kUL2016APV}},
+    {"/VBS_SSWW_cHW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {165, kUL2016}},
+    {"/VBS_SSWW_cHW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {250, kUL2017}},
+    {"/VBS_SSWW_cHW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {335, kUL2018}},
+    {"/VBS_SSWW_cW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {76, kUL2016APV}},
+    {"/VBS_SSWW_cW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {160, kUL2016}},
+    {"/VBS_SSWW_cW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {245, kUL2017}},
+    {"/VBS_SSWW_cW_BSM_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {329, kUL2018}},
+    {"/VBS_SSWW_cW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {77, kUL2016APV}},
+    {"/VBS_SSWW_cW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {161, kUL2016}},
+    {"/VBS_SSWW_cW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {246, kUL2017}},
+    {"/VBS_SSWW_cW_INT_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {331, kUL2018}},
+    {"/VBS_SSWW_cW_cHW_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {82, kUL2016APV}},
+    {"/VBS_SSWW_cW_cHW_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {166, kUL2016}},
+    {"/VBS_SSWW_cW_cHW_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {251, kUL2017}},
+    {"/VBS_SSWW_cW_cHW_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {336, kUL2018}},
+    {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {47, kUL2016APV}},
+    {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {132, kUL2016}},
+    {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {216, kUL2017}},
+    {"/VHToNonbb_M125_TuneCP5_13TeV-amcatnloFXFX_madspin_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {301, kUL2018}},
+    {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {26, kUL2016APV}},
+    {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {111, kUL2016}},
+    {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {195, kUL2017}},
+    {"/WGToLNuG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {280, kUL2018}},
+    {"/WJetsToLNu_HT-100To200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {57, kUL2016APV}},
+    {"/WJetsToLNu_HT-100To200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {141, kUL2016}},
+    {"/WJetsToLNu_HT-100To200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {226, kUL2017}},
+    {"/WJetsToLNu_HT-100To200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", {311, kUL2018}},
+    {"/WJetsToLNu_HT-1200To2500_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {62, kUL2016APV}},
+    {"/WJetsToLNu_HT-1200To2500_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {146, kUL2016}},
+    {"/WJetsToLNu_HT-1200To2500_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {231, kUL2017}},
+    {"/WJetsToLNu_HT-1200To2500_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {316, kUL2018}},
+    {"/WJetsToLNu_HT-200To400_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {58, kUL2016APV}},
+    {"/WJetsToLNu_HT-200To400_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {142, kUL2016}},
+    {"/WJetsToLNu_HT-200To400_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {227, kUL2017}},
+    {"/WJetsToLNu_HT-200To400_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {312, kUL2018}},
+    {"/WJetsToLNu_HT-2500ToInf_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {63, kUL2016APV}},
+    {"/WJetsToLNu_HT-2500ToInf_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {147, kUL2016}},
+    {"/WJetsToLNu_HT-2500ToInf_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {232, kUL2017}},
+    {"/WJetsToLNu_HT-2500ToInf_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {317, kUL2018}},
+    {"/WJetsToLNu_HT-400To600_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {59, kUL2016APV}},
+    {"/WJetsToLNu_HT-400To600_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {143, kUL2016}},
+    {"/WJetsToLNu_HT-400To600_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {228, kUL2017}},
+    {"/WJetsToLNu_HT-400To600_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {313, kUL2018}},
+    {"/WJetsToLNu_HT-600To800_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {60, kUL2016APV}},
+    {"/WJetsToLNu_HT-600To800_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {144, kUL2016}},
+    {"/WJetsToLNu_HT-600To800_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {229, kUL2017}},
+    {"/WJetsToLNu_HT-600To800_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {314, kUL2018}},
+    {"/WJetsToLNu_HT-70To100_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {56, kUL2016APV}},
+    {"/WJetsToLNu_HT-70To100_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {140, kUL2016}},
+    {"/WJetsToLNu_HT-70To100_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {225, kUL2017}},
+    {"/WJetsToLNu_HT-70To100_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {310, kUL2018}},
+    {"/WJetsToLNu_HT-800To1200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {61, kUL2016APV}},
+    {"/WJetsToLNu_HT-800To1200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {145, kUL2016}},
+    {"/WJetsToLNu_HT-800To1200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL17NanoAODv2-106X_mc2017_realistic_v8-v1/NANOAODSIM", {230, kUL2017}},
+    {"/WJetsToLNu_HT-800To1200_TuneCP5_13TeV-madgraphMLM-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {315, kUL2018}},
+    {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {54, kUL2016APV}},
+    {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {138, kUL2016}},
+    {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {223, kUL2017}},
+    {"/WWG_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {308, kUL2018}},
+    {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {28, kUL2016APV}},
+    {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {113, kUL2016}},
+    {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {197, kUL2017}},
+    {"/WWTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {282, kUL2018}},
+    {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", {50, kUL2016APV}},
+    {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", {134, kUL2016}},
+    {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v2/NANOAODSIM", {219, kUL2017}},
+    {"/WWW_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", {304, kUL2018}},
+    {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", {51, kUL2016APV}},
+    {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", {135, kUL2016}},
+    {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {220, kUL2017}},
+    {"/WWZ_4F_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", {305, kUL2018}},
+    {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", {52, kUL2016APV}},
+    {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", {136, kUL2016}},
+    {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v2/NANOAODSIM", {221, kUL2017}},
+    {"/WZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", {306, kUL2018}},
+    {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {64, kUL2016APV}},
+    {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {148, kUL2016}},
+    {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {233, kUL2017}},
+    {"/WZ_TuneCP5_13TeV-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {318, kUL2018}},
+    {"/WpWpJJ_EWKnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {68, kUL2016APV}},
+    {"/WpWpJJ_EWKnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {152, kUL2016}},
+    {"/WpWpJJ_EWKnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {237, kUL2017}},
+    {"/WpWpJJ_EWKnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {322, kUL2018}},
+    {"/WpWpJJ_QCDnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {69, kUL2016APV}},
+    {"/WpWpJJ_QCDnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {153, kUL2016}},
+    {"/WpWpJJ_QCDnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {238, kUL2017}},
+    {"/WpWpJJ_QCDnotop_TuneCP5_13TeV-madgraph-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {323, kUL2018}},
+    {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODAPVv2-106X_mcRun2_asymptotic_preVFP_v9-v1/NANOAODSIM", {25, kUL2016APV}},
+    {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {110, kUL2016}},
+    {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {194, kUL2017}},
+    {"/ZGToLLG_01J_5f_TuneCP5_13TeV-amcatnloFXFX-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {279, kUL2018}},
+    {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {1, kUL2016APV}},
+    {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {86, kUL2016}},
+    {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODv9-20UL16JMENano_106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {86, kUL2016}},
+    {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {170, kUL2017}},
+    {"/ZZTo2L2Nu_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {255, kUL2018}},
+    {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {2, kUL2016APV}},
+    {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {87, kUL2016}},
+    {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {171, kUL2017}},
+    {"/ZZTo4L_M-1toInf_TuneCP5_13TeV_powheg_pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v1/NANOAODSIM", {256, kUL2018}},
+    {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11_ext1-v1/NANOAODSIM", {53, kUL2016APV}},
+    {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17_ext1-v1/NANOAODSIM", {137, kUL2016}},
+    {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9_ext1-v2/NANOAODSIM", {222, kUL2017}},
+    {"/ZZZ_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1_ext1-v2/NANOAODSIM", {307, kUL2018}},
+    {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v1/NANOAODSIM", {23, kUL2016APV}},
+    {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v1/NANOAODSIM", {108, kUL2016}},
+    {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v1/NANOAODSIM", {192, kUL2017}},
+    {"/tZq_ll_4f_ckm_NLO_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18NanoAODv2-106X_upgrade2018_realistic_v15_L1v1-v1/NANOAODSIM", {277, kUL2018}},
+    {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODAPVv9-106X_mcRun2_asymptotic_preVFP_v11-v2/NANOAODSIM", {46, kUL2016APV}},
+    {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL16NanoAODv9-106X_mcRun2_asymptotic_v17-v2/NANOAODSIM", {131, kUL2016}},
+    {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL17NanoAODv9-106X_mc2017_realistic_v9-v2/NANOAODSIM", {215, kUL2017}},
+    {"/ttHToNonbb_M125_TuneCP5_13TeV-powheg-pythia8/RunIISummer20UL18NanoAODv9-106X_upgrade2018_realistic_v16_L1v1-v2/NANOAODSIM", {300, kUL2018}},
+}};
+
+// binary search of a name in one of the tables, nullptr when it is not there
+template <std::size_t N>
+const SampleInfo *FindSampleInfo(const std::array<SampleEntry, N> &table, std::string_view name){
+    auto it = std::lower_bound(table.begin(), table.end(), name, [](const SampleEntry &entry, std::string_view key){ return entry.name < key; });
+    return it != table.end() && it->name == name ? &it->info : nullptr;
+}
+
+#endif
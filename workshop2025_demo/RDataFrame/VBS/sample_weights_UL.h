@@ -0,0 +1,1251 @@
+// Generated by make_sample_table.py from samplesUL.json and sample_ids.py: do not edit.
+
+#ifndef SAMPLE_WEIGHTS_H
+#define SAMPLE_WEIGHTS_H
+
+#include <array>
+
+enum SampleKind { kMC, kDataMu, kDataEle, kDataHT };
+
+constexpr int kNSamples = 409;
+
+// sample id -> cross section [pb]
+constexpr std::array<float, kNSamples> sample_xsec = {{
+    0.0f, // 0
+    0.564f, // 1
+    13.74f, // 2
+    0.001586f, // 3
+    0.003194f, // 4
+    0.003194f, // 5
+    0.003194f, // 6
+    0.001586f, // 7
+    0.003194f, // 8
+    0.0f, // 9
+    0.001586f, // 10
+    0.003194f, // 11
+    0.0f, // 12
+    0.0f, // 13
+    0.0f, // 14
+    72.1f, // 15
+    0.0f, // 16
+    0.0f, // 17
+    3.697f, // 18
+    0.5297f, // 19
+    0.2529f, // 20
+    0.4062f, // 21
+    0.216f, // 22
+    0.0758f, // 23
+    0.0f, // 24
+    51.1f, // 25
+    191.3f, // 26
+    0.0f, // 27
+    12.178f, // 28
+    0.014193333333333334f, // 29
+    0.007096666666666667f, // 30
+    0.007096666666666667f, // 31
+    0.007096666666666667f, // 32
+    0.014193333333333334f, // 33
+    0.007096666666666667f, // 34
+    0.007096666666666667f, // 35
+    0.007096666666666667f, // 36
+    0.014193333333333334f, // 37
+    35.85f, // 38
+    0.0f, // 39
+    1.0315f, // 40
+    0.0f, // 41
+    0.0118f, // 42
+    2.7757f, // 43
+    0.0896f, // 44
+    0.237f, // 45
+    0.212f, // 46
+    0.952f, // 47
+    0.0f, // 48
+    0.0f, // 49
+    0.2086f, // 50
+    0.1651f, // 51
+    0.05565f, // 52
+    0.01398f, // 53
+    0.2147f, // 54
+    0.0f, // 55
+    0.0f, // 56
+    0.0f, // 57
+    0.0f, // 58
+    0.0f, // 59
+    0.0f, // 60
+    0.0f, // 61
+    0.0f, // 62
+    0.0f, // 63
+    27.59f, // 64
+    0.0f, // 65
+    0.0f, // 66
+    7181.0f, // 67
+    0.0f, // 68
+    0.0f, // 69
+    0.0f, // 70
+    0.002014f, // 71
+    0.01036f, // 72
+    0.01595f, // 73
+    0.0f, // 74
+    0.0f, // 75
+    0.0f, // 76
+    0.0f, // 77
+    0.0f, // 78
+    0.0f, // 79
+    0.0f, // 80
+    0.0f, // 81
+    0.0f, // 82
+    0.0f, // 83
+    0.0f, // 84
+    0.0f, // 85
+    0.9738f, // 86
+    13.74f, // 87
+    0.001586f, // 88
+    0.003194f, // 89
+    0.003194f, // 90
+    0.003194f, // 91
+    0.001586f, // 92
+    0.003194f, // 93
+    0.0f, // 94
+    0.001586f, // 95
+    0.003194f, // 96
+    0.0f, // 97
+    0.0f, // 98
+    0.0f, // 99
+    72.1f, // 100
+    0.0f, // 101
+    0.0f, // 102
+    3.697f, // 103
+    0.5297f, // 104
+    0.2529f, // 105
+    0.4062f, // 106
+    0.216f, // 107
+    0.0758f, // 108
+    0.0f, // 109
+    51.1f, // 110
+    191.3f, // 111
+    0.0f, // 112
+    12.178f, // 113
+    0.014193333333333334f, // 114
+    0.007096666666666667f, // 115
+    0.007096666666666667f, // 116
+    0.007096666666666667f, // 117
+    0.014193333333333334f, // 118
+    0.007096666666666667f, // 119
+    0.007096666666666667f, // 120
+    0.007096666666666667f, // 121
+    0.014193333333333334f, // 122
+    35.85f, // 123
+    0.0f, // 124
+    1.0315f, // 125
+    0.0f, // 126
+    0.0118f, // 127
+    2.7757f, // 128
+    0.0896f, // 129
+    0.237f, // 130
+    0.212f, // 131
+    0.952f, // 132
+    0.0f, // 133
+    0.2086f, // 134
+    0.1651f, // 135
+    0.05565f, // 136
+    0.01398f, // 137
+    0.2147f, // 138
+    0.0f, // 139
+    0.0f, // 140
+    0.0f, // 141
+    0.0f, // 142
+    0.0f, // 143
+    0.0f, // 144
+    0.0f, // 145
+    0.0f, // 146
+    0.0f, // 147
+    27.59f, // 148
+    0.0f, // 149
+    0.0f, // 150
+    7181.0f, // 151
+    0.0f, // 152
+    0.0f, // 153
+    0.0f, // 154
+    0.002014f, // 155
+    0.01036f, // 156
+    0.01595f, // 157
+    0.0f, // 158
+    0.0f, // 159
+    0.0f, // 160
+    0.0f, // 161
+    0.0f, // 162
+    0.0f, // 163
+    0.0f, // 164
+    0.0f, // 165
+    0.0f, // 166
+    0.0f, // 167
+    0.0f, // 168
+    0.0f, // 169
+    0.9738f, // 170
+    13.74f, // 171
+    0.001586f, // 172
+    0.003194f, // 173
+    0.003194f, // 174
+    0.003194f, // 175
+    0.001586f, // 176
+    0.003194f, // 177
+    0.0f, // 178
+    0.001586f, // 179
+    0.003194f, // 180
+    0.0f, // 181
+    0.0f, // 182
+    0.0f, // 183
+    72.1f, // 184
+    0.0f, // 185
+    0.0f, // 186
+    3.697f, // 187
+    0.5297f, // 188
+    0.2529f, // 189
+    0.4062f, // 190
+    0.216f, // 191
+    0.0758f, // 192
+    0.0f, // 193
+    51.1f, // 194
+    191.3f, // 195
+    0.0f, // 196
+    12.178f, // 197
+    0.014193333333333334f, // 198
+    0.007096666666666667f, // 199
+    0.007096666666666667f, // 200
+    0.007096666666666667f, // 201
+    0.014193333333333334f, // 202
+    0.007096666666666667f, // 203
+    0.007096666666666667f, // 204
+    0.007096666666666667f, // 205
+    0.014193333333333334f, // 206
+    35.85f, // 207
+    35.85f, // 208
+    1.0315f, // 209
+    0.0f, // 210
+    0.0118f, // 211
+    2.7757f, // 212
+    0.0896f, // 213
+    0.237f, // 214
+    0.212f, // 215
+    0.952f, // 216
+    0.0f, // 217
+    0.0f, // 218
+    0.2086f, // 219
+    0.1651f, // 220
+    0.05565f, // 221
+    0.01398f, // 222
+    0.2147f, // 223
+    0.0f, // 224
+    0.0f, // 225
+    0.0f, // 226
+    0.0f, // 227
+    0.0f, // 228
+    0.0f, // 229
+    0.0f, // 230
+    0.0f, // 231
+    0.0f, // 232
+    27.59f, // 233
+    0.0f, // 234
+    0.0f, // 235
+    7181.0f, // 236
+    0.0f, // 237
+    0.0f, // 238
+    0.0f, // 239
+    0.002014f, // 240
+    0.01036f, // 241
+    0.01595f, // 242
+    0.0f, // 243
+    0.0f, // 244
+    0.0f, // 245
+    0.0f, // 246
+    0.0f, // 247
+    0.0f, // 248
+    0.0f, // 249
+    0.0f, // 250
+    0.0f, // 251
+    0.0f, // 252
+    0.0f, // 253
+    0.0f, // 254
+    0.9738f, // 255
+    13.74f, // 256
+    0.001586f, // 257
+    0.003194f, // 258
+    0.003194f, // 259
+    0.003194f, // 260
+    0.001586f, // 261
+    0.003194f, // 262
+    0.0f, // 263
+    0.001586f, // 264
+    0.003194f, // 265
+    0.0f, // 266
+    0.0f, // 267
+    0.0f, // 268
+    72.1f, // 269
+    0.0f, // 270
+    0.0f, // 271
+    3.697f, // 272
+    0.5297f, // 273
+    0.2529f, // 274
+    0.4062f, // 275
+    0.216f, // 276
+    0.0758f, // 277
+    0.0f, // 278
+    51.1f, // 279
+    191.3f, // 280
+    0.0f, // 281
+    12.178f, // 282
+    0.014193333333333334f, // 283
+    0.007096666666666667f, // 284
+    0.007096666666666667f, // 285
+    0.007096666666666667f, // 286
+    0.014193333333333334f, // 287
+    0.007096666666666667f, // 288
+    0.007096666666666667f, // 289
+    0.007096666666666667f, // 290
+    0.014193333333333334f, // 291
+    35.85f, // 292
+    0.0f, // 293
+    1.0315f, // 294
+    0.0f, // 295
+    0.0118f, // 296
+    2.7757f, // 297
+    0.0896f, // 298
+    0.237f, // 299
+    0.212f, // 300
+    0.952f, // 301
+    0.0f, // 302
+    0.0f, // 303
+    0.2086f, // 304
+    0.1651f, // 305
+    0.05565f, // 306
+    0.01398f, // 307
+    0.2147f, // 308
+    0.0f, // 309
+    0.0f, // 310
+    0.0f, // 311
+    0.0f, // 312
+    0.0f, // 313
+    0.0f, // 314
+    0.0f, // 315
+    0.0f, // 316
+    0.0f, // 317
+    27.59f, // 318
+    0.0f, // 319
+    0.0f, // 320
+    7181.0f, // 321
+    0.0f, // 322
+    0.0f, // 323
+    0.0f, // 324
+    0.002014f, // 325
+    0.01036f, // 326
+    0.01595f, // 327
+    0.0f, // 328
+    0.0f, // 329
+    0.0f, // 330
+    0.0f, // 331
+    0.0f, // 332
+    0.0f, // 333
+    0.0f, // 334
+    0.0f, // 335
+    0.0f, // 336
+    0.0f, // 337
+    0.0f, // 338
+    1.0f, // 339
+    1.0f, // 340
+    1.0f, // 341
+    1.0f, // 342
+    1.0f, // 343
+    1.0f, // 344
+    1.0f, // 345
+    1.0f, // 346
+    1.0f, // 347
+    1.0f, // 348
+    1.0f, // 349
+    1.0f, // 350
+    1.0f, // 351
+    1.0f, // 352
+    1.0f, // 353
+    1.0f, // 354
+    1.0f, // 355
+    1.0f, // 356
+    1.0f, // 357
+    1.0f, // 358
+    1.0f, // 359
+    1.0f, // 360
+    1.0f, // 361
+    1.0f, // 362
+    1.0f, // 363
+    1.0f, // 364
+    1.0f, // 365
+    1.0f, // 366
+    1.0f, // 367
+    1.0f, // 368
+    1.0f, // 369
+    1.0f, // 370
+    1.0f, // 371
+    1.0f, // 372
+    1.0f, // 373
+    1.0f, // 374
+    1.0f, // 375
+    1.0f, // 376
+    1.0f, // 377
+    1.0f, // 378
+    1.0f, // 379
+    1.0f, // 380
+    1.0f, // 381
+    1.0f, // 382
+    1.0f, // 383
+    1.0f, // 384
+    1.0f, // 385
+    1.0f, // 386
+    1.0f, // 387
+    1.0f, // 388
+    1.0f, // 389
+    1.0f, // 390
+    1.0f, // 391
+    1.0f, // 392
+    1.0f, // 393
+    1.0f, // 394
+    1.0f, // 395
+    1.0f, // 396
+    1.0f, // 397
+    1.0f, // 398
+    1.0f, // 399
+    1.0f, // 400
+    1.0f, // 401
+    1.0f, // 402
+    1.0f, // 403
+    1.0f, // 404
+    0.0f, // 405
+    0.0f, // 406
+    0.0f, // 407
+    0.0f, // 408
+}};
+
+// sample id -> generated events
+constexpr std::array<float, kNSamples> sample_nevents = {{
+    0.0f, // 0
+    16862000.0f, // 1
+    19622315.0f, // 2
+    972000.0f, // 3
+    500000.0f, // 4
+    500000.0f, // 5
+    500000.0f, // 6
+    927966.0f, // 7
+    500000.0f, // 8
+    0.0f, // 9
+    497032.0f, // 10
+    500000.0f, // 11
+    0.0f, // 12
+    0.0f, // 13
+    0.0f, // 14
+    37505000.0f, // 15
+    0.0f, // 16
+    0.0f, // 17
+    1511805.0f, // 18
+    6277000.0f, // 19
+    5792000.0f, // 20
+    308442.0f, // 21
+    1264826.0f, // 22
+    3723000.0f, // 23
+    0.0f, // 24
+    27805647.0f, // 25
+    53848477.0f, // 26
+    0.0f, // 27
+    3018000.0f, // 28
+    1994000.0f, // 29
+    1991000.0f, // 30
+    1906000.0f, // 31
+    1997000.0f, // 32
+    1953000.0f, // 33
+    1914000.0f, // 34
+    1958000.0f, // 35
+    1994000.0f, // 36
+    1956000.0f, // 37
+    2300000.0f, // 38
+    0.0f, // 39
+    4666982.0f, // 40
+    0.0f, // 41
+    1000000.0f, // 42
+    6134000.0f, // 43
+    2204000.0f, // 44
+    1452000.0f, // 45
+    1977996.0f, // 46
+    440780.0f, // 47
+    0.0f, // 48
+    0.0f, // 49
+    5190000.0f, // 50
+    5072000.0f, // 51
+    5394000.0f, // 52
+    5302000.0f, // 53
+    800000.0f, // 54
+    0.0f, // 55
+    0.0f, // 56
+    0.0f, // 57
+    0.0f, // 58
+    0.0f, // 59
+    0.0f, // 60
+    0.0f, // 61
+    0.0f, // 62
+    0.0f, // 63
+    7934000.0f, // 64
+    0.0f, // 65
+    0.0f, // 66
+    90947213.0f, // 67
+    0.0f, // 68
+    0.0f, // 69
+    0.0f, // 70
+    1921000.0f, // 71
+    1983000.0f, // 72
+    1994000.0f, // 73
+    0.0f, // 74
+    0.0f, // 75
+    0.0f, // 76
+    0.0f, // 77
+    0.0f, // 78
+    0.0f, // 79
+    0.0f, // 80
+    0.0f, // 81
+    0.0f, // 82
+    0.0f, // 83
+    0.0f, // 84
+    0.0f, // 85
+    15928000.0f, // 86
+    15890000.0f, // 87
+    992608.0f, // 88
+    499000.0f, // 89
+    500000.0f, // 90
+    493000.0f, // 91
+    997445.0f, // 92
+    500000.0f, // 93
+    0.0f, // 94
+    499183.0f, // 95
+    500000.0f, // 96
+    0.0f, // 97
+    0.0f, // 98
+    0.0f, // 99
+    43546000.0f, // 100
+    0.0f, // 101
+    0.0f, // 102
+    1416230.0f, // 103
+    5401000.0f, // 104
+    6017000.0f, // 105
+    308983.0f, // 106
+    1264826.0f, // 107
+    3967000.0f, // 108
+    0.0f, // 109
+    31562465.0f, // 110
+    55939475.0f, // 111
+    0.0f, // 112
+    2900000.0f, // 113
+    1959000.0f, // 114
+    1927000.0f, // 115
+    1982000.0f, // 116
+    1991000.0f, // 117
+    1984000.0f, // 118
+    1859000.0f, // 119
+    1996000.0f, // 120
+    1973000.0f, // 121
+    1991000.0f, // 122
+    2491000.0f, // 123
+    0.0f, // 124
+    4882983.0f, // 125
+    0.0f, // 126
+    1000000.0f, // 127
+    6443000.0f, // 128
+    2893000.0f, // 129
+    1500000.0f, // 130
+    2240994.0f, // 131
+    330462.0f, // 132
+    0.0f, // 133
+    4159000.0f, // 134
+    4595000.0f, // 135
+    4554000.0f, // 136
+    4534000.0f, // 137
+    698000.0f, // 138
+    0.0f, // 139
+    0.0f, // 140
+    0.0f, // 141
+    0.0f, // 142
+    0.0f, // 143
+    0.0f, // 144
+    0.0f, // 145
+    0.0f, // 146
+    0.0f, // 147
+    7584000.0f, // 148
+    0.0f, // 149
+    0.0f, // 150
+    71839442.0f, // 151
+    0.0f, // 152
+    0.0f, // 153
+    0.0f, // 154
+    1926000.0f, // 155
+    1956000.0f, // 156
+    1953000.0f, // 157
+    0.0f, // 158
+    0.0f, // 159
+    0.0f, // 160
+    0.0f, // 161
+    0.0f, // 162
+    0.0f, // 163
+    0.0f, // 164
+    0.0f, // 165
+    0.0f, // 166
+    0.0f, // 167
+    0.0f, // 168
+    0.0f, // 169
+    40839000.0f, // 170
+    41708429.0f, // 171
+    997000.0f, // 172
+    500000.0f, // 173
+    498000.0f, // 174
+    500000.0f, // 175
+    975090.0f, // 176
+    500000.0f, // 177
+    0.0f, // 178
+    499000.0f, // 179
+    497000.0f, // 180
+    0.0f, // 181
+    0.0f, // 182
+    0.0f, // 183
+    106724000.0f, // 184
+    0.0f, // 185
+    0.0f, // 186
+    3534208.0f, // 187
+    13822000.0f, // 188
+    14036000.0f, // 189
+    655018.0f, // 190
+    2891483.0f, // 191
+    9530000.0f, // 192
+    0.0f, // 193
+    29890946.0f, // 194
+    60212926.0f, // 195
+    0.0f, // 196
+    7098000.0f, // 197
+    3780000.0f, // 198
+    3876000.0f, // 199
+    3998000.0f, // 200
+    3962000.0f, // 201
+    3978000.0f, // 202
+    3985000.0f, // 203
+    3840000.0f, // 204
+    3984000.0f, // 205
+    1910000.0f, // 206
+    5649000.0f, // 207
+    5674000.0f, // 208
+    6828983.0f, // 209
+    0.0f, // 210
+    998000.0f, // 211
+    12974000.0f, // 212
+    6440000.0f, // 213
+    2811630.0f, // 214
+    5070989.0f, // 215
+    869559.0f, // 216
+    0.0f, // 217
+    0.0f, // 218
+    9854000.0f, // 219
+    178000.0f, // 220
+    9898000.0f, // 221
+    9524000.0f, // 222
+    1736000.0f, // 223
+    0.0f, // 224
+    0.0f, // 225
+    0.0f, // 226
+    0.0f, // 227
+    0.0f, // 228
+    0.0f, // 229
+    0.0f, // 230
+    0.0f, // 231
+    0.0f, // 232
+    7889000.0f, // 233
+    0.0f, // 234
+    0.0f, // 235
+    195529774.0f, // 236
+    0.0f, // 237
+    0.0f, // 238
+    0.0f, // 239
+    1978000.0f, // 240
+    1952000.0f, // 241
+    1902000.0f, // 242
+    0.0f, // 243
+    0.0f, // 244
+    0.0f, // 245
+    0.0f, // 246
+    0.0f, // 247
+    0.0f, // 248
+    0.0f, // 249
+    0.0f, // 250
+    0.0f, // 251
+    0.0f, // 252
+    0.0f, // 253
+    0.0f, // 254
+    56886000.0f, // 255
+    64107525.0f, // 256
+    974000.0f, // 257
+    500000.0f, // 258
+    500000.0f, // 259
+    500000.0f, // 260
+    994626.0f, // 261
+    496000.0f, // 262
+    0.0f, // 263
+    493998.0f, // 264
+    500000.0f, // 265
+    0.0f, // 266
+    0.0f, // 267
+    0.0f, // 268
+    145020000.0f, // 269
+    0.0f, // 270
+    0.0f, // 271
+    4437068.0f, // 272
+    19816000.0f, // 273
+    19608000.0f, // 274
+    970179.0f, // 275
+    10450000.0f, // 276
+    14000000.0f, // 277
+    0.0f, // 278
+    29919798.0f, // 279
+    61613294.0f, // 280
+    0.0f, // 281
+    9994000.0f, // 282
+    4904000.0f, // 283
+    4928000.0f, // 284
+    4784000.0f, // 285
+    4998000.0f, // 286
+    4986000.0f, // 287
+    4864000.0f, // 288
+    4948000.0f, // 289
+    4958000.0f, // 290
+    4678000.0f, // 291
+    7956000.0f, // 292
+    0.0f, // 293
+    9865972.0f, // 294
+    0.0f, // 295
+    940000.0f, // 296
+    12966000.0f, // 297
+    9492608.0f, // 298
+    2987000.0f, // 299
+    7328993.0f, // 300
+    1208288.0f, // 301
+    0.0f, // 302
+    0.0f, // 303
+    9894000.0f, // 304
+    9961999.0f, // 305
+    9994000.0f, // 306
+    9889000.0f, // 307
+    2500000.0f, // 308
+    0.0f, // 309
+    0.0f, // 310
+    0.0f, // 311
+    0.0f, // 312
+    0.0f, // 313
+    0.0f, // 314
+    0.0f, // 315
+    0.0f, // 316
+    0.0f, // 317
+    7940000.0f, // 318
+    0.0f, // 319
+    0.0f, // 320
+    195510810.0f, // 321
+    0.0f, // 322
+    0.0f, // 323
+    0.0f, // 324
+    1927000.0f, // 325
+    1939000.0f, // 326
+    1930000.0f, // 327
+    0.0f, // 328
+    0.0f, // 329
+    0.0f, // 330
+    0.0f, // 331
+    0.0f, // 332
+    0.0f, // 333
+    0.0f, // 334
+    0.0f, // 335
+    0.0f, // 336
+    0.0f, // 337
+    0.0f, // 338
+    1.0f, // 339
+    1.0f, // 340
+    1.0f, // 341
+    1.0f, // 342
+    1.0f, // 343
+    1.0f, // 344
+    1.0f, // 345
+    1.0f, // 346
+    1.0f, // 347
+    1.0f, // 348
+    1.0f, // 349
+    1.0f, // 350
+    1.0f, // 351
+    1.0f, // 352
+    1.0f, // 353
+    1.0f, // 354
+    1.0f, // 355
+    1.0f, // 356
+    1.0f, // 357
+    1.0f, // 358
+    1.0f, // 359
+    1.0f, // 360
+    1.0f, // 361
+    1.0f, // 362
+    1.0f, // 363
+    1.0f, // 364
+    1.0f, // 365
+    1.0f, // 366
+    1.0f, // 367
+    1.0f, // 368
+    1.0f, // 369
+    1.0f, // 370
+    1.0f, // 371
+    1.0f, // 372
+    1.0f, // 373
+    1.0f, // 374
+    1.0f, // 375
+    1.0f, // 376
+    1.0f, // 377
+    1.0f, // 378
+    1.0f, // 379
+    1.0f, // 380
+    1.0f, // 381
+    1.0f, // 382
+    1.0f, // 383
+    1.0f, // 384
+    1.0f, // 385
+    1.0f, // 386
+    1.0f, // 387
+    1.0f, // 388
+    1.0f, // 389
+    1.0f, // 390
+    1.0f, // 391
+    1.0f, // 392
+    1.0f, // 393
+    1.0f, // 394
+    1.0f, // 395
+    1.0f, // 396
+    1.0f, // 397
+    1.0f, // 398
+    1.0f, // 399
+    1.0f, // 400
+    1.0f, // 401
+    1.0f, // 402
+    1.0f, // 403
+    1.0f, // 404
+    0.0f, // 405
+    0.0f, // 406
+    0.0f, // 407
+    0.0f, // 408
+}};
+
+// sample id -> kind
+constexpr std::array<SampleKind, kNSamples> sample_kind = {{
+    kMC, // 0
+    kMC, // 1
+    kMC, // 2
+    kMC, // 3
+    kMC, // 4
+    kMC, // 5
+    kMC, // 6
+    kMC, // 7
+    kMC, // 8
+    kMC, // 9
+    kMC, // 10
+    kMC, // 11
+    kMC, // 12
+    kMC, // 13
+    kMC, // 14
+    kMC, // 15
+    kMC, // 16
+    kMC, // 17
+    kMC, // 18
+    kMC, // 19
+    kMC, // 20
+    kMC, // 21
+    kMC, // 22
+    kMC, // 23
+    kMC, // 24
+    kMC, // 25
+    kMC, // 26
+    kMC, // 27
+    kMC, // 28
+    kMC, // 29
+    kMC, // 30
+    kMC, // 31
+    kMC, // 32
+    kMC, // 33
+    kMC, // 34
+    kMC, // 35
+    kMC, // 36
+    kMC, // 37
+    kMC, // 38
+    kMC, // 39
+    kMC, // 40
+    kMC, // 41
+    kMC, // 42
+    kMC, // 43
+    kMC, // 44
+    kMC, // 45
+    kMC, // 46
+    kMC, // 47
+    kMC, // 48
+    kMC, // 49
+    kMC, // 50
+    kMC, // 51
+    kMC, // 52
+    kMC, // 53
+    kMC, // 54
+    kMC, // 55
+    kMC, // 56
+    kMC, // 57
+    kMC, // 58
+    kMC, // 59
+    kMC, // 60
+    kMC, // 61
+    kMC, // 62
+    kMC, // 63
+    kMC, // 64
+    kMC, // 65
+    kMC, // 66
+    kMC, // 67
+    kMC, // 68
+    kMC, // 69
+    kMC, // 70
+    kMC, // 71
+    kMC, // 72
+    kMC, // 73
+    kMC, // 74
+    kMC, // 75
+    kMC, // 76
+    kMC, // 77
+    kMC, // 78
+    kMC, // 79
+    kMC, // 80
+    kMC, // 81
+    kMC, // 82
+    kMC, // 83
+    kMC, // 84
+    kMC, // 85
+    kMC, // 86
+    kMC, // 87
+    kMC, // 88
+    kMC, // 89
+    kMC, // 90
+    kMC, // 91
+    kMC, // 92
+    kMC, // 93
+    kMC, // 94
+    kMC, // 95
+    kMC, // 96
+    kMC, // 97
+    kMC, // 98
+    kMC, // 99
+    kMC, // 100
+    kMC, // 101
+    kMC, // 102
+    kMC, // 103
+    kMC, // 104
+    kMC, // 105
+    kMC, // 106
+    kMC, // 107
+    kMC, // 108
+    kMC, // 109
+    kMC, // 110
+    kMC, // 111
+    kMC, // 112
+    kMC, // 113
+    kMC, // 114
+    kMC, // 115
+    kMC, // 116
+    kMC, // 117
+    kMC, // 118
+    kMC, // 119
+    kMC, // 120
+    kMC, // 121
+    kMC, // 122
+    kMC, // 123
+    kMC, // 124
+    kMC, // 125
+    kMC, // 126
+    kMC, // 127
+    kMC, // 128
+    kMC, // 129
+    kMC, // 130
+    kMC, // 131
+    kMC, // 132
+    kMC, // 133
+    kMC, // 134
+    kMC, // 135
+    kMC, // 136
+    kMC, // 137
+    kMC, // 138
+    kMC, // 139
+    kMC, // 140
+    kMC, // 141
+    kMC, // 142
+    kMC, // 143
+    kMC, // 144
+    kMC, // 145
+    kMC, // 146
+    kMC, // 147
+    kMC, // 148
+    kMC, // 149
+    kMC, // 150
+    kMC, // 151
+    kMC, // 152
+    kMC, // 153
+    kMC, // 154
+    kMC, // 155
+    kMC, // 156
+    kMC, // 157
+    kMC, // 158
+    kMC, // 159
+    kMC, // 160
+    kMC, // 161
+    kMC, // 162
+    kMC, // 163
+    kMC, // 164
+    kMC, // 165
+    kMC, // 166
+    kMC, // 167
+    kMC, // 168
+    kMC, // 169
+    kMC, // 170
+    kMC, // 171
+    kMC, // 172
+    kMC, // 173
+    kMC, // 174
+    kMC, // 175
+    kMC, // 176
+    kMC, // 177
+    kMC, // 178
+    kMC, // 179
+    kMC, // 180
+    kMC, // 181
+    kMC, // 182
+    kMC, // 183
+    kMC, // 184
+    kMC, // 185
+    kMC, // 186
+    kMC, // 187
+    kMC, // 188
+    kMC, // 189
+    kMC, // 190
+    kMC, // 191
+    kMC, // 192
+    kMC, // 193
+    kMC, // 194
+    kMC, // 195
+    kMC, // 196
+    kMC, // 197
+    kMC, // 198
+    kMC, // 199
+    kMC, // 200
+    kMC, // 201
+    kMC, // 202
+    kMC, // 203
+    kMC, // 204
+    kMC, // 205
+    kMC, // 206
+    kMC, // 207
+    kMC, // 208
+    kMC, // 209
+    kMC, // 210
+    kMC, // 211
+    kMC, // 212
+    kMC, // 213
+    kMC, // 214
+    kMC, // 215
+    kMC, // 216
+    kMC, // 217
+    kMC, // 218
+    kMC, // 219
+    kMC, // 220
+    kMC, // 221
+    kMC, // 222
+    kMC, // 223
+    kMC, // 224
+    kMC, // 225
+    kMC, // 226
+    kMC, // 227
+    kMC, // 228
+    kMC, // 229
+    kMC, // 230
+    kMC, // 231
+    kMC, // 232
+    kMC, // 233
+    kMC, // 234
+    kMC, // 235
+    kMC, // 236
+    kMC, // 237
+    kMC, // 238
+    kMC, // 239
+    kMC, // 240
+    kMC, // 241
+    kMC, // 242
+    kMC, // 243
+    kMC, // 244
+    kMC, // 245
+    kMC, // 246
+    kMC, // 247
+    kMC, // 248
+    kMC, // 249
+    kMC, // 250
+    kMC, // 251
+    kMC, // 252
+    kMC, // 253
+    kMC, // 254
+    kMC, // 255
+    kMC, // 256
+    kMC, // 257
+    kMC, // 258
+    kMC, // 259
+    kMC, // 260
+    kMC, // 261
+    kMC, // 262
+    kMC, // 263
+    kMC, // 264
+    kMC, // 265
+    kMC, // 266
+    kMC, // 267
+    kMC, // 268
+    kMC, // 269
+    kMC, // 270
+    kMC, // 271
+    kMC, // 272
+    kMC, // 273
+    kMC, // 274
+    kMC, // 275
+    kMC, // 276
+    kMC, // 277
+    kMC, // 278
+    kMC, // 279
+    kMC, // 280
+    kMC, // 281
+    kMC, // 282
+    kMC, // 283
+    kMC, // 284
+    kMC, // 285
+    kMC, // 286
+    kMC, // 287
+    kMC, // 288
+    kMC, // 289
+    kMC, // 290
+    kMC, // 291
+    kMC, // 292
+    kMC, // 293
+    kMC, // 294
+    kMC, // 295
+    kMC, // 296
+    kMC, // 297
+    kMC, // 298
+    kMC, // 299
+    kMC, // 300
+    kMC, // 301
+    kMC, // 302
+    kMC, // 303
+    kMC, // 304
+    kMC, // 305
+    kMC, // 306
+    kMC, // 307
+    kMC, // 308
+    kMC, // 309
+    kMC, // 310
+    kMC, // 311
+    kMC, // 312
+    kMC, // 313
+    kMC, // 314
+    kMC, // 315
+    kMC, // 316
+    kMC, // 317
+    kMC, // 318
+    kMC, // 319
+    kMC, // 320
+    kMC, // 321
+    kMC, // 322
+    kMC, // 323
+    kMC, // 324
+    kMC, // 325
+    kMC, // 326
+    kMC, // 327
+    kMC, // 328
+    kMC, // 329
+    kMC, // 330
+    kMC, // 331
+    kMC, // 332
+    kMC, // 333
+    kMC, // 334
+    kMC, // 335
+    kMC, // 336
+    kMC, // 337
+    kMC, // 338
+    kDataMu, // 339
+    kDataMu, // 340
+    kDataMu, // 341
+    kDataMu, // 342
+    kDataMu, // 343
+    kDataMu, // 344
+    kDataMu, // 345
+    kDataMu, // 346
+    kDataMu, // 347
+    kDataMu, // 348
+    kDataMu, // 349
+    kDataMu, // 350
+    kDataMu, // 351
+    kDataMu, // 352
+    kDataMu, // 353
+    kDataMu, // 354
+    kDataMu, // 355
+    kDataMu, // 356
+    kDataMu, // 357
+    kDataMu, // 358
+    kDataMu, // 359
+    kDataMu, // 360
+    kDataEle, // 361
+    kDataEle, // 362
+    kDataEle, // 363
+    kDataEle, // 364
+    kDataEle, // 365
+    kDataEle, // 366
+    kDataEle, // 367
+    kDataEle, // 368
+    kDataEle, // 369
+    kDataEle, // 370
+    kDataEle, // 371
+    kDataEle, // 372
+    kDataEle, // 373
+    kDataEle, // 374
+    kDataEle, // 375
+    kDataEle, // 376
+    kDataEle, // 377
+    kDataEle, // 378
+    kDataEle, // 379
+    kDataEle, // 380
+    kDataEle, // 381
+    kDataEle, // 382
+    kDataHT, // 383
+    kDataHT, // 384
+    kDataHT, // 385
+    kDataHT, // 386
+    kDataHT, // 387
+    kDataHT, // 388
+    kDataHT, // 389
+    kDataHT, // 390
+    kDataHT, // 391
+    kDataHT, // 392
+    kDataHT, // 393
+    kDataHT, // 394
+    kDataHT, // 395
+    kDataHT, // 396
+    kDataHT, // 397
+    kDataHT, // 398
+    kDataHT, // 399
+    kDataHT, // 400
+    kDataHT, // 401
+    kDataHT, // 402
+    kDataHT, // 403
+    kDataHT, // 404
+    kMC, // 405
+    kMC, // 406
+    kMC, // 407
+    kMC, // 408
+}};
+
+#endif
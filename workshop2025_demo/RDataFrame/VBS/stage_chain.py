@@ -0,0 +1,133 @@
+#!/opt/conda/bin/python3
+
+# Copy the files of a chain txt file to a storage tier, in place of the
+# mover_*.sh scripts.
+#
+# Tiers (the redirector values of preselection_UL-AF30.py):
+#   scratch         /scratch/cms         node-local nvme
+#   shared-scratch  /shared-scratch/cms
+#   shared-home     /shared/home/cms
+# every file goes to <tier>/<LFN>. With --rnt the files staged are the RNTuple
+# copies written by convert_chain_rnt.py (/store/mcrnt/...).
+#
+# The copies run on a bounded pool of threads. Each one is written to a .part
+# file, checked against the adler32 of the source, and renamed. A file already
+# at its destination with the right checksum is skipped, so an
+# interrupted staging is resumed by running the same command again. The
+# reference checksums are kept in the chain index (chain_index.py), keyed by
+# the LFN: the checksum of a local source that is not there yet is computed on
+# the bytes read for the copy, by the thread copying it, and stored at the end,
+# so a first staging reads every source once.
+#
+# At the end the chain is written again with the prefix of the tier
+# (file://<tier>/store/...) and the redirector to use in the preselection is
+# printed.
+#
+# usage: python3 stage_chain.py [--jobs N] [--rnt] [--output chain_staged.txt] chain.txt scratch|shared-scratch|shared-home
+
+import argparse
+import os
+import subprocess
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import chain_index
+
+tiers = {
+    "scratch": "/scratch/cms",
+    "shared-scratch": "/shared-scratch/cms",
+    "shared-home": "/shared/home/cms",
+}
+
+def destination(path, tier):
+    return tiers[tier] + chain_index.lfn(path)
+
+def store_checksum(conn, path, value):
+    conn.execute("INSERT OR IGNORE INTO files (lfn) VALUES (?)", (chain_index.lfn(path),))
+    conn.execute("UPDATE files SET adler32 = ? WHERE lfn = ?", (value, chain_index.lfn(path)))
+
+def _copy(source, target):
+    """copy to target.part, returns it with the adler32 of the bytes read from a local source (None with xrdcp)"""
+    part = target + ".part"
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if chain_index.local_path(source) is None:
+        subprocess.run(["xrdcp", "--force", "--silent", source, part], check=True)
+        return part, None
+    value = 1
+    with open(chain_index.local_path(source), "rb") as f, open(part, "wb") as out:
+        for block in iter(lambda: f.read(1 << 24), b""):
+            value = zlib.adler32(block, value)
+            out.write(block)
+    return part, "{:08x}".format(value & 0xffffffff)
+
+def stage(source, target, checksum):
+    """(status, adler32 of the source): status is 'skipped', 'copied' or an error message
+
+    checksum: adler32 of the source from the index, None to compute it (local source)
+    """
+    if os.path.exists(target):
+        if checksum is None:
+            checksum = chain_index.adler32(chain_index.local_path(source))
+        if chain_index.adler32(target) == checksum:
+            return "skipped", checksum
+    try:
+        part, read = _copy(source, target)
+    except (OSError, subprocess.CalledProcessError) as e:
+        return "copy failed: {}".format(e), checksum
+    if checksum is None:
+        checksum = read
+    copied = chain_index.adler32(part)
+    if copied != checksum:
+        os.remove(part)
+        return "checksum mismatch: {} instead of {}".format(copied, checksum), None
+    os.replace(part, target)
+    return "copied", checksum
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Copy the files of a chain to a storage tier")
+    parser.add_argument("chain")
+    parser.add_argument("tier", choices=sorted(tiers))
+    parser.add_argument("--jobs", type=int, default=8, help="concurrent copies")
+    parser.add_argument("--rnt", action="store_true", help="stage the RNTuple copies in /store/mcrnt of the files")
+    parser.add_argument("--output", help="staged chain file, default <chain>_<tier>.txt")
+    args = parser.parse_args()
+
+    with open(args.chain) as f:
+        files = [line.strip() for line in f if line.strip()]
+    if args.rnt:
+        files = [path.replace("/store/mc/", "/store/mcrnt/", 1) for path in files]
+    targets = [destination(path, args.tier) for path in files]
+
+    # checksums of remote sources are not computed here, they have to be in the index (chain_index.py --checksum);
+    # the ones of the local sources not in the index are computed during the copies
+    conn = chain_index.open_index()
+    checksums = {}
+    for path in files:
+        checksum = chain_index.adler32_of(conn, chain_index.lfn(path))
+        if checksum is not None or (chain_index.local_path(path) is not None and os.path.exists(chain_index.local_path(path))):
+            checksums[path] = checksum
+    missing = [path for path in files if path not in checksums]
+    for path in missing:
+        print("no checksum for {}, not staged".format(path))
+
+    staged = [(path, target) for path, target in zip(files, targets) if path in checksums and os.path.abspath(chain_index.local_path(path) or "") != target]
+    results = {}
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        for n, ((path, target), (status, checksum)) in enumerate(zip(staged, pool.map(lambda item: stage(item[0], item[1], checksums[item[0]]), staged))):
+            results[path] = status
+            print("{}/{} {}: {}".format(n + 1, len(staged), status, target))
+            if checksums[path] is None and checksum is not None:
+                store_checksum(conn, path, checksum)
+    conn.commit()
+    conn.close()
+
+    failed = [path for path, status in results.items() if status not in ("copied", "skipped")] + missing
+    print("{} copied, {} already staged, {} failed".format(sum(s == "copied" for s in results.values()), sum(s == "skipped" for s in results.values()), len(failed)))
+
+    output = args.output or "{}_{}.txt".format(os.path.splitext(args.chain)[0], args.tier)
+    with open(output, "w") as f:
+        for path, target in zip(files, targets):
+            # failed files stay where they were
+            f.write(("file://" + target if path not in failed else path) + "\n")
+    print("staged chain: {}".format(output))
+    print('redirector = "file://{}/"  # in preselection_UL-AF30.py, for the chain with the file:///scratch/cms/ prefix'.format(tiers[args.tier]))
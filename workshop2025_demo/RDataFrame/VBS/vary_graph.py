@@ -0,0 +1,129 @@
+#!/opt/conda/bin/python3
+
+# Variations of the columns of an RDataFrame graph with Vary calls (the
+# postselection: energetic_variations and SF_variations).
+#
+# RDataFrame computes a Define once per event for all the variations when none
+# of its input columns is varied, and once more for every tag of the
+# variations that reach it otherwise; a Filter is also copied for the
+# variations of the Filters before it. VaryGraph wraps the nodes of the graph
+# and follows the variations of every column through the input columns found
+# in the expressions, so that
+#  - report() lists the Defines and Filters shared by all the variations and
+#    the ones computed per variation, with their evaluations per event: a
+#    Define that should not depend on a variation and does is visible there;
+#  - the same Filter or Define booked twice on the same node is booked once:
+#    the sample and final state Filters of book_histos, booked for every
+#    variable, are one chain per sample instead of one per variable, each with
+#    its copies for the variations.
+#
+# usage:
+#     graph = VaryGraph()
+#     df = graph.wrap(RDataFrame("Events", chain))
+#     ... Define / Redefine / Filter / Vary / Histo1D as usual ...
+#     graph.report()
+
+import re
+
+identifier = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+class VaryGraph:
+    def __init__(self):
+        # column -> names of the variations it depends on, the dataset columns are not varied
+        self.columns = {}
+        # variation name -> number of tags
+        self.tags = {}
+        # (kind, name, expression, variations) of every Define, Redefine and Filter, in booking order
+        self.nodes = []
+
+    def wrap(self, df):
+        return VaryNode(self, df, frozenset())
+
+    def inputs(self, args):
+        """the columns used by the string arguments of a call: expressions, column names and lists of them"""
+        names = set()
+        for arg in args:
+            for item in arg if isinstance(arg, (list, tuple)) else [arg]:
+                if isinstance(item, str):
+                    names.update(identifier.findall(item))
+        return names
+
+    def variations(self, columns):
+        result = set()
+        for column in columns:
+            result |= self.columns.get(column, set())
+        return frozenset(result)
+
+    def evaluations(self, variations):
+        """evaluations per event of a node reached by the variations (at most: RDataFrame is lazy)"""
+        return 1 + sum(self.tags[v] for v in variations)
+
+    def rows(self):
+        return [(kind, name, sorted(variations), self.evaluations(variations)) for kind, name, expression, variations in self.nodes]
+
+    def report(self):
+        rows = self.rows()
+        shared = [row for row in rows if not row[2]]
+        varied = [row for row in rows if row[2]]
+        print("{} Defines/Filters computed once per event for all the variations, {} per variation ({} evaluations per event instead of {})".format(
+            len(shared), len(varied), sum(row[3] for row in rows), len(rows)))
+        width = max([len(row[1]) for row in varied] + [4])
+        for kind, name, variations, evaluations in sorted(varied, key=lambda row: -row[3]):
+            print("  {:8} {:{}} {:3} {}".format(kind, name, width, evaluations, ", ".join(variations)))
+
+class VaryNode:
+    """an RDataFrame node of a VaryGraph: Define, Redefine, Filter and Vary are followed, the rest goes to the node"""
+
+    def __init__(self, graph, df, variations):
+        self._graph = graph
+        self._df = df
+        # variations of the Filters up to this node
+        self._variations = variations
+        self._children = {}
+
+    def __getattr__(self, name):
+        return getattr(self._df, name)
+
+    def _book(self, method, args, kwargs, variations, record):
+        key = (method, repr(args), repr(sorted(kwargs.items())))
+        if method in ("Define", "Filter") and key in self._children:
+            return self._children[key]
+        child = VaryNode(self._graph, getattr(self._df, method)(*args, **kwargs), variations)
+        record()
+        self._children[key] = child
+        return child
+
+    def _define(self, method, name, args, kwargs):
+        graph = self._graph
+        variations = graph.variations(graph.inputs(args[1:] + tuple(kwargs.values())))
+        def record():
+            graph.columns[name] = set(variations)
+            graph.nodes.append((method, name, args[1] if len(args) > 1 else None, variations))
+        return self._book(method, args, kwargs, self._variations, record)
+
+    def Define(self, *args, **kwargs):
+        return self._define("Define", args[0], args, kwargs)
+
+    def Redefine(self, *args, **kwargs):
+        # the old value of the column is one of the inputs when the expression uses it
+        return self._define("Redefine", args[0], args, kwargs)
+
+    def Filter(self, *args, **kwargs):
+        graph = self._graph
+        variations = self._variations | graph.variations(graph.inputs(args[:1] + args[2:] + tuple(v for k, v in kwargs.items() if k != "name")))
+        name = kwargs.get("name", args[1] if len(args) > 1 and isinstance(args[1], str) else "")
+        def record():
+            graph.nodes.append(("Filter", name or str(args[0]), args[0], variations))
+        return self._book("Filter", args, kwargs, variations, record)
+
+    def Vary(self, *args, **kwargs):
+        # Vary(colName(s), expression, variationTags or nVariations, variationName)
+        graph = self._graph
+        columns = args[0] if isinstance(args[0], (list, tuple)) else [args[0]]
+        tags = kwargs.get("variationTags", args[2] if len(args) > 2 else ["down", "up"])
+        variation = kwargs.get("variationName", args[3] if len(args) > 3 else columns[0])
+        def record():
+            graph.tags[variation] = tags if isinstance(tags, int) else len(tags)
+            for column in columns:
+                graph.columns.setdefault(column, set()).add(variation)
+        return self._book("Vary", args, kwargs, self._variations, record)